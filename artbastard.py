@@ -10,19 +10,58 @@ import time
 import json
 import signal
 import socket
+import struct
+import contextlib
 import subprocess
-import webbrowser
+import threading
 from datetime import datetime
-from pathlib import Path
-import venv
-import site
 
 # Configuration
 VENV_DIR = ".venv"  # Directory for virtual environment
+REQUIRED_PACKAGES = {"rich": "rich", "psutil": "psutil", "python-osc": "pythonosc", "numpy": "numpy"}  # pip name -> import name
+DEPS_STAMP_FILE = os.path.join(VENV_DIR, "artbastard-deps.json")  # Cached result of the dependency check
+
+def _deps_stamp_key() -> dict:
+    """Identify the interpreter, the requirements list and the installed version of each requirement."""
+    from importlib import metadata
+    versions = {}
+    for package in sorted(REQUIRED_PACKAGES):
+        try:
+            versions[package] = metadata.version(package)
+        except metadata.PackageNotFoundError:
+            versions[package] = None
+    return {
+        "executable": sys.executable,
+        "python": sys.version,
+        "requirements": REQUIRED_PACKAGES,
+        "versions": versions,
+    }
+
+def deps_stamp_valid() -> bool:
+    """True if a previous run verified these exact package versions for this interpreter."""
+    try:
+        with open(DEPS_STAMP_FILE, 'r') as f:
+            return json.load(f).get("key") == _deps_stamp_key()
+    except (OSError, ValueError):
+        return False
+
+def check_deps_and_stamp() -> bool:
+    """Check the dependencies without importing them and cache the result on success."""
+    import importlib.util
+    if any(importlib.util.find_spec(module) is None for module in REQUIRED_PACKAGES.values()):
+        return False
+    try:
+        os.makedirs(VENV_DIR, exist_ok=True)
+        with open(DEPS_STAMP_FILE, 'w') as f:
+            json.dump({"key": _deps_stamp_key()}, f, indent=2)
+    except OSError:
+        pass
+    return True
 
 # Function to ensure we're running in a virtual environment with all dependencies
 def ensure_venv_with_deps():
     """Create virtual environment if needed and install required dependencies"""
+    from pathlib import Path
     venv_dir = Path(VENV_DIR).absolute()
     venv_python = venv_dir / ("Scripts" if sys.platform == "win32" else "bin") / "python"
     
@@ -31,14 +70,13 @@ def ensure_venv_with_deps():
     
     if in_venv:
         # We're in a venv, just make sure dependencies are installed
-        try:
-            import psutil
-            import rich
-            import pythonosc
+        if check_deps_and_stamp():
             return  # All dependencies already available
-        except ImportError:
-            pass  # Will install missing dependencies
+        print("Installing required dependencies in virtual environment...")
+        subprocess.check_call([sys.executable, "-m", "pip", "install"] + list(REQUIRED_PACKAGES))
+        check_deps_and_stamp()
     else:
+        import venv
         # Not in venv, check if it exists
         if not venv_python.exists():
             print(f"Creating virtual environment in {venv_dir}...")
@@ -46,57 +84,2375 @@ def ensure_venv_with_deps():
             
         # Install dependencies in the venv
         print("Installing required dependencies in virtual environment...")
-        required_packages = ["rich", "psutil", "python-osc"]
-        subprocess.check_call([str(venv_python), "-m", "pip", "install"] + required_packages)
+        subprocess.check_call([str(venv_python), "-m", "pip", "install"] + list(REQUIRED_PACKAGES))
         
         # Re-execute script with the venv python
         print(f"Restarting script with virtual environment...")
-        os.execv(str(venv_python), [str(venv_python), __file__])
+        os.execv(str(venv_python), [str(venv_python), __file__] + sys.argv[1:])
+
+# Ensure virtual environment with dependencies
+if __name__ == "__main__":
+    # Only run the full check if the cached stamp doesn't match this interpreter
+    if not deps_stamp_valid() and not check_deps_and_stamp():
+        ensure_venv_with_deps()
+
+# Only what the menu needs is imported up front; psutil, pythonosc, asyncio and the
+# heavier rich modules (Live, Layout, Progress, Syntax) are imported on first use.
+from rich.console import Console
+from rich.panel import Panel
+from rich.table import Table
+from rich.text import Text
+from rich.prompt import Prompt, Confirm
+
+from artbastard_dmx import (DMX_SHM_NAME, DMX_SHM_MAGIC, DMX_SHM_VERSION, DMX_SHM_SLOTS, DMX_SHM_HEADER,
+                            DMX_SHM_SEQUENCE_OFFSET, DMX_SHM_SLOT, DMX_SHM_FREE, dmx_shm_size)
+
+# Configuration
+BACKEND_PORT = 3000
+FRONTEND_PORT = 3001
+FRONTEND_DIR = "react-app"
+LOG_DIR = "logs"
+ERROR_LOG = "errors.log"
+OSC_PORT = 8000  # Port for monitoring OSC messages
+DMX_REFRESH_RATE = 44  # Hz; DMX512's maximum full-universe frame rate, used when polling the backend's output
+CONFIG_DIR = "data"
+CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
+DEFAULT_CONFIG = {  # Written when config.json is missing; the backend merges artNetConfig over the same defaults
+    "artNetConfig": {
+        "ip": "192.168.1.199",
+        "subnet": 0,
+        "universe": 0,
+        "net": 0,
+        "port": 6454,
+        "base_refresh_interval": 1000
+    },
+    "midiMappings": {}
+}
+LIVE_CONFIG_EVENTS = {  # config.json section -> (Socket.IO event applying it live, acknowledgement event, ack status)
+    "artNetConfig": ("updateArtNetConfig", "artnetStatus", "configUpdated"),
+    "midiMappings": ("updateMidiMappings", "midiMappingUpdate", None),
+}
+CONFIG_RELOAD_DEBOUNCE = 0.25  # Seconds of quiet after the last edit before config.json is reloaded
+CONFIG_RELOAD_POLL_INTERVAL = 0.5  # Fallback mtime polling interval where inotify is unavailable
+STARTUP_BUDGET_MS = 150  # Import budget before the menu draws, checked by --profile-startup
+STARTUP_LAZY_IMPORTS = [  # (subsystem, module) imported on first use rather than at startup
+    ("System metrics / process control", "psutil"),
+    ("OSC monitor", "pythonosc.osc_server"),
+    ("Dashboard", "rich.live"),
+    ("Dashboard layout", "rich.layout"),
+    ("Progress spinners", "rich.progress"),
+    ("Syntax viewer", "rich.syntax"),
+    ("Art-Net discovery", "asyncio"),
+    ("Patch compiler", "numpy"),
+    ("Metrics exporter (background thread)", "http.server"),
+]
+ARTNET_PORT = 6454  # Art-Net UDP port for polls, replies and DMX
+ARTNET_POLL_INTERVAL = 3.0  # Seconds between ArtPoll broadcasts
+ARTNET_SOURCE_TIMEOUT = 10.0  # Seconds without ArtDmx before a sender drops out of a merge (Art-Net 4 merge timeout)
+ARTNET_NODES_FILE = os.path.join(CONFIG_DIR, "artnet-nodes.json")  # Discovered node table shared with the backend
+RECORDINGS_DIR = "recordings"  # DMX captures written by the recorder
+BACKEND_LOG_DIR = os.path.join(LOG_DIR, "backend")  # Rotated backend output segments and their index
+BACKEND_LOG_SEGMENT_BYTES = 8 * 1024 * 1024  # Rotate a segment once it reaches this size
+BACKEND_LOG_SEGMENT_SECONDS = 3600  # ...or once it is this old
+BACKEND_LOG_INDEX_INTERVAL = 5.0  # Seconds between timestamp -> offset checkpoints
+BACKEND_LOG_RETENTION_BYTES = 256 * 1024 * 1024  # Compressed segments kept on disk
+BACKEND_LOG_RETENTION_DAYS = 14  # Segments older than this are pruned
+BACKEND_LOG_TAIL_LINES = 200  # Recent lines kept in memory for tails
+LAUNCH_TRACE_DIR = os.path.join(LOG_DIR, "traces")  # Chrome trace JSON per launch
+LAUNCH_HISTORY_FILE = os.path.join(LAUNCH_TRACE_DIR, "history.jsonl")  # One summary line per launch
+LAUNCH_HISTORY_LIMIT = 100  # Launch summaries kept in the rolling history
+LAUNCH_REGRESSION_WINDOW = 10  # Recent launches whose median time-to-ready is the baseline
+LAUNCH_REGRESSION_FACTOR = 1.25  # Warn when time-to-ready exceeds the baseline by this factor
+CONFIG_RELOAD_LOG = os.path.join(LOG_DIR, "config-reload.jsonl")  # One line per applied config change
+METRICS_HOST = "127.0.0.1"  # /metrics is local-only; put a proxy in front to scrape remotely
+METRICS_PORT = 9464  # OpenMetrics exporter port
+METRICS_INTERVAL = 1.0  # Seconds between snapshot re-renders
+PATCH_UNIVERSES = 4  # Universes covered by the compiled fixture patch
+PATCH_POLL_INTERVAL = 1.0  # Seconds between checks of the backend's fixture patch
+
+# Initialize console
+console = Console()
+
+# State tracking
+running_processes = {}
+osc_monitor = None
+osc_messages = []
+last_logs = []
+
+# Art-Net protocol constants
+ARTNET_ID = b"Art-Net\x00"
+ARTNET_PROTOCOL_VERSION = 14
+OP_POLL = 0x2000
+OP_POLL_REPLY = 0x2100
+OP_DMX = 0x5000
+ARTNET_PORT_PROTOCOLS = {0: "DMX512", 1: "MIDI", 2: "Avab", 3: "CMX", 4: "ADB", 5: "Art-Net", 6: "DALI"}
+
+def build_artpoll(flags: int = 0x02) -> bytes:
+    """Build an ArtPoll packet (flags 0x02 asks nodes to reply on change)."""
+    return ARTNET_ID + struct.pack("<H", OP_POLL) + struct.pack(">H", ARTNET_PROTOCOL_VERSION) + bytes([flags, 0])
+
+def build_artdmx(universe: int, data: bytes, sequence: int = 0) -> bytes:
+    """Build an ArtDmx packet for a 15-bit port-address."""
+    length = len(data) + (len(data) & 1)
+    return (ARTNET_ID + struct.pack("<H", OP_DMX) + struct.pack(">H", ARTNET_PROTOCOL_VERSION)
+            + bytes([sequence & 0xFF, 0, universe & 0xFF, (universe >> 8) & 0x7F])
+            + struct.pack(">H", length) + bytes(data).ljust(length, b"\x00"))
+
+def parse_artdmx(data: bytes):
+    """Parse an ArtDmx packet into (universe, sequence, dmx data), or None if it isn't one."""
+    if len(data) < 20 or data[:8] != ARTNET_ID:
+        return None
+    if struct.unpack_from("<H", data, 8)[0] != OP_DMX:
+        return None
+    universe = data[14] | ((data[15] & 0x7F) << 8)
+    length = min(struct.unpack_from(">H", data, 16)[0], 512, len(data) - 18)
+    return universe, data[12], data[18:18 + length]
+
+def _artnet_string(raw: bytes) -> str:
+    """Decode a NUL-padded Art-Net string field."""
+    return raw.split(b"\x00", 1)[0].decode("ascii", errors="replace").strip()
+
+def parse_artpoll_reply(data: bytes):
+    """Parse an ArtPollReply packet into a node dict, or None if it isn't one."""
+    if len(data) < 207 or data[:8] != ARTNET_ID:
+        return None
+    if struct.unpack_from("<H", data, 8)[0] != OP_POLL_REPLY:
+        return None
+    net_switch = data[18] & 0x7F
+    sub_switch = data[19] & 0x0F
+    num_ports = min(struct.unpack_from(">H", data, 172)[0], 4)
+    ports = []
+    for i in range(num_ports):
+        port_type = data[174 + i]
+        port = {
+            "index": i,
+            "protocol": ARTNET_PORT_PROTOCOLS.get(port_type & 0x3F, f"0x{port_type & 0x3F:02x}"),
+            "output": bool(port_type & 0x80),
+            "input": bool(port_type & 0x40),
+        }
+        if port["output"]:
+            port["universe"] = (net_switch << 8) | (sub_switch << 4) | (data[190 + i] & 0x0F)
+        if port["input"]:
+            port["inputUniverse"] = (net_switch << 8) | (sub_switch << 4) | (data[186 + i] & 0x0F)
+        ports.append(port)
+    return {
+        "ip": socket.inet_ntoa(data[10:14]),
+        "bindIndex": data[211] if len(data) > 211 else 0,
+        "shortName": _artnet_string(data[26:44]),
+        "longName": _artnet_string(data[44:108]),
+        "nodeReport": _artnet_string(data[108:172]),
+        "firmware": f"{data[16]}.{data[17]}",
+        "oem": struct.unpack_from(">H", data, 20)[0],
+        "esta": struct.unpack_from("<H", data, 24)[0],
+        "mac": ":".join(f"{b:02x}" for b in data[201:207]),
+        "ports": ports,
+        "universes": sorted({p["universe"] for p in ports if "universe" in p}),
+    }
+
+class LatencyHistogram:
+    """Fixed-bucket round-trip-time histogram in milliseconds."""
+
+    BUCKETS_MS = (0.5, 1, 2, 5, 10, 20, 50, 100, 250, 500, 1000)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+        self.last_ms = None
+
+    def observe(self, rtt_ms: float):
+        """Record one round-trip time."""
+        for i, bound in enumerate(self.BUCKETS_MS):
+            if rtt_ms <= bound:
+                self.counts[i] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.total += 1
+        self.sum_ms += rtt_ms
+        self.max_ms = max(self.max_ms, rtt_ms)
+        self.last_ms = rtt_ms
+
+    def percentile(self, pct: float):
+        """Return the upper bucket bound holding the given percentile (the max for the overflow bucket)."""
+        if not self.total:
+            return None
+        threshold = self.total * pct / 100.0
+        seen = 0
+        for i, count in enumerate(self.counts):
+            seen += count
+            if seen >= threshold:
+                return self.BUCKETS_MS[i] if i < len(self.BUCKETS_MS) else round(self.max_ms, 3)
+        return round(self.max_ms, 3)
+
+    def to_dict(self) -> dict:
+        return {
+            "count": self.total,
+            "meanMs": round(self.sum_ms / self.total, 3) if self.total else None,
+            "lastMs": round(self.last_ms, 3) if self.last_ms is not None else None,
+            "p50Ms": self.percentile(50),
+            "p95Ms": self.percentile(95),
+            "buckets": dict(zip([str(b) for b in self.BUCKETS_MS] + ["+Inf"], self.counts)),
+        }
+
+class _ArtNetProtocol:
+    """asyncio datagram protocol that hands received datagrams to ArtNetDiscovery.
+
+    Duck-typed rather than subclassing asyncio.DatagramProtocol so asyncio is only
+    imported when discovery starts.
+    """
+
+    def __init__(self, owner):
+        self.owner = owner
+
+    def connection_made(self, transport):
+        pass
+
+    def datagram_received(self, data, addr):
+        self.owner._handle_datagram(data, addr)
+
+    def error_received(self, exc):
+        pass
+
+    def connection_lost(self, exc):
+        pass
+
+class ArtNetDiscovery:
+    """Asynchronous ArtPoll scanner that keeps a table of Art-Net nodes.
+
+    Polls go out from a private ephemeral socket, so replies addressed to the poll's
+    source port reach the scanner even while the backend holds the Art-Net port. A
+    second socket shares the Art-Net port itself (SO_REUSEADDR), where spec-compliant
+    nodes send their replies, and sniffs ArtDmx frames for listeners registered with
+    add_dmx_listener(callback(universe, data, t_ns)), or, keeping each sender apart,
+    add_source_listener(callback(sender_ip, universe, data, t_ns, priority)).
+
+    Broadcasts on a shared port reach every socket, but Linux delivers each unicast
+    datagram to the socket bound last. rebind() makes the scanner that socket once the
+    backend's dmxnet has bound the port; the backend then only sees broadcast Art-Net
+    until discovery stops. Where the port cannot be shared at all, port_bound is False
+    and only nodes replying to the poll's source port are found.
+    """
+
+    def __init__(self, targets=None, port: int = ARTNET_PORT, interval: float = ARTNET_POLL_INTERVAL,
+                 node_ttl: float = None, table_file: str = ARTNET_NODES_FILE):
+        self.targets = list(targets) if targets else ["255.255.255.255"]
+        self.port = port
+        self.interval = interval
+        self.node_ttl = node_ttl if node_ttl is not None else interval * 3 + 1
+        self.table_file = table_file
+        self.nodes = {}
+        self.latency = {}
+        self.polls_sent = 0
+        self.replies_received = 0
+        self.port_bound = False
+        self.reply_port = None
+        self.ignore_ports = set()  # Source ports whose ArtDmx is our own output (see ArtNetSender.local_port)
+        self._lock = threading.Lock()
+        self._poll_packet = build_artpoll()
+        self._cycle_sent_ns = None
+        self._answered = set()
+        self._dmx_listeners = []
+        self._source_listeners = []
+        self._loop = None
+        self._transport = None
+        self._listen_transport = None
+        self._thread = None
+        self._stopped = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _open_poll_socket(self) -> socket.socket:
+        """Open the broadcast socket polls are sent from, on a port nothing else shares."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        sock.bind(("0.0.0.0", 0))
+        sock.setblocking(False)
+        self.reply_port = sock.getsockname()[1]
+        return sock
+
+    def _open_listen_socket(self):
+        """Open a socket sharing the Art-Net port with the backend, or None if it is taken."""
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        # On Linux SO_REUSEPORT would spread unicast across the sockets by sender hash;
+        # SO_REUSEADDR alone gives it all to the newest one. BSDs need it to share at all.
+        if hasattr(socket, "SO_REUSEPORT") and not sys.platform.startswith("linux"):
+            try:
+                sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+            except OSError:
+                pass
+        try:
+            sock.bind(("0.0.0.0", self.port))
+        except OSError:
+            sock.close()
+            return None
+        sock.setblocking(False)
+        return sock
+
+    def start(self):
+        """Start polling in a background thread running its own event loop."""
+        import asyncio
+        if self.running:
+            return
+        ready = threading.Event()
+        self._thread = threading.Thread(target=lambda: asyncio.run(self._run(ready)), daemon=True)
+        self._thread.start()
+        ready.wait(timeout=2)
+
+    def stop(self):
+        """Stop polling and close the socket."""
+        if self._loop and self._stopped:
+            self._loop.call_soon_threadsafe(self._stopped.set)
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    def poll_now(self):
+        """Send an ArtPoll immediately instead of waiting for the next interval."""
+        if self._loop:
+            self._loop.call_soon_threadsafe(self._send_poll)
+
+    async def _run(self, ready: threading.Event):
+        import asyncio
+        self._loop = asyncio.get_running_loop()
+        self._stopped = asyncio.Event()
+        try:
+            self._transport, _ = await self._loop.create_datagram_endpoint(
+                lambda: _ArtNetProtocol(self), sock=self._open_poll_socket())
+            await self._bind_listen()
+        finally:
+            ready.set()
+        try:
+            while not self._stopped.is_set():
+                self._send_poll()
+                try:
+                    await asyncio.wait_for(self._stopped.wait(), timeout=self.interval)
+                except asyncio.TimeoutError:
+                    pass
+                self._expire_nodes()
+                self._write_table()
+        finally:
+            self._transport.close()
+            if self._listen_transport:
+                self._listen_transport.close()
+                self._listen_transport = None
+            self.port_bound = False
+            self._loop = None
+
+    async def _bind_listen(self):
+        if self._listen_transport:
+            self._listen_transport.close()
+            self._listen_transport = None
+        listen_sock = self._open_listen_socket()
+        self.port_bound = listen_sock is not None
+        if listen_sock is not None:
+            self._listen_transport, _ = await self._loop.create_datagram_endpoint(
+                lambda: _ArtNetProtocol(self), sock=listen_sock)
+
+    def rebind(self):
+        """Re-open the shared Art-Net port socket so unicast replies to that port come here; returns port_bound."""
+        import asyncio
+        loop = self._loop
+        if loop is None:
+            return False
+        try:
+            asyncio.run_coroutine_threadsafe(self._bind_listen(), loop).result(timeout=2)
+        except Exception:
+            pass
+        return self.port_bound
+
+    def _send_poll(self):
+        self._cycle_sent_ns = time.monotonic_ns()
+        self._answered.clear()
+        for target in self.targets:
+            try:
+                self._transport.sendto(self._poll_packet, (target, self.port))
+                self.polls_sent += 1
+            except OSError:
+                pass
+
+    def add_dmx_listener(self, callback):
+        """Register callback(universe, data, t_ns) for every ArtDmx frame received."""
+        self._dmx_listeners.append(callback)
+
+    def remove_dmx_listener(self, callback):
+        """Unregister a callback added with add_dmx_listener."""
+        if callback in self._dmx_listeners:
+            self._dmx_listeners.remove(callback)
+
+    def add_source_listener(self, callback):
+        """Register callback(sender_ip, universe, data, t_ns, priority) per ArtDmx frame; Art-Net has no priority, so it is None."""
+        self._source_listeners.append(callback)
+
+    def remove_source_listener(self, callback):
+        """Unregister a callback added with add_source_listener."""
+        if callback in self._source_listeners:
+            self._source_listeners.remove(callback)
+
+    def _handle_datagram(self, data: bytes, addr):
+        received_ns = time.monotonic_ns()
+        if self._dmx_listeners or self._source_listeners:
+            frame = parse_artdmx(data)
+            if frame is not None:
+                if addr[1] in self.ignore_ports:
+                    return
+                universe, _, dmx = frame
+                for callback in list(self._dmx_listeners):
+                    try:
+                        callback(universe, dmx, received_ns)
+                    except Exception:
+                        pass
+                for callback in list(self._source_listeners):
+                    try:
+                        callback(addr[0], universe, dmx, received_ns, None)
+                    except Exception:
+                        pass
+                return
+        node = parse_artpoll_reply(data)
+        if node is None:
+            return
+        self.replies_received += 1
+        ip = node["ip"] if node["ip"] != "0.0.0.0" else addr[0]
+        node["ip"] = ip
+        node["lastSeen"] = time.time()
+        with self._lock:
+            histogram = self.latency.setdefault(ip, LatencyHistogram())
+            # Multi-port nodes send one reply per bind index; only the first
+            # reply of each poll cycle measures the round trip.
+            if self._cycle_sent_ns is not None and ip not in self._answered:
+                self._answered.add(ip)
+                histogram.observe((received_ns - self._cycle_sent_ns) / 1e6)
+            key = (ip, node["bindIndex"])
+            previous = self.nodes.get(key)
+            node["firstSeen"] = previous["firstSeen"] if previous else node["lastSeen"]
+            self.nodes[key] = node
+
+    def _expire_nodes(self):
+        cutoff = time.time() - self.node_ttl
+        with self._lock:
+            for key in [k for k, n in self.nodes.items() if n["lastSeen"] < cutoff]:
+                del self.nodes[key]
+            live_ips = {ip for ip, _ in self.nodes}
+            for ip in [ip for ip in self.latency if ip not in live_ips]:
+                del self.latency[ip]
+
+    def snapshot(self) -> list:
+        """Return the node table with latency statistics attached."""
+        with self._lock:
+            nodes = []
+            for key in sorted(self.nodes):
+                node = dict(self.nodes[key])
+                histogram = self.latency.get(node["ip"])
+                node["rtt"] = histogram.to_dict() if histogram else None
+                nodes.append(node)
+        return nodes
+
+    def find(self, ip: str) -> list:
+        """Return all table entries for the given IP address."""
+        return [node for node in self.snapshot() if node["ip"] == ip]
+
+    def _write_table(self):
+        """Publish the node table for the backend, replacing the file atomically."""
+        if not self.table_file:
+            return
+        table = {
+            "updatedAt": int(time.time() * 1000),
+            "pollInterval": self.interval,
+            "artnetPortBound": self.port_bound,
+            "replyPort": self.reply_port,
+            "nodes": self.snapshot(),
+        }
+        try:
+            tmp_file = f"{self.table_file}.tmp"
+            with open(tmp_file, 'w') as f:
+                json.dump(table, f, indent=2)
+            os.replace(tmp_file, self.table_file)
+        except OSError:
+            pass
+
+class ArtNetSender:
+    """Send ArtDmx frames, reusing one prebuilt packet per universe.
+
+    ip may be a list, in which case every frame is unicast to each node in turn.
+    """
+
+    def __init__(self, ip, port: int = ARTNET_PORT):
+        self.addresses = [(target, port) for target in ([ip] if isinstance(ip, str) else ip)]
+        self.packets_sent = 0
+        self._packets = {}
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+        self._sock.bind(("0.0.0.0", 0))
+        self.local_port = self._sock.getsockname()[1]  # Lets a local sniffer ignore our own output
+
+    def send(self, universe: int, data: bytes):
+        """Send one frame; the packet buffer is only rebuilt when the frame length changes."""
+        packet = self._packets.get(universe)
+        if packet is None or len(packet) != 18 + len(data) + (len(data) & 1):
+            packet = self._packets[universe] = bytearray(build_artdmx(universe, data))
+        else:
+            packet[18:18 + len(data)] = data
+        packet[12] = packet[12] % 255 + 1  # Sequence 1-255; 0 disables reordering checks
+        for address in self.addresses:
+            self._sock.sendto(packet, address)
+        self.packets_sent += len(self.addresses)
+
+    def close(self):
+        self._sock.close()
+
+# sACN (ANSI E1.31): one multicast group per universe, so a frame is sent once however
+# many receivers listen. Data packets are root/framing/DMP layers in front of the slots.
+SACN_PORT = 5568
+SACN_ACN_ID = b"ASC-E1.17\x00\x00\x00"
+SACN_VECTOR_ROOT_DATA = 0x00000004
+SACN_VECTOR_ROOT_EXTENDED = 0x00000008
+SACN_VECTOR_FRAMING_DATA = 0x00000002
+SACN_VECTOR_FRAMING_SYNC = 0x00000001
+SACN_DATA_HEADER = 126  # Bytes before the first DMX slot (start code at 125)
+SACN_SYNC_LENGTH = 49
+SACN_OPTION_PREVIEW = 0x80
+SACN_OPTION_TERMINATED = 0x40
+SACN_DEFAULT_PRIORITY = 100
+SACN_SOURCE_TIMEOUT = 2.5  # Seconds without packets before a source is dropped (E1.31 network data loss)
+
+def sacn_multicast_group(universe: int) -> str:
+    """Multicast address for a universe (1-63999): 239.255.<high>.<low>."""
+    return f"239.255.{universe >> 8}.{universe & 0xFF}"
+
+def sacn_cid(component: str = "") -> bytes:
+    """Stable component identifier for this host (and component), so receivers see the same source across restarts."""
+    import uuid
+    suffix = f".{component}" if component else ""
+    return uuid.uuid5(uuid.NAMESPACE_DNS, f"artbastard.{socket.gethostname()}{suffix}").bytes
+
+def build_sacn_data(universe: int, data: bytes, cid: bytes, source_name: str = "ArtBastard",
+                    priority: int = SACN_DEFAULT_PRIORITY, sync_universe: int = 0, sequence: int = 0,
+                    options: int = 0) -> bytes:
+    """Build an E1.31 data packet carrying DMX slots with start code 0."""
+    length = SACN_DATA_HEADER + len(data)
+    return (struct.pack(">HH12sHI16s", 0x0010, 0x0000, SACN_ACN_ID, 0x7000 | (length - 16), SACN_VECTOR_ROOT_DATA, cid)
+            + struct.pack(">HI64sBHBBH", 0x7000 | (length - 38), SACN_VECTOR_FRAMING_DATA,
+                          source_name.encode("utf-8")[:63], priority, sync_universe, sequence, options, universe)
+            + struct.pack(">HBBHHHB", 0x7000 | (length - 115), 0x02, 0xA1, 0x0000, 0x0001, len(data) + 1, 0x00)
+            + bytes(data))
+
+def build_sacn_sync(sync_universe: int, cid: bytes, sequence: int = 0) -> bytes:
+    """Build an E1.31 synchronization packet telling receivers to output their held frames."""
+    return (struct.pack(">HH12sHI16s", 0x0010, 0x0000, SACN_ACN_ID, 0x7000 | (SACN_SYNC_LENGTH - 16),
+                        SACN_VECTOR_ROOT_EXTENDED, cid)
+            + struct.pack(">HIBHH", 0x7000 | (SACN_SYNC_LENGTH - 38), SACN_VECTOR_FRAMING_SYNC, sequence, sync_universe, 0))
+
+def parse_sacn(data: bytes):
+    """Parse an E1.31 data or sync packet into a dict, or None for anything else."""
+    if len(data) < SACN_SYNC_LENGTH or data[4:16] != SACN_ACN_ID:
+        return None
+    root_vector = struct.unpack_from(">I", data, 18)[0]
+    cid = bytes(data[22:38])
+    if root_vector == SACN_VECTOR_ROOT_EXTENDED:
+        if struct.unpack_from(">I", data, 40)[0] != SACN_VECTOR_FRAMING_SYNC:
+            return None
+        return {"type": "sync", "cid": cid, "sequence": data[44], "universe": struct.unpack_from(">H", data, 45)[0]}
+    if root_vector != SACN_VECTOR_ROOT_DATA or len(data) < SACN_DATA_HEADER or data[117] != 0x02:
+        return None
+    count = struct.unpack_from(">H", data, 123)[0]
+    if data[125] != 0x00 or count < 1:
+        return None  # Only the null start code carries dimmer levels
+    return {
+        "type": "data",
+        "cid": cid,
+        "sourceName": bytes(data[44:108]).split(b"\x00", 1)[0].decode("utf-8", errors="replace"),
+        "priority": data[108],
+        "syncUniverse": struct.unpack_from(">H", data, 109)[0],
+        "sequence": data[111],
+        "options": data[112],
+        "universe": struct.unpack_from(">H", data, 113)[0],
+        "data": bytes(data[SACN_DATA_HEADER:SACN_DATA_HEADER + count - 1]),
+    }
+
+class SacnSender:
+    """Send E1.31 multicast frames with the same send(universe, data) interface as ArtNetSender.
+
+    Each universe keeps one prebuilt packet; a frame only copies its slots and bumps the
+    sequence byte. Universes passed to send() are Art-Net port-addresses shifted by
+    universe_offset, since sACN has no universe 0. With sync_universe set, receivers hold
+    frames until sync() sends the prebuilt synchronization packet.
+    """
+
+    def __init__(self, priority: int = SACN_DEFAULT_PRIORITY, sync_universe: int = 0, universe_offset: int = 1,
+                 source_name: str = "ArtBastard", interface: str = None, ttl: int = 8, port: int = SACN_PORT,
+                 cid: bytes = None):
+        self.priority = priority
+        self.sync_universe = sync_universe
+        self.universe_offset = universe_offset
+        self.source_name = source_name
+        self.port = port
+        self.cid = cid or sacn_cid()
+        self.packets_sent = 0
+        self._packets = {}  # universe -> (packet, address)
+        self._sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self._sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_TTL, ttl)
+        self._sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_LOOP, 1)
+        if interface:
+            self._sock.setsockopt(socket.IPPROTO_IP, socket.IP_MULTICAST_IF, socket.inet_aton(interface))
+        self._sync_packet = bytearray(build_sacn_sync(sync_universe, self.cid)) if sync_universe else None
+        self._sync_address = (sacn_multicast_group(sync_universe), port) if sync_universe else None
+
+    def send(self, universe: int, data: bytes):
+        """Send one frame; the packet buffer is only rebuilt when the frame length changes."""
+        entry = self._packets.get(universe)
+        if entry is None or len(entry[0]) != SACN_DATA_HEADER + len(data):
+            sacn_universe = universe + self.universe_offset
+            entry = self._packets[universe] = (
+                bytearray(build_sacn_data(sacn_universe, data, self.cid, self.source_name, self.priority, self.sync_universe)),
+                (sacn_multicast_group(sacn_universe), self.port),
+            )
+        packet, address = entry
+        packet[SACN_DATA_HEADER:] = data
+        packet[111] = (packet[111] + 1) & 0xFF
+        self._sock.sendto(packet, address)
+        self.packets_sent += 1
+
+    def set_priority(self, universe: int, priority: int):
+        """Change one universe's priority (0-200) in its prebuilt packet."""
+        entry = self._packets.get(universe)
+        if entry is not None:
+            entry[0][108] = priority
+
+    def sync(self):
+        """Release frames held by receivers for the sync universe; a no-op without one."""
+        if self._sync_packet is None:
+            return
+        self._sync_packet[44] = (self._sync_packet[44] + 1) & 0xFF
+        self._sock.sendto(self._sync_packet, self._sync_address)
+        self.packets_sent += 1
+
+    def close(self):
+        """Tell receivers the streams ended (three terminated packets per universe, per E1.31), then close."""
+        try:
+            for packet, address in self._packets.values():
+                packet[112] |= SACN_OPTION_TERMINATED
+                for _ in range(3):
+                    packet[111] = (packet[111] + 1) & 0xFF
+                    self._sock.sendto(packet, address)
+        except OSError:
+            pass
+        self._sock.close()
+
+class SacnReceiver:
+    """Join sACN multicast groups and hand merged frames to listeners.
+
+    Listeners use the ArtNetDiscovery signature, callback(universe, data, t_ns), with
+    universes shifted back by universe_offset. Per universe the highest-priority live
+    source wins; out-of-order sequences are dropped and frames carrying a sync address
+    are held until the matching sync packet arrives. Source listeners,
+    callback(cid_hex, universe, data, t_ns, priority), instead see every in-order frame
+    of every source as it arrives, and data=None when a source terminates.
+    """
+
+    def __init__(self, universes, universe_offset: int = 1, interface: str = "0.0.0.0", port: int = SACN_PORT):
+        self.universes = sorted(set(universes))
+        self.universe_offset = universe_offset
+        self.interface = interface
+        self.port = port
+        self.packets_received = 0
+        self.packets_dropped = 0
+        self._sources = {}  # (universe, cid) -> source info
+        self._held = {}  # sync universe -> {universe: (data, t_ns)}
+        self._last_sync = {}  # sync universe -> monotonic ns of the last sync packet
+        self._joined = set()
+        self._dmx_listeners = []
+        self._source_listeners = []
+        self.ignore_cids = set()  # CIDs of our own senders, so merged output isn't merged back in
+        self._sock = None
+        self._thread = None
+        self._stop = threading.Event()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        if hasattr(socket, "SO_REUSEPORT"):
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEPORT, 1)
+        sock.bind(("", self.port))
+        sock.settimeout(0.5)
+        self._sock = sock
+        self._joined = set()
+        for universe in self.universes:
+            self._join(universe)
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+        if self._sock:
+            self._sock.close()
+            self._sock = None
+
+    def _join(self, universe: int):
+        membership = struct.pack("4s4s", socket.inet_aton(sacn_multicast_group(universe)), socket.inet_aton(self.interface))
+        self._sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+        self._joined.add(universe)
+
+    def add_dmx_listener(self, callback):
+        """Register callback(universe, data, t_ns) for every frame that wins the merge."""
+        self._dmx_listeners.append(callback)
+
+    def remove_dmx_listener(self, callback):
+        """Unregister a callback added with add_dmx_listener."""
+        if callback in self._dmx_listeners:
+            self._dmx_listeners.remove(callback)
+
+    def add_source_listener(self, callback):
+        """Register callback(cid_hex, universe, data, t_ns, priority) for every source's frames, before the priority merge."""
+        self._source_listeners.append(callback)
+
+    def remove_source_listener(self, callback):
+        """Unregister a callback added with add_source_listener."""
+        if callback in self._source_listeners:
+            self._source_listeners.remove(callback)
+
+    def _run(self):
+        buffer = bytearray(SACN_DATA_HEADER + 512)
+        view = memoryview(buffer)
+        while not self._stop.is_set():
+            try:
+                size = self._sock.recv_into(buffer)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            self._handle_packet(view[:size], time.monotonic_ns())
+
+    def _handle_packet(self, data, received_ns: int):
+        packet = parse_sacn(data)
+        if packet is None or packet["cid"] in self.ignore_cids:
+            return
+        self.packets_received += 1
+        if packet["type"] == "sync":
+            self._last_sync[packet["universe"]] = received_ns
+            for universe, (frame, t_ns) in self._held.pop(packet["universe"], {}).items():
+                self._dispatch(universe, frame, t_ns)
+            return
+        universe = packet["universe"]
+        if universe not in self.universes or packet["options"] & SACN_OPTION_PREVIEW:
+            return
+        key = (universe, packet["cid"])
+        source = self._sources.get(key)
+        if packet["options"] & SACN_OPTION_TERMINATED:
+            if self._sources.pop(key, None) is not None:
+                self._dispatch_source(packet, None, received_ns)
+            return
+        if source is not None:
+            # E1.31 6.7.2: drop repeats and packets fewer than 20 behind the last sequence number
+            delta = (packet["sequence"] - source["sequence"]) & 0xFF
+            if delta == 0 or delta > 0x100 - 20:
+                self.packets_dropped += 1
+                return
+        else:
+            source = self._sources[key] = {"universe": universe, "cid": packet["cid"].hex(), "packets": 0}
+        source.update(sourceName=packet["sourceName"], priority=packet["priority"], sequence=packet["sequence"],
+                      lastSeenNs=received_ns)
+        source["packets"] += 1
+        self._dispatch_source(packet, packet["data"], received_ns)
+        cutoff = received_ns - int(SACN_SOURCE_TIMEOUT * 1e9)
+        if any(other["priority"] > packet["priority"] and other["lastSeenNs"] >= cutoff
+               for (u, _), other in self._sources.items() if u == universe):
+            return
+        sync_universe = packet["syncUniverse"]
+        if sync_universe and sync_universe not in self._joined:
+            self._join(sync_universe)  # Sync packets travel on the sync universe's own group
+        if sync_universe and self._last_sync.get(sync_universe, 0) >= cutoff:
+            self._held.setdefault(sync_universe, {})[universe] = (packet["data"], received_ns)
+        else:
+            self._dispatch(universe, packet["data"], received_ns)
+
+    def _dispatch_source(self, packet: dict, frame, t_ns: int):
+        for callback in list(self._source_listeners):
+            try:
+                callback(packet["cid"].hex(), packet["universe"] - self.universe_offset, frame, t_ns, packet["priority"])
+            except Exception:
+                pass
+
+    def _dispatch(self, universe: int, frame: bytes, t_ns: int):
+        for callback in list(self._dmx_listeners):
+            try:
+                callback(universe - self.universe_offset, frame, t_ns)
+            except Exception:
+                pass
+
+    def sources(self) -> list:
+        """Live sources per universe, for monitoring."""
+        cutoff = time.monotonic_ns() - int(SACN_SOURCE_TIMEOUT * 1e9)
+        return sorted((dict(source, lastSeenMs=round((time.monotonic_ns() - source["lastSeenNs"]) / 1e6))
+                       for source in list(self._sources.values()) if source["lastSeenNs"] >= cutoff),
+                      key=lambda source: (source["universe"], -source["priority"]))
+
+# DMX recording file layout: a header, then records of (t_ns, universe, kind, length)
+# followed by the payload, then a keyframe index and trailer written on close.
+RECORDING_MAGIC = b"ABDMXREC"
+RECORDING_INDEX_MAGIC = b"ABDMXIDX"
+RECORDING_VERSION = 1
+RECORDING_HEADER = struct.Struct("<8sHHqQ")  # magic, version, flags, start wall-clock ns, keyframe interval ns
+RECORDING_RECORD = struct.Struct("<QHBH")  # t_ns since start, universe, kind, payload length
+RECORDING_INDEX_ENTRY = struct.Struct("<QQ")  # t_ns, file offset of the snapshot block
+RECORDING_TRAILER = struct.Struct("<QI8s")  # index offset, entry count, magic
+RECORD_KEY = 0  # Full frame
+RECORD_DELTA = 1  # Runs of changed channels against the previous frame
+RECORD_SNAPSHOT = 2  # Universe state written at an index point; restores state, never re-emitted
+DELTA_RUN = struct.Struct("<HH")  # first channel, run length
+DELTA_MERGE_GAP = DELTA_RUN.size  # Unchanged gaps this short are cheaper to store than a new run header
+
+def encode_dmx_delta(previous: bytes, current: bytes) -> bytes:
+    """Encode the channels that differ between two equal-length frames as runs."""
+    if previous == current:
+        return b""
+    runs = []
+    start = end = None
+    for i, (a, b) in enumerate(zip(previous, current)):
+        if a != b:
+            if start is None:
+                start = i
+            elif i - end > DELTA_MERGE_GAP:
+                runs.append((start, end))
+                start = i
+            end = i + 1
+    runs.append((start, end))
+    return b"".join(DELTA_RUN.pack(first, last - first) + current[first:last] for first, last in runs)
+
+def apply_dmx_delta(frame: bytearray, payload) -> None:
+    """Apply delta runs produced by encode_dmx_delta to a frame in place."""
+    pos = 0
+    while pos < len(payload):
+        first, count = DELTA_RUN.unpack_from(payload, pos)
+        pos += DELTA_RUN.size
+        frame[first:first + count] = payload[pos:pos + count]
+        pos += count
+
+class DmxRecorder:
+    """Record ArtDmx frames as keyframes plus changed-channel deltas."""
+
+    def __init__(self, path: str, universes=None, keyframe_interval: float = 1.0):
+        self.path = path
+        self.universes = set(universes) if universes else None
+        self.keyframe_interval_ns = int(keyframe_interval * 1e9)
+        self.frames = 0
+        self.keyframes = 0
+        self.raw_bytes = 0
+        self._state = {}
+        self._index = []
+        self._lock = threading.Lock()
+        self._start_ns = time.monotonic_ns()
+        self._last_index_ns = None
+        self._file = open(path, 'wb')
+        self._file.write(RECORDING_HEADER.pack(RECORDING_MAGIC, RECORDING_VERSION, 0, time.time_ns(),
+                                               self.keyframe_interval_ns))
+
+    def on_frame(self, universe: int, data: bytes, t_ns: int = None):
+        """Record one received frame (signature matches ArtNetDiscovery DMX listeners)."""
+        if self.universes is not None and universe not in self.universes:
+            return
+        data = bytes(data)
+        t = max((t_ns if t_ns is not None else time.monotonic_ns()) - self._start_ns, 0)
+        with self._lock:
+            if self._file is None:
+                return
+            if self._last_index_ns is None or t - self._last_index_ns >= self.keyframe_interval_ns:
+                self._write_index_point(t)
+            previous = self._state.get(universe)
+            if previous is None or len(previous) != len(data):
+                self._write_record(t, universe, RECORD_KEY, data)
+                self.keyframes += 1
+            else:
+                self._write_record(t, universe, RECORD_DELTA, encode_dmx_delta(previous, data))
+            self._state[universe] = data
+            self.frames += 1
+            self.raw_bytes += 18 + len(data)  # Size of the ArtDmx packet on the wire
+
+    def _write_record(self, t: int, universe: int, kind: int, payload: bytes):
+        self._file.write(RECORDING_RECORD.pack(t, universe, kind, len(payload)))
+        if payload:
+            self._file.write(payload)
+
+    def _write_index_point(self, t: int):
+        """Snapshot every known universe so playback can start from this offset."""
+        if self._state:  # Nothing to restore yet; playback starts from the header anyway
+            self._index.append((t, self._file.tell()))
+        for universe in sorted(self._state):
+            self._write_record(t, universe, RECORD_SNAPSHOT, self._state[universe])
+        self._last_index_ns = t
+
+    def close(self) -> dict:
+        """Write the keyframe index and trailer, close the file and return stats."""
+        with self._lock:
+            if self._file is not None:
+                index_offset = self._file.tell()
+                for entry in self._index:
+                    self._file.write(RECORDING_INDEX_ENTRY.pack(*entry))
+                self._file.write(RECORDING_TRAILER.pack(index_offset, len(self._index), RECORDING_INDEX_MAGIC))
+                self._file.close()
+                self._file = None
+        return self.stats()
+
+    def stats(self) -> dict:
+        """Return frame counts and the compression ratio against raw ArtDmx traffic."""
+        try:
+            file_bytes = os.path.getsize(self.path)
+        except OSError:
+            file_bytes = 0
+        return {
+            "frames": self.frames,
+            "keyframes": self.keyframes,
+            "universes": sorted(self._state),
+            "rawBytes": self.raw_bytes,
+            "fileBytes": file_bytes,
+            "compressionRatio": round(self.raw_bytes / file_bytes, 2) if file_bytes else None,
+        }
+
+class DmxPlayback:
+    """Memory-mapped reader that replays a DmxRecorder file over Art-Net."""
+
+    def __init__(self, path: str):
+        import mmap
+        self.path = path
+        self._file = open(path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, _, self.start_wall_ns, self.keyframe_interval_ns = RECORDING_HEADER.unpack_from(self._map, 0)
+        if magic != RECORDING_MAGIC or version != RECORDING_VERSION:
+            self.close()
+            raise ValueError(f"{path} is not an ArtBastard DMX recording")
+        self._end, self.index = self._read_index()
+
+    def _read_index(self):
+        """Load the index from the trailer, or rebuild it when the recording was cut short."""
+        size = len(self._map)
+        if size >= RECORDING_HEADER.size + RECORDING_TRAILER.size:
+            index_offset, count, magic = RECORDING_TRAILER.unpack_from(self._map, size - RECORDING_TRAILER.size)
+            if magic == RECORDING_INDEX_MAGIC:
+                index = [RECORDING_INDEX_ENTRY.unpack_from(self._map, index_offset + i * RECORDING_INDEX_ENTRY.size)
+                         for i in range(count)]
+                return index_offset, index
+        index = []
+        pos = RECORDING_HEADER.size
+        while pos + RECORDING_RECORD.size <= size:
+            t, _, kind, length = RECORDING_RECORD.unpack_from(self._map, pos)
+            if pos + RECORDING_RECORD.size + length > size:
+                break
+            if kind == RECORD_SNAPSHOT and (not index or index[-1][0] != t):
+                index.append((t, pos))
+            pos += RECORDING_RECORD.size + length
+        return pos, index
+
+    @property
+    def duration_ns(self) -> int:
+        """Timestamp of the last record."""
+        last = 0
+        for t, _, _, _ in self._records(self.index[-1][1] if self.index else RECORDING_HEADER.size):
+            last = t
+        return last
+
+    def _records(self, offset: int):
+        pos = offset
+        while pos < self._end:
+            t, universe, kind, length = RECORDING_RECORD.unpack_from(self._map, pos)
+            pos += RECORDING_RECORD.size
+            yield t, universe, kind, memoryview(self._map)[pos:pos + length]
+            pos += length
+
+    def frames(self, start_ns: int = 0):
+        """Yield (t_ns, universe, frame) for every received frame from start_ns on."""
+        import bisect
+        offset = RECORDING_HEADER.size
+        position = bisect.bisect_right([t for t, _ in self.index], start_ns) - 1
+        if position >= 0:
+            offset = self.index[position][1]
+        state = {}
+        for t, universe, kind, payload in self._records(offset):
+            if kind == RECORD_DELTA:
+                if universe not in state:
+                    continue
+                apply_dmx_delta(state[universe], payload)
+            else:
+                state[universe] = bytearray(payload)
+                if kind == RECORD_SNAPSHOT:
+                    continue
+            if t >= start_ns:
+                yield t, universe, state[universe]
+
+    def play(self, sender, speed: float = 1.0, start: float = 0.0, stop_event=None) -> dict:
+        """Re-emit frames through sender.send(universe, data) at the recorded timing.
+
+        Senders with a sync() method get it called after each timestamp's frames.
+        Returns jitter statistics: how late each send was against its schedule.
+        """
+        start_ns = int(start * 1e9)
+        lateness = []
+        origin = None
+        sync = getattr(sender, "sync", None)  # sACN: release each timestamp's universes together
+        last_t = None
+        for t, universe, frame in self.frames(start_ns):
+            if stop_event is not None and stop_event.is_set():
+                break
+            if sync is not None and last_t is not None and t != last_t:
+                sync()
+            last_t = t
+            if origin is None:
+                origin = time.perf_counter_ns() - int((t - start_ns) / speed)
+            due = origin + int((t - start_ns) / speed)
+            remaining = due - time.perf_counter_ns()
+            if remaining > 2_000_000:
+                time.sleep((remaining - 1_000_000) / 1e9)  # Sleep coarse, spin the last millisecond
+            while time.perf_counter_ns() < due:
+                pass
+            sender.send(universe, frame)
+            lateness.append(time.perf_counter_ns() - due)
+        if sync is not None and last_t is not None:
+            sync()
+        if not lateness:
+            return {"frames": 0}
+        lateness.sort()
+        return {
+            "frames": len(lateness),
+            "jitterMeanUs": round(sum(lateness) / len(lateness) / 1000, 1),
+            "jitterP99Us": round(lateness[min(len(lateness) - 1, int(len(lateness) * 0.99))] / 1000, 1),
+            "jitterMaxUs": round(lateness[-1] / 1000, 1),
+        }
+
+    def close(self):
+        self._map.close()
+        self._file.close()
+
+# The segment layout and DmxStateReader live in artbastard_dmx so consumers need only the standard library.
+class DmxStatePublisher:
+    """Publish live universe state into a named shared-memory segment."""
+
+    def __init__(self, name: str = DMX_SHM_NAME, slots: int = DMX_SHM_SLOTS):
+        from multiprocessing import shared_memory
+        self.name = name
+        self.slots = slots
+        size = dmx_shm_size(slots)
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        except FileExistsError:
+            # Left behind by a launcher that didn't shut down cleanly
+            stale = shared_memory.SharedMemory(name=name)
+            stale.close()
+            stale.unlink()
+            self._shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        self._buf = self._shm.buf
+        self._sequence = 0
+        self._slots = {}
+        self._lock = threading.Lock()
+        self.frames_published = 0
+        self.last_received_ns = {}  # Universe -> monotonic receive time of its last sniffed frame
+        DMX_SHM_HEADER.pack_into(self._buf, 0, DMX_SHM_MAGIC, DMX_SHM_VERSION, slots, 0, 0, 0)
+        for slot in range(slots):
+            DMX_SHM_SLOT.pack_into(self._buf, DMX_SHM_HEADER.size + slot * DMX_SHM_SLOT.size, DMX_SHM_FREE, 0)
+
+    def publish(self, universe: int, data: bytes, t_ns: int = None):
+        """Write one universe frame (signature matches ArtNetDiscovery DMX listeners)."""
+        with self._lock:
+            if self._buf is None:
+                return
+            slot = self._slots.get(universe)
+            if slot is None:
+                if len(self._slots) >= self.slots:
+                    return
+                slot = self._slots[universe] = len(self._slots)
+            length = min(len(data), 512)
+            data_offset = DMX_SHM_HEADER.size + self.slots * DMX_SHM_SLOT.size + slot * 512
+            self._sequence += 1
+            struct.pack_into("<Q", self._buf, DMX_SHM_SEQUENCE_OFFSET, self._sequence)
+            DMX_SHM_SLOT.pack_into(self._buf, DMX_SHM_HEADER.size + slot * DMX_SHM_SLOT.size, universe, length)
+            self._buf[data_offset:data_offset + length] = data[:length]
+            if t_ns is not None:
+                self.last_received_ns[universe] = t_ns
+            struct.pack_into("<Q", self._buf, DMX_SHM_SEQUENCE_OFFSET + 8, time.time_ns())
+            self._sequence += 1
+            struct.pack_into("<Q", self._buf, DMX_SHM_SEQUENCE_OFFSET, self._sequence)
+            self.frames_published += 1
+
+    def sniffed_recently(self, universe: int, window_ns: int = 1_000_000_000) -> bool:
+        """Whether a sniffed frame for this universe arrived within the window."""
+        return time.monotonic_ns() - self.last_received_ns.get(universe, 0) < window_ns
+
+    def close(self):
+        """Release and remove the segment."""
+        with self._lock:
+            if self._buf is None:
+                return
+            self._buf.release()
+            self._buf = None
+            self._shm.close()
+            try:
+                self._shm.unlink()
+            except FileNotFoundError:
+                pass
+
+class LaunchTracer:
+    """Record nested launch phases as Chrome trace (Perfetto-compatible) events."""
+
+    def __init__(self, **metadata):
+        self.metadata = metadata
+        self.started_at = datetime.now()
+        self.events = []
+        self.ready_ns = None
+        self._origin_ns = time.perf_counter_ns()
+        self._depth = 0
+        self._tracked_pids = []
+
+    def track_process(self, pid: int):
+        """Include a long-running child (e.g. the backend) in span CPU times."""
+        self._tracked_pids.append(pid)
+
+    def _child_cpu_seconds(self) -> float:
+        """CPU time of reaped children plus the tracked processes and their descendants."""
+        import psutil
+        times = os.times()
+        total = times.children_user + times.children_system
+        for pid in self._tracked_pids:
+            try:
+                process = psutil.Process(pid)
+                for proc in [process] + process.children(recursive=True):
+                    cpu = proc.cpu_times()
+                    total += cpu.user + cpu.system
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                pass
+        return total
+
+    @contextlib.contextmanager
+    def span(self, name: str, **args):
+        """Time a phase; the yielded dict becomes the event's args."""
+        begin_ns = time.perf_counter_ns()
+        child_cpu = self._child_cpu_seconds()
+        own_cpu = time.process_time()
+        self._depth += 1
+        try:
+            yield args
+        finally:
+            self._depth -= 1
+            end_ns = time.perf_counter_ns()
+            args["childCpuMs"] = round((self._child_cpu_seconds() - child_cpu) * 1000, 1)
+            args["launcherCpuMs"] = round((time.process_time() - own_cpu) * 1000, 1)
+            self.events.append({
+                "name": name,
+                "cat": "launch",
+                "ph": "X",
+                "ts": (begin_ns - self._origin_ns) / 1000,
+                "dur": (end_ns - begin_ns) / 1000,
+                "pid": os.getpid(),
+                "tid": 1,
+                "args": args,
+                "depth": self._depth,
+            })
+
+    def mark_ready(self):
+        """Record the moment the backend answered."""
+        self.ready_ns = time.perf_counter_ns()
+        self.events.append({"name": "ready", "cat": "launch", "ph": "i", "s": "p", "pid": os.getpid(), "tid": 1,
+                            "ts": (self.ready_ns - self._origin_ns) / 1000})
+
+    def finish(self, status: str) -> dict:
+        """Write the trace file, append to the launch history and return this launch's summary."""
+        total_ms = (time.perf_counter_ns() - self._origin_ns) / 1e6
+        stamp = self.started_at.strftime("%Y%m%d%H%M%S")
+        os.makedirs(LAUNCH_TRACE_DIR, exist_ok=True)
+        trace_file = os.path.join(LAUNCH_TRACE_DIR, f"launch-{stamp}.json")
+        events = [{"name": "process_name", "ph": "M", "pid": os.getpid(), "args": {"name": "artbastard launcher"}}]
+        events += [{k: v for k, v in event.items() if k != "depth"} for event in self.events]
+        with open(trace_file, 'w') as f:
+            json.dump({"traceEvents": events, "displayTimeUnit": "ms",
+                       "metadata": dict(self.metadata, status=status, startedAt=self.started_at.isoformat())}, f)
+        top_level = [event for event in self.events if event.get("depth") == 0]
+        summary = {
+            "startedAt": self.started_at.isoformat(timespec="seconds"),
+            "status": status,
+            "totalMs": round(total_ms, 1),
+            "timeToReadyMs": round((self.ready_ns - self._origin_ns) / 1e6, 1) if self.ready_ns else None,
+            "phases": {event["name"]: round(event["dur"] / 1000, 1) for event in top_level},
+            "childCpuMs": {event["name"]: event["args"]["childCpuMs"] for event in top_level},
+            "traceFile": trace_file,
+            **self.metadata,
+        }
+        history = []
+        try:
+            with open(LAUNCH_HISTORY_FILE, 'r') as f:
+                history = [json.loads(line) for line in f if line.strip()]
+        except (OSError, ValueError):
+            pass
+        ready_times = sorted(run["timeToReadyMs"] for run in history[-LAUNCH_REGRESSION_WINDOW:] if run.get("timeToReadyMs"))
+        if ready_times:
+            summary["baselineTimeToReadyMs"] = ready_times[len(ready_times) // 2]
+        history = (history + [summary])[-LAUNCH_HISTORY_LIMIT:]
+        with open(LAUNCH_HISTORY_FILE, 'w') as f:
+            f.writelines(json.dumps(run) + "\n" for run in history)
+        return summary
+
+class BackendLogCapture:
+    """Own the backend's stdout: size/time-rotated segments, background gzip and a time index.
+
+    The index (index.jsonl) maps wall-clock checkpoints to (segment, byte offset). In
+    memory it is kept as flat arrays that queries bisect, next to a summary per segment
+    (first/last checkpoint time and bytes written) and a ring of recent lines for tails,
+    so neither cost grows with uptime.
+    """
+
+    def __init__(self, log_dir: str = BACKEND_LOG_DIR, segment_bytes: int = BACKEND_LOG_SEGMENT_BYTES,
+                 segment_seconds: float = BACKEND_LOG_SEGMENT_SECONDS, index_interval: float = BACKEND_LOG_INDEX_INTERVAL,
+                 retention_bytes: int = BACKEND_LOG_RETENTION_BYTES, retention_days: float = BACKEND_LOG_RETENTION_DAYS,
+                 tail_lines: int = BACKEND_LOG_TAIL_LINES):
+        import queue
+        from array import array
+        from collections import deque
+        self.log_dir = log_dir
+        self.segment_bytes = segment_bytes
+        self.segment_seconds = segment_seconds
+        self.index_interval = index_interval
+        self.retention_bytes = retention_bytes
+        self.retention_days = retention_days
+        self.index_file = os.path.join(log_dir, "index.jsonl")
+        self.lines_written = 0
+        self.lines_dropped = 0  # Lines lost to write errors; the pipe keeps draining regardless
+        self.last_error = None
+        self.segment = None
+        self._file = None
+        self._segment_started = 0.0
+        self._last_checkpoint = 0.0
+        self._sequence = 0
+        self._lock = threading.Lock()
+        self._compress_queue = queue.Queue()
+        self._reader = None
+        self._times = array('d')  # Checkpoint times, ascending
+        self._offsets = array('q')  # Byte offset of each checkpoint within its segment
+        self._ordinals = array('q')  # Position of each checkpoint's segment in self._summaries
+        self._summaries = []  # Per segment in write order: {"segment", "first", "last", "bytes"}
+        self._first_ordinal = 0  # Ordinal of self._summaries[0]; pruning drops from the front
+        self._recent = deque(maxlen=tail_lines)
+        self._recent_seeded = False
+        os.makedirs(log_dir, exist_ok=True)
+        self._load_index()
+        self._compressor = threading.Thread(target=self._compress_worker, daemon=True)
+        self._compressor.start()
+        # Segments left uncompressed by a previous launcher
+        for name in sorted(os.listdir(log_dir)):
+            if name.endswith(".log"):
+                self._compress_queue.put(os.path.join(log_dir, name))
+
+    def _load_index(self):
+        try:
+            with open(self.index_file, 'r') as f:
+                for line in f:
+                    if line.strip():
+                        entry = json.loads(line)
+                        self._add_checkpoint(entry["t"], entry["segment"], entry["offset"])
+        except (OSError, ValueError, KeyError):
+            pass
+
+    def _add_checkpoint(self, t: float, segment: str, offset: int):
+        if not self._summaries or self._summaries[-1]["segment"] != segment:
+            self._summaries.append({"segment": segment, "first": t, "last": t, "bytes": offset})
+        summary = self._summaries[-1]
+        summary["last"] = t
+        summary["bytes"] = max(summary["bytes"], offset)
+        self._times.append(t)
+        self._offsets.append(offset)
+        self._ordinals.append(self._first_ordinal + len(self._summaries) - 1)
+
+    def attach(self, stream):
+        """Start copying a binary stream (the backend's stdout pipe) into segments."""
+        self._reader = threading.Thread(target=self._read_stream, args=(stream,), daemon=True)
+        self._reader.start()
+
+    def _read_stream(self, stream):
+        # A failed write drops only its line: if this thread stopped, nothing would drain the
+        # backend's stdout and Node would block on the full pipe or die of EPIPE.
+        try:
+            for line in iter(stream.readline, b""):
+                try:
+                    self.write(line)
+                except (OSError, ValueError) as e:
+                    self.lines_dropped += 1
+                    self.last_error = str(e)
+        except (OSError, ValueError):
+            pass
+        finally:
+            try:
+                self.close_segment()
+            except OSError:
+                pass
+
+    def write(self, line: bytes):
+        """Append one line, rotating and checkpointing the index as needed."""
+        now = time.time()
+        with self._lock:
+            if self._file is None or self._file.tell() >= self.segment_bytes or now - self._segment_started >= self.segment_seconds:
+                self._rotate(now)
+            if now - self._last_checkpoint >= self.index_interval:
+                self._checkpoint(now)
+            self._file.write(line)
+            self._recent.append(line)
+            self.lines_written += 1
+
+    def _rotate(self, now: float):
+        rotated = self._file is not None
+        self._close_segment_locked()
+        self._sequence += 1
+        self.segment = f"backend-{datetime.fromtimestamp(now).strftime('%Y%m%d%H%M%S')}-{self._sequence:04d}.log"
+        os.makedirs(self.log_dir, exist_ok=True)
+        # Unbuffered so tails and queries see output as soon as the backend writes it
+        self._file = open(os.path.join(self.log_dir, self.segment), 'ab', buffering=0)
+        self._segment_started = now
+        self._checkpoint(now)
+        if rotated:
+            self.prune()
+
+    def _checkpoint(self, now: float):
+        entry = {"t": round(now, 3), "segment": self.segment, "offset": self._file.tell()}
+        self._add_checkpoint(entry["t"], entry["segment"], entry["offset"])
+        self._last_checkpoint = now
+        # The in-memory index already has the checkpoint; a lost line on disk only coarsens queries after a reload
+        try:
+            with open(self.index_file, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+        except FileNotFoundError:
+            os.makedirs(self.log_dir, exist_ok=True)
+        except OSError as e:
+            self.last_error = str(e)
+
+    def close_segment(self):
+        """Close the current segment and queue it for compression."""
+        with self._lock:
+            self._close_segment_locked()
+
+    def _close_segment_locked(self):
+        if self._file is not None:
+            if self._summaries and self._summaries[-1]["segment"] == self.segment:
+                self._summaries[-1]["bytes"] = self._file.tell()
+            self._file.close()
+            self._compress_queue.put(os.path.join(self.log_dir, self.segment))
+            self._file = None
+
+    def _compress_worker(self):
+        import gzip
+        import shutil
+        while True:
+            path = self._compress_queue.get()
+            if path is None:
+                return
+            try:
+                with open(path, 'rb') as src, gzip.open(f"{path}.gz.tmp", 'wb') as dst:
+                    shutil.copyfileobj(src, dst)
+                os.replace(f"{path}.gz.tmp", f"{path}.gz")
+                os.remove(path)
+            except OSError:
+                pass
+
+    def _segment_path(self, segment: str):
+        """Resolve a segment name to its plain or compressed file."""
+        path = os.path.join(self.log_dir, segment)
+        if os.path.exists(path):
+            return path
+        return f"{path}.gz" if os.path.exists(f"{path}.gz") else None
+
+    def _open_segment(self, segment: str):
+        import gzip
+        path = self._segment_path(segment)
+        if path is None:
+            return None
+        return gzip.open(path, 'rb') if path.endswith(".gz") else open(path, 'rb')
+
+    def segments(self) -> list:
+        """Segment names in the order they were written."""
+        with self._lock:
+            return [summary["segment"] for summary in self._summaries]
+
+    def summaries(self) -> list:
+        """Per-segment first/last checkpoint time and bytes written, oldest first."""
+        with self._lock:
+            return [dict(summary) for summary in self._summaries]
+
+    def tail(self, lines: int = 20) -> list:
+        """Return the last lines written (up to the in-memory ring size) without touching disk.
+
+        Before this capture has written anything, the ring is seeded once from the end of
+        the newest segment on disk, so a fresh capture still shows the previous run's tail.
+        """
+        with self._lock:
+            seed = not self._recent_seeded and not self._recent
+            self._recent_seeded = True
+            newest = self._summaries[-1]["segment"] if self._summaries else None
+        if seed and newest:
+            self._seed_recent(newest)
+        with self._lock:
+            recent = list(self._recent)[-lines:] if lines > 0 else []
+        return [line.decode('utf-8', errors='replace').rstrip("\r\n") for line in recent]
+
+    def _seed_recent(self, segment: str):
+        path = self._segment_path(segment)
+        if path is None:
+            return
+        if path.endswith(".gz"):
+            with self._open_segment(segment) as f:
+                chunk = f.read()  # gzip can't seek from the end; this happens once per capture
+        else:
+            with open(path, 'rb') as f:
+                f.seek(0, os.SEEK_END)
+                f.seek(max(0, f.tell() - 256 * self._recent.maxlen))
+                chunk = f.read()
+        with self._lock:
+            if not self._recent:
+                self._recent.extend(line + b"\n" for line in chunk.splitlines()[-self._recent.maxlen:])
+
+    def query(self, start: float, end: float = None):
+        """Yield lines written between two epoch times, to index checkpoint granularity."""
+        import bisect
+        end = end if end is not None else time.time()
+        with self._lock:
+            if not self._times:
+                return
+            # Read from the checkpoint at or before start to the first checkpoint after end
+            first = max(bisect.bisect_right(self._times, start) - 1, 0)
+            stop = bisect.bisect_right(self._times, end)
+            first_ordinal = self._ordinals[first] - self._first_ordinal
+            ranges = []
+            if stop < len(self._times):
+                last_ordinal = self._ordinals[stop] - self._first_ordinal
+                limit = self._offsets[stop]
+            else:
+                last_ordinal = len(self._summaries) - 1
+                limit = None
+            for position in range(first_ordinal, last_ordinal + 1):
+                offset = self._offsets[first] if position == first_ordinal else 0
+                ranges.append((self._summaries[position]["segment"], offset, limit if position == last_ordinal else None))
+        for segment, offset, limit in ranges:
+            f = self._open_segment(segment)
+            if f is None:
+                continue
+            with f:
+                f.seek(offset)
+                data = f.read(None if limit is None else max(limit - offset, 0))
+            yield from data.decode('utf-8', errors='replace').splitlines()
+
+    def prune(self):
+        """Delete the oldest closed segments beyond the size or age retention and rewrite the index."""
+        import bisect
+        cutoff = time.time() - self.retention_days * 86400
+        sizes = [self._segment_size(summary["segment"]) for summary in self._summaries]
+        total = sum(sizes)
+        removed = 0
+        for summary, size in zip(self._summaries, sizes):
+            if summary["segment"] == self.segment:
+                break
+            if total <= self.retention_bytes and summary["first"] >= cutoff:
+                break
+            if not self._remove_segment(summary["segment"]):
+                break
+            total -= size
+            removed += 1
+        if not removed:
+            return []
+        names = [summary["segment"] for summary in self._summaries[:removed]]
+        del self._summaries[:removed]
+        self._first_ordinal += removed
+        keep = bisect.bisect_left(self._ordinals, self._first_ordinal)
+        del self._times[:keep]
+        del self._offsets[:keep]
+        del self._ordinals[:keep]
+        with open(f"{self.index_file}.tmp", 'w') as f:
+            f.writelines(json.dumps({"t": t, "segment": self._summaries[ordinal - self._first_ordinal]["segment"],
+                                     "offset": offset}) + "\n"
+                         for t, offset, ordinal in zip(self._times, self._offsets, self._ordinals))
+        os.replace(f"{self.index_file}.tmp", self.index_file)
+        return sorted(names)
+
+    def _segment_size(self, segment: str) -> int:
+        # The compressor may swap .log for .log.gz between resolving the path and reading it
+        for _ in range(2):
+            path = self._segment_path(segment)
+            if path is None:
+                return 0
+            try:
+                return os.path.getsize(path)
+            except FileNotFoundError:
+                continue
+        return 0
+
+    def _remove_segment(self, segment: str) -> bool:
+        for _ in range(2):
+            path = self._segment_path(segment)
+            if path is None:
+                return True
+            try:
+                os.remove(path)
+                return True
+            except FileNotFoundError:
+                continue
+            except OSError:
+                return False
+        return self._segment_path(segment) is None
+
+    def stop(self):
+        """Close the current segment and let the compressor finish."""
+        if self._reader is not None:
+            self._reader.join(timeout=2)
+        self.close_segment()
+        self._compress_queue.put(None)
+        self._compressor.join(timeout=10)
+
+
+def validate_config(config) -> list:
+    """Return a list of problems with a parsed config.json (empty when it is usable)."""
+    if not isinstance(config, dict):
+        return ["config must be a JSON object"]
+    errors = []
+    artnet = config.get("artNetConfig", {})
+    if not isinstance(artnet, dict):
+        errors.append("artNetConfig must be an object")
+    else:
+        if "ip" in artnet:
+            try:
+                if not isinstance(artnet["ip"], str) or artnet["ip"].count(".") != 3:
+                    raise OSError
+                socket.inet_aton(artnet["ip"])
+            except OSError:
+                errors.append(f"artNetConfig.ip is not an IPv4 address: {artnet['ip']!r}")
+        for key, low, high in (("net", 0, 127), ("subnet", 0, 15), ("universe", 0, 15), ("port", 1, 65535),
+                               ("base_refresh_interval", 1, 60000)):
+            value = artnet.get(key, low)
+            if not isinstance(value, int) or isinstance(value, bool) or not low <= value <= high:
+                errors.append(f"artNetConfig.{key} must be an integer in {low}..{high}")
+    mappings = config.get("midiMappings", {})
+    if not isinstance(mappings, dict):
+        errors.append("midiMappings must be an object")
+    else:
+        for channel, mapping in mappings.items():
+            if not str(channel).isdigit() or int(channel) > 511:
+                errors.append(f"midiMappings key {channel!r} is not a DMX channel (0..511)")
+            elif not isinstance(mapping, dict) or not isinstance(mapping.get("channel"), int):
+                errors.append(f"midiMappings[{channel}] needs an integer MIDI channel")
+            elif any(not isinstance(mapping[key], int) or not 0 <= mapping[key] <= 127
+                     for key in ("note", "controller") if key in mapping):
+                errors.append(f"midiMappings[{channel}] note/controller must be in 0..127")
+    return errors
+
+
+def diff_config(old: dict, new: dict) -> list:
+    """Top-level config sections that were added, removed or changed."""
+    return sorted(key for key in set(old) | set(new) if old.get(key) != new.get(key))
+
+
+class ConfigWatcher:
+    """Watch one file with inotify (polling elsewhere) and call on_change(detected_ns) once edits settle."""
+
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+
+    def __init__(self, path: str, on_change, debounce: float = CONFIG_RELOAD_DEBOUNCE,
+                 poll_interval: float = CONFIG_RELOAD_POLL_INTERVAL):
+        self.path = path
+        self.on_change = on_change
+        self.debounce = debounce
+        self.poll_interval = poll_interval
+        self.mode = None
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        fd = self._inotify_open()
+        self.mode = "inotify" if fd is not None else "polling"
+        target = self._run_inotify if fd is not None else self._run_polling
+        self._thread = threading.Thread(target=target, args=(fd,) if fd is not None else (), daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stop.set()
+        if self._thread:
+            self._thread.join(timeout=2)
+            self._thread = None
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def _inotify_open(self):
+        """Watch the file's directory so editors that replace the file are still seen; None without inotify."""
+        if not sys.platform.startswith("linux"):
+            return None
+        try:
+            import ctypes
+            import ctypes.util
+            libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+            if fd < 0:
+                return None
+            directory = os.path.dirname(os.path.abspath(self.path))
+            mask = self.IN_MODIFY | self.IN_CLOSE_WRITE | self.IN_MOVED_TO | self.IN_CREATE
+            if libc.inotify_add_watch(fd, directory.encode(), mask) < 0:
+                os.close(fd)
+                return None
+            return fd
+        except (OSError, AttributeError):
+            return None
+
+    def _run_inotify(self, fd: int):
+        import select
+        name = os.path.basename(self.path).encode()
+        pending = None
+        detected_ns = 0
+        try:
+            while not self._stop.is_set():
+                timeout = 0.5 if pending is None else max(0.0, pending + self.debounce - time.monotonic())
+                readable, _, _ = select.select([fd], [], [], timeout)
+                if readable:
+                    try:
+                        data = os.read(fd, 65536)
+                    except BlockingIOError:
+                        continue
+                    offset = 0
+                    touched = False
+                    while offset + 16 <= len(data):
+                        _, _, _, length = struct.unpack_from("iIII", data, offset)
+                        touched |= data[offset + 16:offset + 16 + length].rstrip(b"\0") == name
+                        offset += 16 + length
+                    if touched:
+                        if pending is None:
+                            detected_ns = time.time_ns()
+                        pending = time.monotonic()
+                elif pending is not None and time.monotonic() - pending >= self.debounce:
+                    pending = None
+                    self._fire(detected_ns)
+        finally:
+            os.close(fd)
+
+    def _stat(self):
+        try:
+            st = os.stat(self.path)
+            return st.st_mtime_ns, st.st_size
+        except OSError:
+            return None
+
+    def _run_polling(self):
+        last = self._stat()
+        pending = None
+        detected_ns = 0
+        while not self._stop.wait(min(self.poll_interval, self.debounce) if pending else self.poll_interval):
+            current = self._stat()
+            if current != last:
+                last = current
+                if pending is None:
+                    detected_ns = time.time_ns()
+                pending = time.monotonic()
+            elif pending is not None and time.monotonic() - pending >= self.debounce:
+                pending = None
+                self._fire(detected_ns)
+
+    def _fire(self, detected_ns: int):
+        try:
+            self.on_change(detected_ns)
+        except Exception as e:
+            console.print(f"Config reload failed: {e}", style="red")
+
+
+class BackendSocketClient:
+    """Minimal Socket.IO v4 client over Engine.IO long-polling, enough to emit events to the backend."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = BACKEND_PORT, timeout: float = 3.0):
+        import http.client
+        self._conn = http.client.HTTPConnection(host, port, timeout=timeout)
+        self.sid = None
+        self.events = []
+
+    def _request(self, method: str, body: str = None) -> str:
+        query = "EIO=4&transport=polling" + (f"&sid={self.sid}" if self.sid else "")
+        headers = {"Content-Type": "text/plain;charset=UTF-8"} if body is not None else {}
+        self._conn.request(method, f"/socket.io/?{query}", body=body, headers=headers)
+        response = self._conn.getresponse()
+        payload = response.read().decode("utf-8", errors="replace")
+        if response.status != 200:
+            raise ConnectionError(f"Socket.IO {method} returned HTTP {response.status}: {payload[:80]}")
+        return payload
+
+    def connect(self):
+        opened = self._request("GET")
+        if not opened.startswith("0"):
+            raise ConnectionError(f"Unexpected Engine.IO handshake: {opened[:80]}")
+        self.sid = json.loads(opened[1:])["sid"]
+        self._request("POST", "40")
+        self._poll()
+
+    def _poll(self):
+        """One long-poll GET; queue events and answer pings."""
+        for packet in self._request("GET").split("\x1e"):
+            if packet == "2":
+                self._request("POST", "3")
+            elif packet.startswith("44"):
+                raise ConnectionError(f"Socket.IO connect refused: {packet[2:]}")
+            elif packet.startswith("42"):
+                event = json.loads(packet[2:])
+                self.events.append((event[0], event[1] if len(event) > 1 else None))
+            elif packet == "1":
+                raise ConnectionError("Socket.IO session closed by the backend")
+
+    def emit(self, event: str, data):
+        self._request("POST", "42" + json.dumps([event, data]))
+
+    def wait_for(self, match, timeout: float = 3.0):
+        """Return the first (event, data) for which match(event, data) is true, polling until the timeout."""
+        deadline = time.monotonic() + timeout
+        while True:
+            for i, (event, data) in enumerate(self.events):
+                if match(event, data):
+                    del self.events[:i + 1]
+                    return event, data
+            self.events.clear()
+            if time.monotonic() >= deadline:
+                raise TimeoutError(f"No acknowledgement from the backend within {timeout:.1f}s")
+            self._poll()
+
+    def close(self):
+        try:
+            if self.sid:
+                self._request("POST", "1")
+        except (OSError, ConnectionError):
+            pass
+        self._conn.close()
+
+
+def _metric_labels(labels: dict) -> str:
+    if not labels:
+        return ""
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in labels.values())
+    return "{" + ",".join(f'{key}="{value}"' for key, value in zip(labels, escaped)) + "}"
+
+def _metric_value(value) -> str:
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class LauncherMetrics:
+    """Counters for the /metrics endpoint, rendered as OpenMetrics text from a cached snapshot.
+
+    Hot paths only bump ints in place: each frame counter has a single writer (the sniffer
+    or listener thread), and OSC handlers, which run on server threads, share a lock. A
+    collector thread samples the backend process once per interval and re-renders the
+    exposition, so a scrape returns cached bytes without touching the DMX path.
+    """
+
+    def __init__(self, backend_pid=lambda: None, artnet_nodes=lambda: 0, interval: float = METRICS_INTERVAL):
+        self.backend_pid = backend_pid
+        self.artnet_nodes = artnet_nodes
+        self.interval = interval
+        self.osc_messages = 0
+        self.artnet_frames = {}  # universe -> frames, written only by the Art-Net sniffer thread
+        self.sacn_frames = {}  # universe -> frames, written only by the sACN listener thread
+        self.backend_restarts = 0
+        self.config_reloads = {}  # mode -> count
+        self.config_apply_ms = None
+        self.launches = {}  # status -> count
+        self.last_launch = None
+        self.scrapes = 0
+        self.rendered = b"# EOF\n"
+        self._osc_lock = threading.Lock()
+        self._osc_rate = 0.0
+        self._last_sample = None
+        self._stop = threading.Event()
+        self._collector = None
+        self._server = None
+
+    def count_osc(self):
+        with self._osc_lock:
+            self.osc_messages += 1
+
+    def on_artnet_frame(self, universe: int, data: bytes, t_ns: int):
+        frames = self.artnet_frames
+        frames[universe] = frames.get(universe, 0) + 1
+
+    def on_sacn_frame(self, universe: int, data: bytes, t_ns: int):
+        frames = self.sacn_frames
+        frames[universe] = frames.get(universe, 0) + 1
+
+    def count_config_reload(self, entry: dict):
+        self.config_reloads[entry["mode"]] = self.config_reloads.get(entry["mode"], 0) + 1
+        if "applyMs" in entry:
+            self.config_apply_ms = entry["applyMs"]
+
+    def record_launch(self, summary: dict):
+        self.launches[summary["status"]] = self.launches.get(summary["status"], 0) + 1
+        self.last_launch = summary
+
+    def start(self, host: str = METRICS_HOST, port: int = METRICS_PORT):
+        """Serve GET /metrics and start the collector thread."""
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+        metrics = self
+
+        class MetricsHandler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?", 1)[0] != "/metrics":
+                    self.send_error(404)
+                    return
+                body = metrics.rendered
+                metrics.scrapes += 1
+                self.send_response(200)
+                self.send_header("Content-Type", "application/openmetrics-text; version=1.0.0; charset=utf-8")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._server = ThreadingHTTPServer((host, port), MetricsHandler)
+        self._server.daemon_threads = True
+        self._stop.clear()
+        self.collect()
+        self._collector = threading.Thread(target=self._collect_loop, daemon=True)
+        self._collector.start()
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+
+    def stop(self):
+        self._stop.set()
+        if self._server:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+        if self._collector:
+            self._collector.join(timeout=2)
+            self._collector = None
+
+    @property
+    def running(self) -> bool:
+        return self._server is not None
+
+    @property
+    def address(self) -> str:
+        host, port = self._server.server_address[:2] if self._server else (METRICS_HOST, METRICS_PORT)
+        return f"http://{host}:{port}/metrics"
+
+    def _collect_loop(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.collect()
+            except Exception:
+                pass
+
+    def _backend_usage(self):
+        """CPU seconds and RSS bytes of the backend and its children, or None when it is not running."""
+        pid = self.backend_pid()
+        if not pid:
+            return None
+        import psutil
+        try:
+            process = psutil.Process(pid)
+            cpu = rss = 0
+            for proc in [process] + process.children(recursive=True):
+                with contextlib.suppress(psutil.NoSuchProcess, psutil.AccessDenied):
+                    times = proc.cpu_times()
+                    cpu += times.user + times.system
+                    rss += proc.memory_info().rss
+            return cpu, rss
+        except (psutil.NoSuchProcess, psutil.AccessDenied):
+            return None
+
+    def collect(self):
+        """Sample the slow gauges and re-render the cached exposition."""
+        now = time.monotonic()
+        osc_total = self.osc_messages
+        if self._last_sample is not None and now > self._last_sample[0]:
+            self._osc_rate = (osc_total - self._last_sample[1]) / (now - self._last_sample[0])
+        self._last_sample = (now, osc_total)
+        families = []
+
+        def family(name, kind, help_text, samples):
+            families.append(f"# TYPE {name} {kind}\n# HELP {name} {help_text}\n" + "".join(
+                f"{name}{suffix}{_metric_labels(labels)} {_metric_value(value)}\n" for suffix, labels, value in samples))
+
+        usage = self._backend_usage()
+        family("artbastard_backend_up", "gauge", "Whether the backend process is running.", [("", {}, 1 if usage else 0)])
+        if usage:
+            family("artbastard_backend_cpu_seconds", "counter", "CPU time of the backend process tree.",
+                   [("_total", {}, usage[0])])
+            family("artbastard_backend_resident_memory_bytes", "gauge", "Resident memory of the backend process tree.",
+                   [("", {}, usage[1])])
+        family("artbastard_backend_restarts", "counter", "Backend restarts triggered by the launcher.",
+               [("_total", {}, self.backend_restarts)])
+        family("artbastard_osc_messages", "counter", "OSC messages seen by the monitor.", [("_total", {}, osc_total)])
+        family("artbastard_osc_message_rate", "gauge", "OSC messages per second over the last interval.",
+               [("", {}, round(self._osc_rate, 3))])
+        family("artbastard_artnet_frames", "counter", "ArtDmx frames received per universe.",
+               [("_total", {"universe": u}, n) for u, n in sorted(dict(self.artnet_frames).items())])
+        family("artbastard_sacn_frames", "counter", "sACN frames received per universe.",
+               [("_total", {"universe": u}, n) for u, n in sorted(dict(self.sacn_frames).items())])
+        family("artbastard_artnet_nodes", "gauge", "Art-Net nodes currently answering ArtPoll.", [("", {}, self.artnet_nodes())])
+        family("artbastard_launches", "counter", "Launch attempts by outcome.",
+               [("_total", {"status": s}, n) for s, n in sorted(self.launches.items())])
+        if self.last_launch:
+            if self.last_launch.get("timeToReadyMs") is not None:
+                family("artbastard_time_to_ready_seconds", "gauge", "Time from launch to backend readiness, last launch.",
+                       [("", {}, self.last_launch["timeToReadyMs"] / 1000)])
+            family("artbastard_launch_phase_seconds", "gauge", "Duration of each launch phase, last launch.",
+                   [("", {"phase": p}, ms / 1000) for p, ms in self.last_launch["phases"].items()])
+        family("artbastard_config_reloads", "counter", "config.json changes handled by outcome.",
+               [("_total", {"mode": m}, n) for m, n in sorted(self.config_reloads.items())])
+        if self.config_apply_ms is not None:
+            family("artbastard_config_apply_seconds", "gauge", "Edit-to-applied latency of the last config change.",
+                   [("", {}, self.config_apply_ms / 1000)])
+        family("artbastard_launcher_cpu_seconds", "counter", "CPU time of the launcher process.",
+               [("_total", {}, time.process_time())])
+        family("artbastard_metrics_scrapes", "counter", "Requests served by this endpoint.", [("_total", {}, self.scrapes)])
+        self.rendered = ("".join(families) + "# EOF\n").encode()
+
+# Built-in fixture profiles: channel lists a fixture can reference with "profile" instead of
+# spelling out "channels". Ranges name DMX value bands; "requires" names another
+# attribute's mode that must be set for the band to mean anything.
+FIXTURE_PROFILES = {
+    "laser": [  # From notes.txt
+        {"name": "mode", "type": "other", "ranges": {"cycle": [64, 128]}},
+        {"name": "scene", "type": "gobo", "ranges": {
+            "numbers": [166, 182],
+            "apple": [186, 186],
+            "pig": [201, 201],
+            "circles, sines": {"range": [0, 15], "requires": {"mode": "cycle"}},
+            "scrolling lines": {"range": [16, 31], "requires": {"mode": "cycle"}},
+            "flying bananas": {"range": [32, 47], "requires": {"mode": "cycle"}},
+            "more scrolling lines": {"range": [48, 63], "requires": {"mode": "cycle"}},
+            "expanding lines": {"range": [64, 79], "requires": {"mode": "cycle"}},
+            "fancy sines": {"range": [144, 159], "requires": {"mode": "cycle"}},
+        }},
+        {"name": "rotation", "type": "other", "ranges": {"auto": [128, 255]}},
+        {"name": "mirror x", "type": "other"},
+        {"name": "mirror y", "type": "other"},
+        {"name": "x", "type": "pan"},
+        {"name": "y", "type": "tilt"},
+        {"name": "scale", "type": "other"},
+        {"name": "refresh", "type": "other"},
+        {"name": "speed", "type": "other", "ranges": {"dots": [129, 255]}},
+        {"name": "colour cycle", "type": "other"},
+    ],
+}
+INTENSITY_CHANNEL_TYPES = {"dimmer"}  # Channel types merged highest-takes-precedence; everything else is LTP
+
+def _is_int(value) -> bool:
+    return isinstance(value, int) and not isinstance(value, bool)
+
+def validate_fixture(fixture, universes: int) -> list:
+    """Return a list of problems with one patched fixture (empty when FixturePatch can compile it)."""
+    if not isinstance(fixture, dict):
+        return ["fixture must be an object"]
+    errors = []
+    profile = fixture.get("profile")
+    if not fixture.get("channels") and profile is not None and not isinstance(profile, str):
+        return ["profile must be a string"]
+    channels = fixture.get("channels") or FIXTURE_PROFILES.get(profile, [])
+    if not isinstance(channels, list):
+        return ["channels must be a list"]
+    for number, channel in enumerate(channels, 1):
+        if not isinstance(channel, dict):
+            errors.append(f"channel {number} must be an object")
+            continue
+        if not isinstance(channel.get("type", "other"), str):
+            errors.append(f"channel {number} type must be a string")
+        ranges = channel.get("ranges") or {}
+        if not isinstance(ranges, dict):
+            errors.append(f"channel {number} ranges must be an object")
+            continue
+        for mode, spec in ranges.items():
+            bounds = spec.get("range") if isinstance(spec, dict) else spec
+            requires = spec.get("requires", {}) if isinstance(spec, dict) else {}
+            if (not isinstance(bounds, (list, tuple)) or len(bounds) != 2 or not all(_is_int(b) for b in bounds)
+                    or not 0 <= bounds[0] <= bounds[1] <= 255):
+                errors.append(f"channel {number} range {mode!r} must be [low, high] within 0..255")
+            elif not isinstance(requires, dict) or not all(isinstance(v, str) for v in requires.values()):
+                errors.append(f"channel {number} range {mode!r} requires must map attributes to mode names")
+    universe = fixture.get("universe", 0)
+    start = fixture.get("startAddress", 1)
+    if not _is_int(universe) or not 0 <= universe < universes:
+        errors.append(f"universe must be an integer in 0..{universes - 1}")
+    if not _is_int(start) or start < 1 or start + len(channels) - 1 > 512:
+        errors.append(f"{len(channels)} channels do not fit at address {start!r}")
+    return errors
+
+class FixturePatch:
+    """One fixture compiled to flat slot indices per attribute plus its named value ranges."""
+
+    def __init__(self, fixture: dict, universes: int):
+        import numpy as np
+        channels = fixture.get("channels") or FIXTURE_PROFILES.get(fixture.get("profile"), [])
+        universe = int(fixture.get("universe", 0))
+        start = int(fixture.get("startAddress", 1))
+        if not 0 <= universe < universes:
+            raise ValueError(f"fixture {fixture.get('name')!r} is on universe {universe}, outside 0..{universes - 1}")
+        if start < 1 or start + len(channels) - 1 > 512:
+            raise ValueError(f"fixture {fixture.get('name')!r} does not fit at address {start}")
+        base = universe * 512 + start - 1
+        slots = {}
+        self.modes = {}  # attribute -> {mode: (low, high, requires)}
+        self.types = {}  # flat slot -> channel type
+        for offset, channel in enumerate(channels):
+            slot = base + offset
+            self.types[slot] = channel.get("type", "other")
+            # A channel answers to its type ("red") and its own name ("mirror x")
+            for attribute in {self.types[slot], str(channel.get("name", "")).strip().lower()} - {"", "other"}:
+                slots.setdefault(attribute, []).append(slot)
+                for mode, spec in (channel.get("ranges") or {}).items():
+                    low, high = spec["range"] if isinstance(spec, dict) else spec
+                    self.modes.setdefault(attribute, {})[mode] = (int(low), int(high), spec.get("requires", {}) if isinstance(spec, dict) else {})
+        self.slots = {attribute: np.array(indices, dtype=np.intp) for attribute, indices in slots.items()}
+        self.intensity = np.array([slot for slot, kind in self.types.items() if kind in INTENSITY_CHANNEL_TYPES], dtype=np.intp)
+        # Value -> mode number per attribute, for decoding live frames back to names
+        self.decode = {}
+        for attribute, modes in self.modes.items():
+            lut = np.full(256, -1, dtype=np.int16)
+            for number, (low, high, _) in enumerate(modes.values()):
+                lut[low:high + 1] = np.where(lut[low:high + 1] < 0, number, lut[low:high + 1])
+            self.decode[attribute] = lut
+
+    def mode_writes(self, attribute: str, mode: str):
+        """(slots, value) pairs that select a named mode, requirements first; None if unknown."""
+        spec = self.modes.get(attribute, {}).get(mode)
+        if spec is None or attribute not in self.slots:
+            return None
+        low, high, requires = spec
+        writes = []
+        for required_attribute, required_mode in requires.items():
+            writes += self.mode_writes(required_attribute, required_mode) or []
+        writes.append((self.slots[attribute], (low + high) // 2))  # Mid-band, clear of rounding at the edges
+        return writes
+
+class DmxPatch:
+    """Fixture/group patch compiled to NumPy index arrays per (target, attribute).
+
+    Targets are ("fixture", index) or ("group", index), matching the backend's effect
+    targets. update() recompiles only fixtures whose definition changed and the groups
+    that contain them, so editing one fixture does not rebuild the whole table. Writes
+    are single scatters into a flat universes*512 uint8 frame.
+    """
+
+    def __init__(self, universes: int = 1):
+        self.universes = universes
+        self.fixtures = []  # FixturePatch per fixture index
+        self.groups = []  # fixture indices per group index
+        self._signatures = []
+        self._group_signatures = []
+        self._index = {}  # (target, attribute) -> flat slot indices
+        self._modes = {}  # (target, attribute, mode) -> (slots, values) scatter
+        self._intensity_claims = None  # Fixtures claiming each slot as intensity (patches may overlap)
+        self.intensity_mask = None
+
+    def update(self, fixtures: list, groups: list) -> set:
+        """Bring the table in line with new definitions; returns the targets that were rebuilt.
+
+        Every changed fixture is compiled before anything is replaced, so a definition
+        that raises ValueError leaves the previous table intact.
+        """
+        import numpy as np
+        rebuilt = set()
+        signatures = [json.dumps(fixture, sort_keys=True) for fixture in fixtures]
+        compiled = {i: FixturePatch(fixtures[i], self.universes) for i, signature in enumerate(signatures)
+                    if i >= len(self._signatures) or self._signatures[i] != signature}
+        if self._intensity_claims is None:
+            self._intensity_claims = np.zeros(self.universes * 512, dtype=np.int32)
+            self.intensity_mask = np.zeros(self.universes * 512, dtype=bool)
+        touched = []
+        for i, patch in compiled.items():
+            if i < len(self.fixtures):
+                np.subtract.at(self._intensity_claims, self.fixtures[i].intensity, 1)
+                touched.append(self.fixtures[i].intensity)
+                self.fixtures[i] = patch
+            else:
+                self.fixtures.append(patch)
+            np.add.at(self._intensity_claims, patch.intensity, 1)
+            touched.append(patch.intensity)
+            rebuilt.add(("fixture", i))
+        for i in range(len(signatures), len(self.fixtures)):
+            np.subtract.at(self._intensity_claims, self.fixtures[i].intensity, 1)
+            touched.append(self.fixtures[i].intensity)
+            rebuilt.add(("fixture", i))
+        if touched:
+            touched = np.concatenate(touched)
+            self.intensity_mask[touched] = self._intensity_claims[touched] > 0
+        del self.fixtures[len(signatures):]
+        self._signatures = signatures
+        group_members = [[int(i) for i in group.get("fixtureIndices", []) if 0 <= int(i) < len(fixtures)] for group in groups]
+        changed_fixtures = {index for kind, index in rebuilt if kind == "fixture"}
+        for i, members in enumerate(group_members):
+            if i >= len(self.groups) or self.groups[i] != members or changed_fixtures.intersection(members):
+                rebuilt.add(("group", i))
+        for i in range(len(group_members), len(self.groups)):
+            rebuilt.add(("group", i))
+        self.groups = group_members
+        for key in [key for key in self._index if key[0] in rebuilt]:
+            del self._index[key]
+        for key in [key for key in self._modes if key[0] in rebuilt]:
+            del self._modes[key]
+        for target in rebuilt:
+            members = self._members(target)
+            if members is None:
+                continue
+            for attribute in {attribute for i in members for attribute in self.fixtures[i].slots}:
+                self._index[(target, attribute)] = np.concatenate(
+                    [self.fixtures[i].slots[attribute] for i in members if attribute in self.fixtures[i].slots])
+                for mode in {mode for i in members for mode in self.fixtures[i].modes.get(attribute, {})}:
+                    writes = [w for i in members for w in (self.fixtures[i].mode_writes(attribute, mode) or [])]
+                    slots = np.concatenate([w_slots for w_slots, _ in writes])
+                    values = np.concatenate([np.full(len(w_slots), value, dtype=np.uint8) for w_slots, value in writes])
+                    self._modes[(target, attribute, mode)] = (slots, values)
+        return rebuilt
+
+    def _members(self, target):
+        kind, index = target
+        if kind == "fixture":
+            return [index] if index < len(self.fixtures) else None
+        return self.groups[index] if index < len(self.groups) else None
+
+    def indices(self, target, attribute: str):
+        """Flat slot indices for an attribute of a fixture or group (empty when it has none)."""
+        import numpy as np
+        return self._index.get((target, attribute.lower()), np.empty(0, dtype=np.intp))
+
+    def set(self, frame, target, attribute: str, value):
+        """Write one value (or one per slot) to every slot of an attribute: a single scatter."""
+        frame.reshape(-1)[self.indices(target, attribute)] = value
 
-# Ensure virtual environment with dependencies
-if __name__ == "__main__":
-    # Only run this if we're not in a venv yet or if dependencies aren't installed
-    try:
-        import psutil
-        import rich
-        import pythonosc
-    except ImportError:
-        ensure_venv_with_deps()
+    def set_mode(self, frame, target, attribute: str, mode: str) -> bool:
+        """Select a named value range (and the modes it requires) on every fixture that has it."""
+        scatter = self._modes.get((target, attribute.lower(), mode))
+        if scatter is None:
+            return False
+        slots, values = scatter
+        frame.reshape(-1)[slots] = values
+        return True
 
-# Now import all required packages which should be available
-import psutil
-import threading
-from rich.console import Console
-from rich.panel import Panel
-from rich.layout import Layout
-from rich.live import Live
-from rich.table import Table
-from rich.progress import Progress, SpinnerColumn, TextColumn
-from rich.text import Text
-from rich.prompt import Prompt, Confirm
-from rich.syntax import Syntax
-import pythonosc
-from pythonosc import dispatcher
-from pythonosc import osc_server
+    def modes(self, target, attribute: str) -> list:
+        """Named ranges available for a target's attribute."""
+        return sorted(mode for (t, a, mode) in self._modes if t == target and a == attribute.lower())
 
-# Configuration
-BACKEND_PORT = 3000
-FRONTEND_PORT = 3001
-FRONTEND_DIR = "react-app"
-LOG_DIR = "logs"
-ERROR_LOG = "errors.log"
-OSC_PORT = 8000  # Port for monitoring OSC messages
-CONFIG_DIR = "data"
-CONFIG_FILE = os.path.join(CONFIG_DIR, "config.json")
+    def mode_of(self, frame, fixture: int, attribute: str):
+        """Decode a fixture's current value for an attribute back to a mode name, or None."""
+        patch = self.fixtures[fixture]
+        lut = patch.decode.get(attribute.lower())
+        if lut is None:
+            return None
+        number = lut[frame.reshape(-1)[patch.slots[attribute.lower()][0]]]
+        return list(patch.modes[attribute.lower()])[number] if number >= 0 else None
 
-# Initialize console
-console = Console()
+class DmxMerger:
+    """Merge per-source DMX layers: highest-takes-precedence on intensity slots, latest on the rest.
 
-# State tracking
-running_processes = {}
-osc_monitor = None
-osc_messages = []
-last_logs = []
+    Each source is a row of values, per-slot write timestamps and an active mask, plus a
+    priority; a higher-priority source owns every slot it is active on. merge() only
+    visits the slots written since the last merge: a write that raises an HTP level or
+    is the newest LTP write wins outright, so the common case costs nothing per source.
+    Only slots whose HTP winner dropped its level, or whose winner released them, are
+    recomputed across all sources. Network senders come in through feed(), which tracks
+    their priority and lets expire() drop the ones that fell silent.
+    """
+
+    def __init__(self, universes: int = 1, intensity_mask=None, capacity: int = 8):
+        import numpy as np
+        self.universes = universes
+        self.slots = universes * 512
+        self.sources = {}  # name -> row
+        self.frame = np.zeros(self.slots, dtype=np.uint8)
+        self.intensity_mask = (np.ones(self.slots, dtype=bool) if intensity_mask is None
+                               else np.asarray(intensity_mask, dtype=bool).copy())
+        self._winner = np.full(self.slots, -1, dtype=np.int32)
+        self._winner_priority = np.full(self.slots, -1, dtype=np.int32)
+        self._winner_stamp = np.zeros(self.slots, dtype=np.int64)
+        self._values = np.zeros((capacity, self.slots), dtype=np.uint8)
+        self._stamps = np.zeros((capacity, self.slots), dtype=np.int64)
+        self._active = np.zeros((capacity, self.slots), dtype=bool)
+        self._dirty = np.zeros((capacity, self.slots), dtype=bool)
+        self._priority = np.full(capacity, -1, dtype=np.int32)
+        self._free = list(range(capacity - 1, -1, -1))
+        self._dirty_rows = set()
+        self._recompute = np.zeros(self.slots, dtype=bool)
+        self._fed = {}  # name -> (last fed monotonic ns, timeout ns or None)
+        self._lock = threading.RLock()
+
+    def _grow(self):
+        """Double the number of source rows."""
+        import numpy as np
+        rows = len(self._priority)
+        for name in ("_values", "_stamps", "_active", "_dirty"):
+            layer = getattr(self, name)
+            setattr(self, name, np.concatenate([layer, np.zeros_like(layer)]))
+        self._priority = np.concatenate([self._priority, np.full(rows, -1, dtype=np.int32)])
+        self._free.extend(range(2 * rows - 1, rows - 1, -1))
+
+    def add_source(self, name: str, priority: int = 100) -> int:
+        """Register a source layer (priority >= 0); returns its row."""
+        with self._lock:
+            if name in self.sources:
+                return self.sources[name]
+            if not self._free:
+                self._grow()
+            row = self._free.pop()
+            self.sources[name] = row
+            self._priority[row] = priority
+            return row
+
+    def remove_source(self, name: str):
+        """Drop a source; slots it was winning fall back to the remaining sources."""
+        with self._lock:
+            row = self.sources.pop(name, None)
+            self._fed.pop(name, None)
+            if row is None:
+                return
+            self._recompute |= self._winner == row
+            self._active[row] = False
+            self._dirty[row] = False
+            self._dirty_rows.discard(row)
+            self._priority[row] = -1
+            self._free.append(row)
+
+    def set_priority(self, name: str, priority: int):
+        """Change a source's priority; every slot it is active on is re-decided."""
+        with self._lock:
+            row = self.sources[name]
+            self._priority[row] = priority
+            self._recompute |= self._active[row]
+
+    def write(self, name: str, slots, values, t_ns: int = None):
+        """Set flat slots of a source's layer (values may be a scalar)."""
+        t_ns = time.monotonic_ns() if t_ns is None else t_ns
+        with self._lock:
+            row = self.sources[name]
+            self._values[row, slots] = values
+            self._stamps[row, slots] = t_ns
+            self._active[row, slots] = True
+            self._dirty[row, slots] = True
+            self._dirty_rows.add(row)
+
+    def write_universe(self, name: str, universe: int, data, t_ns: int = None):
+        """Replace one universe of a source's layer, marking only the slots that changed."""
+        import numpy as np
+        t_ns = time.monotonic_ns() if t_ns is None else t_ns
+        incoming = np.frombuffer(bytes(data[:512]), dtype=np.uint8)
+        base = universe * 512
+        with self._lock:
+            row = self.sources[name]
+            window = slice(base, base + len(incoming))
+            changed = (self._values[row, window] != incoming) | ~self._active[row, window]
+            if not changed.any():
+                return
+            self._values[row, window] = incoming
+            self._stamps[row, window][changed] = t_ns
+            self._active[row, window] = True
+            self._dirty[row, window] |= changed
+            self._dirty_rows.add(row)
+
+    def feed(self, name: str, universe: int, data, t_ns: int = None, priority: int = SACN_DEFAULT_PRIORITY,
+             timeout: float = None):
+        """Write one universe from a sender, registering it on first sight and following its priority.
+
+        A sender fed with a timeout (seconds) is removed by expire() once it has been silent that long.
+        """
+        if universe >= self.universes:
+            return
+        t_ns = time.monotonic_ns() if t_ns is None else t_ns
+        with self._lock:
+            row = self.sources.get(name)
+            if row is None:
+                self.add_source(name, priority)
+            elif self._priority[row] != priority:
+                self.set_priority(name, priority)
+            self._fed[name] = (t_ns, None if timeout is None else int(timeout * 1e9))
+            self.write_universe(name, universe, data, t_ns)
+
+    def expire(self, now_ns: int = None) -> list:
+        """Remove fed senders silent past their timeout; returns their names."""
+        now_ns = time.monotonic_ns() if now_ns is None else now_ns
+        with self._lock:
+            expired = [name for name, (seen_ns, timeout_ns) in self._fed.items()
+                       if timeout_ns is not None and now_ns - seen_ns > timeout_ns]
+            for name in expired:
+                self.remove_source(name)
+        return expired
+
+    def release(self, name: str, slots=None):
+        """Stop a source controlling some slots (all when slots is None)."""
+        with self._lock:
+            row = self.sources[name]
+            slots = slice(None) if slots is None else slots
+            self._active[row, slots] = False
+            self._dirty[row, slots] = False  # A write released before the next merge never lands
+            self._recompute[slots] |= self._winner[slots] == row
+
+    def set_intensity_mask(self, mask):
+        """Switch slots between HTP (True) and LTP, e.g. from DmxPatch.intensity_mask."""
+        import numpy as np
+        with self._lock:
+            mask = np.asarray(mask, dtype=bool)
+            self._recompute |= mask != self.intensity_mask
+            self.intensity_mask = mask.copy()
+
+    def merge(self):
+        """Fold pending writes into the output frame and return it."""
+        import numpy as np
+        with self._lock:
+            for row in sorted(self._dirty_rows):
+                slots = np.flatnonzero(self._dirty[row])
+                self._dirty[row, slots] = False
+                values = self._values[row, slots]
+                stamps = self._stamps[row, slots]
+                priority = self._priority[row]
+                current_priority = self._winner_priority[slots]
+                htp = self.intensity_mask[slots]
+                outranks = priority > current_priority
+                level = priority == current_priority
+                takes = outranks | (level & np.where(htp, values >= self.frame[slots], stamps >= self._winner_stamp[slots]))
+                # An HTP winner that lowered its own level may no longer be the highest
+                self._recompute[slots[~takes & level & htp & (self._winner[slots] == row)]] = True
+                won = slots[takes]
+                self.frame[won] = values[takes]
+                self._winner[won] = row
+                self._winner_priority[won] = priority
+                self._winner_stamp[won] = stamps[takes]
+            self._dirty_rows.clear()
+            if self._recompute.any():
+                self._resolve(np.flatnonzero(self._recompute))
+                self._recompute[:] = False
+            return self.frame
+
+    def recompute(self):
+        """Re-decide every slot from scratch and return the frame (what merge() does incrementally)."""
+        import numpy as np
+        with self._lock:
+            self._resolve(np.arange(self.slots))
+            return self.frame
+
+    def owned_universes(self) -> list:
+        """Universes with at least one slot controlled by some source."""
+        with self._lock:
+            return [int(u) for u in (self._winner.reshape(self.universes, 512) >= 0).any(axis=1).nonzero()[0]]
+
+    def _resolve(self, slots):
+        """Decide slots from scratch across every source."""
+        import numpy as np
+        active = self._active[:, slots]
+        priority = np.where(active, self._priority[:, None], -1)
+        top = priority.max(axis=0)
+        candidates = priority == top
+        htp = self.intensity_mask[slots]
+        ranking = np.where(htp, self._values[:, slots].astype(np.int64), self._stamps[:, slots])
+        ranking = np.where(candidates, ranking, -1)
+        winner = ranking.argmax(axis=0)
+        unowned = top < 0
+        self.frame[slots] = np.where(unowned, 0, self._values[winner, slots])
+        self._winner[slots] = np.where(unowned, -1, winner)
+        self._winner_priority[slots] = top
+        self._winner_stamp[slots] = self._stamps[winner, slots]
 
 class ArtBastard:
     """Main application class for ArtBastard."""
@@ -109,6 +2465,29 @@ class ArtBastard:
         self.monitor_thread = None
         self.monitor_running = False
         self.osc_server = None
+        self.artnet_discovery = None
+        self.dmx_state_publisher = None
+        self.dmx_state_poller = None
+        self.tracer = None
+        self.log_capture = None
+        self.config_watcher = None
+        self.running_config = {}
+        self.backend_config = {}  # Live sections the backend last wrote or acknowledged, merged over the defaults
+        self.sacn_receiver = None
+        self.dmx_patch = None
+        self.patch_sync_thread = None
+        self.patch_error = None
+        self.dmx_merger = None
+        self.dmx_merge_senders = []
+        self.dmx_merge_inputs = {}  # receiver name -> (receiver, source listener callback)
+        self.dmx_merge_thread = None
+        self.dmx_merge_backend_thread = None
+        self.metrics = LauncherMetrics(
+            backend_pid=lambda: self.backend_pid,
+            artnet_nodes=lambda: len(self.artnet_discovery.snapshot()) if self.artnet_discovery else 0,
+        )
+        self.metrics_error = None
+        self.metrics_starter = None
 
     def _ensure_directories(self):
         """Ensure all necessary directories exist."""
@@ -120,21 +2499,153 @@ class ArtBastard:
         """Create a default config file if it doesn't exist."""
         if not os.path.exists(CONFIG_FILE):
             os.makedirs(CONFIG_DIR, exist_ok=True)
-            default_config = {
-                "artNetConfig": {
-                    "ip": "192.168.1.199",
-                    "subnet": 0,
-                    "universe": 0,
-                    "net": 0,
-                    "port": 6454,
-                    "base_refresh_interval": 1000
-                },
-                "midiMappings": {}
-            }
             with open(CONFIG_FILE, 'w') as f:
-                json.dump(default_config, f, indent=2)
+                json.dump(DEFAULT_CONFIG, f, indent=2)
             self.console.print("✨ Created default config.json file", style="green")
 
+    def _load_config(self) -> dict:
+        """Load config.json, returning an empty dict if it is missing or invalid."""
+        try:
+            with open(CONFIG_FILE, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    def start_config_watcher(self):
+        """Hot-reload config.json into the running backend."""
+        # A fresh launch has just read config.json, which also settles any change deferred while it was stopped
+        self.running_config = self._load_config()
+        self.backend_config = {section: self._live_config_value(self.running_config, section) for section in LIVE_CONFIG_EVENTS}
+        if self.config_watcher:
+            return
+        self.config_watcher = ConfigWatcher(CONFIG_FILE, self._apply_config_change)
+        self.config_watcher.start()
+        self.console.print(f"👁️ Watching {CONFIG_FILE} for changes ({self.config_watcher.mode})", style="green")
+
+    def stop_config_watcher(self):
+        """Stop watching config.json."""
+        if self.config_watcher:
+            self.config_watcher.stop()
+            self.config_watcher = None
+
+    def _apply_config_change(self, detected_ns: int):
+        """Validate and diff config.json, push live sections over Socket.IO and restart only when that is not enough."""
+        settled_ns = time.time_ns()
+        entry = {"at": datetime.now().isoformat(), "watcher": self.config_watcher.mode if self.config_watcher else None,
+                 "debounceMs": round((settled_ns - detected_ns) / 1e6, 1)}
+        try:
+            with open(CONFIG_FILE, 'r') as f:
+                new_config = json.load(f)
+            errors = validate_config(new_config)
+        except (OSError, ValueError) as e:
+            errors = [str(e)]
+        if errors:
+            entry.update(mode="rejected", errors=errors)
+            self._log_config_reload(entry)
+            return
+        changed = diff_config(self.running_config, new_config)
+        if not changed:
+            return
+        if self._backend_running():
+            # The backend's own saveConfig() lands here too; pushing it back would re-initialise dmxnet for nothing
+            held = {**self.backend_config, **self._fetch_backend_config()}
+            changed = [section for section in changed
+                       if section not in held or self._live_config_value(new_config, section) != held[section]]
+            if not changed:
+                self.running_config = new_config
+                return
+        entry["sections"] = changed
+        if not self._backend_running():
+            entry["mode"] = "deferred"
+        elif all(section in LIVE_CONFIG_EVENTS for section in changed):
+            entry["mode"] = "live"
+            push_started = time.perf_counter()
+            client = BackendSocketClient()
+            try:
+                client.connect()
+                for section in changed:
+                    value = self._live_config_value(new_config, section)
+                    self._push_config_section(client, section, value)
+                    self.backend_config[section] = value
+                entry["pushMs"] = round((time.perf_counter() - push_started) * 1000, 1)
+            except (OSError, ConnectionError, TimeoutError, RuntimeError, ValueError) as e:
+                entry.update(mode="restart", pushError=str(e))
+            finally:
+                client.close()
+        else:
+            entry["mode"] = "restart"
+        if entry["mode"] == "restart":
+            restart_started = time.perf_counter()
+            entry["ready"] = self._restart_backend()
+            if entry["ready"]:
+                self.backend_config = {section: self._live_config_value(new_config, section) for section in LIVE_CONFIG_EVENTS}
+            if entry["ready"] and self.artnet_discovery:
+                self.artnet_discovery.rebind()
+            entry["restartMs"] = round((time.perf_counter() - restart_started) * 1000, 1)
+        # Only a confirmed apply moves the baseline; otherwise the next diff must still carry these sections
+        if entry["mode"] == "live" or entry.get("ready"):
+            self.running_config = new_config
+        entry["applyMs"] = round((time.time_ns() - detected_ns) / 1e6, 1)
+        self._log_config_reload(entry)
+
+    def _live_config_value(self, config: dict, section: str):
+        """A section as the backend applies it: merged over the defaults, so a removed key reverts as on a restart."""
+        return {**DEFAULT_CONFIG.get(section, {}), **config.get(section, {})}
+
+    def _fetch_backend_config(self) -> dict:
+        """GET /api/config: the live sections the backend is running with, or {} if it can't say."""
+        import http.client
+        conn = http.client.HTTPConnection("localhost", BACKEND_PORT, timeout=1)
+        try:
+            conn.request("GET", "/api/config")
+            response = conn.getresponse()
+            body = response.read()
+            config = json.loads(body) if response.status == 200 else {}
+        except (OSError, http.client.HTTPException, ValueError):
+            return {}
+        finally:
+            conn.close()
+        if not isinstance(config, dict):
+            return {}
+        return {section: value for section, value in config.items() if section in LIVE_CONFIG_EVENTS}
+
+    def _push_config_section(self, client: BackendSocketClient, section: str, value):
+        """Emit one section's config event and wait for the backend to acknowledge it."""
+        event, ack, status = LIVE_CONFIG_EVENTS[section]
+        client.emit(event, value)
+
+        def acknowledged(name, data):
+            if name == "configError":
+                return True
+            return name == ack and (status is None or (isinstance(data, dict) and data.get("status") in (status, "error")))
+        name, data = client.wait_for(acknowledged)
+        if name == "configError" or (isinstance(data, dict) and data.get("status") == "error"):
+            raise RuntimeError(data.get("message", f"{section} rejected by the backend"))
+
+    def _log_config_reload(self, entry: dict):
+        """Append a config reload result to the reload log and report it."""
+        self.metrics.count_config_reload(entry)
+        try:
+            os.makedirs(LOG_DIR, exist_ok=True)
+            with open(CONFIG_RELOAD_LOG, 'a') as f:
+                f.write(json.dumps(entry) + "\n")
+        except OSError:
+            pass
+        sections = ", ".join(entry.get("sections", [])) or CONFIG_FILE
+        if entry["mode"] == "rejected":
+            self.console.print(f"⚠️ Ignored invalid {CONFIG_FILE}: {'; '.join(entry['errors'])}", style="yellow")
+        elif entry["mode"] == "live":
+            self.console.print(f"🔁 Applied {sections} live in {entry['applyMs']:.1f} ms", style="green")
+        elif entry["mode"] == "deferred":
+            self.console.print(f"🔁 {sections} changed; applies on next launch (backend stopped)", style="cyan")
+        else:
+            reason = entry.get("pushError") or "not applicable live"
+            if entry.get("ready"):
+                self.console.print(f"🔁 Restarted backend for {sections} ({reason}) in {entry['applyMs']:.1f} ms", style="yellow")
+            else:
+                self.console.print(f"❌ Backend not ready after restarting for {sections} ({reason}); "
+                                   f"{sections} will be retried on the next change", style="red")
+
     def _is_port_available(self, port: int) -> bool:
         """Check if a port is available."""
         sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -148,8 +2659,24 @@ class ArtBastard:
             sock.close()
         return result
 
+    def _backend_running(self) -> bool:
+        """Check that the backend process is alive, without importing psutil on POSIX."""
+        if not self.backend_pid:
+            return False
+        if os.name == "posix":
+            try:
+                os.kill(self.backend_pid, 0)
+                return True
+            except ProcessLookupError:
+                return False
+            except PermissionError:
+                return True
+        import psutil
+        return psutil.pid_exists(self.backend_pid)
+
     def _kill_process_on_port(self, port: int) -> bool:
         """Kill any process running on the specified port."""
+        import psutil
         try:
             if sys.platform == 'win32':
                 self.console.print(f"Looking for processes using port {port}...", style="yellow")
@@ -217,18 +2744,21 @@ class ArtBastard:
 
     def _kill_processes_on_ports(self):
         """Kill processes using the backend and frontend ports."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         with Progress(
             SpinnerColumn(),
             TextColumn("[bold blue]Freeing ports for the performance..."),
             console=self.console
         ) as progress:
             task = progress.add_task("", total=None)
-            self._kill_process_on_port(BACKEND_PORT)
-            self._kill_process_on_port(FRONTEND_PORT)
+            for port in (BACKEND_PORT, FRONTEND_PORT):
+                with self._span(f"kill_port:{port}"):
+                    self._kill_process_on_port(port)
             progress.update(task, completed=True)
 
     def _wait_for_service(self, url: str, max_attempts: int = 30) -> bool:
         """Wait for a service to be available at the specified URL."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         with Progress(
             SpinnerColumn(),
             TextColumn(f"[bold blue]Waiting for service at {url}..."),
@@ -274,6 +2804,7 @@ class ArtBastard:
 
     def _launch_browser(self, url):
         """Launch a browser with the given URL."""
+        import webbrowser
         self.console.print(f"『 Opening the frontend in your browser... 』", style="cyan")
         try:
             webbrowser.open(url)
@@ -285,21 +2816,19 @@ class ArtBastard:
         global last_logs
         while self.monitor_running:
             time.sleep(1)
-            if self.backend_pid and os.path.exists(f"{LOG_DIR}/backend.pid"):
-                log_files = sorted([f for f in os.listdir(LOG_DIR) if f.startswith("backend-")])
-                if log_files:
-                    latest_log = os.path.join(LOG_DIR, log_files[-1])
-                    try:
-                        with open(latest_log, 'r', errors='replace') as f:
-                            content = f.readlines()
-                            if content:
-                                last_n = min(5, len(content))
-                                last_logs = content[-last_n:]
-                    except Exception:
-                        pass
+            if self.backend_pid and self.log_capture:
+                try:
+                    content = self.log_capture.tail(5)
+                    if content:
+                        last_logs = content
+                except Exception:
+                    pass
 
     def _display_dashboard(self):
         """Display a monitoring dashboard."""
+        import psutil
+        from rich.layout import Layout
+        from rich.live import Live
         layout = Layout()
         layout.split(
             Layout(name="header", size=3),
@@ -310,6 +2839,11 @@ class ArtBastard:
             Layout(name="left", ratio=2),
             Layout(name="right", ratio=1),
         )
+        layout["right"].split(
+            Layout(name="system", size=8),
+            Layout(name="artnet"),
+            Layout(name="sacn", size=9),
+        )
         layout["left"].split(
             Layout(name="status", size=8),
             Layout(name="logs"),
@@ -344,6 +2878,31 @@ class ArtBastard:
             logs_panel = Panel(logs_content, title="Recent Logs", border_style="green")
             osc_content = "\n".join(osc_messages[-5:]) if osc_messages else "No OSC messages received"
             osc_panel = Panel(osc_content, title="OSC Messages", border_style="yellow")
+            nodes_table = Table(show_header=True, header_style="bold cyan", expand=True)
+            nodes_table.add_column("Node")
+            nodes_table.add_column("IP")
+            nodes_table.add_column("Univ")
+            nodes_table.add_column("FW")
+            nodes_table.add_column("RTT p50")
+            nodes = self.artnet_discovery.snapshot() if self.artnet_discovery else []
+            for node in nodes:
+                universes = ",".join(str(u) for u in node["universes"]) or "-"
+                rtt = node["rtt"]["p50Ms"] if node["rtt"] and node["rtt"]["count"] else None
+                nodes_table.add_row(node["shortName"] or "?", node["ip"], universes, node["firmware"],
+                                    f"≤{rtt}ms" if rtt is not None else "-")
+            if not nodes:
+                nodes_table.add_row("No nodes answered ArtPoll", "", "", "", "")
+            sacn_table = Table(show_header=True, header_style="bold cyan", expand=True)
+            sacn_table.add_column("Source")
+            sacn_table.add_column("Univ")
+            sacn_table.add_column("Prio")
+            sacn_table.add_column("Seen")
+            sources = self.sacn_receiver.sources() if self.sacn_receiver else []
+            for source in sources:
+                sacn_table.add_row(source["sourceName"] or source["cid"][:8], str(source["universe"]),
+                                   str(source["priority"]), f"{source['lastSeenMs']}ms ago")
+            if not sources:
+                sacn_table.add_row("No sACN sources" if self.sacn_receiver else "Listener stopped", "", "", "")
             footer = Panel(
                 Text("Press Ctrl+C to return to menu", justify="center"),
                 style="dim",
@@ -353,7 +2912,9 @@ class ArtBastard:
             layout["status"].update(Panel(status_table, title="Services", border_style="blue"))
             layout["logs"].update(logs_panel)
             layout["osc"].update(osc_panel)
-            layout["right"].update(Panel(system_table, title="System Metrics", border_style="magenta"))
+            layout["system"].update(Panel(system_table, title="System Metrics", border_style="magenta"))
+            layout["artnet"].update(Panel(nodes_table, title="Art-Net Nodes", border_style="cyan"))
+            layout["sacn"].update(Panel(sacn_table, title="sACN Sources", border_style="cyan"))
             layout["footer"].update(footer)
             return layout
         try:
@@ -364,8 +2925,49 @@ class ArtBastard:
         except KeyboardInterrupt:
             return
 
+    def _spawn_backend(self) -> int:
+        """Start the Node backend with its output owned by a fresh BackendLogCapture."""
+        env = os.environ.copy()
+        env["NODE_ENV"] = "production"
+        env["ARTBASTARD_LOG_CAPTURE"] = "1"
+        backend_process = subprocess.Popen(
+            ["node", "dist/launcher.js"],  # Use our new launcher.js instead of directly calling server.js
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            env=env
+        )
+        if self.log_capture:
+            self.log_capture.stop()
+        self.log_capture = BackendLogCapture()
+        self.log_capture.attach(backend_process.stdout)
+        self.backend_pid = backend_process.pid
+        if self.tracer:
+            self.tracer.track_process(self.backend_pid)
+        with open(os.path.join(LOG_DIR, "backend.pid"), 'w') as f:
+            f.write(str(self.backend_pid))
+        return self.backend_pid
+
+    def _restart_backend(self, timeout: float = 30.0) -> bool:
+        """Restart only the backend process and wait until it accepts connections again."""
+        self.metrics.backend_restarts += 1
+        self._stop_services()
+        try:
+            self._spawn_backend()
+        except Exception as e:
+            self.console.print(f"Failed to restart backend: {e}", style="red")
+            return False
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection(("127.0.0.1", BACKEND_PORT), timeout=1).close()
+                return True
+            except OSError:
+                time.sleep(0.25)
+        return False
+
     def _stop_services(self):
         """Stop backend and frontend services if they're running."""
+        import psutil
         if self.backend_pid:
             try:
                 if psutil.pid_exists(self.backend_pid):
@@ -387,6 +2989,7 @@ class ArtBastard:
             timestamp = datetime.now().strftime("%H:%M:%S.%f")[:-3]
             message = f"{timestamp} {address}: {args}"
             osc_messages.append(message)
+            self.metrics.count_osc()
             if len(osc_messages) > 100:
                 osc_messages.pop(0)
         try:
@@ -412,6 +3015,416 @@ class ArtBastard:
         else:
             self.console.print("OSC monitor is not running", style="yellow")
 
+    def start_artnet_discovery(self):
+        """Start ArtPoll discovery of Art-Net nodes."""
+        if self.artnet_discovery and self.artnet_discovery.running:
+            self.console.print("Art-Net discovery is already running", style="yellow")
+            return
+        targets = ["255.255.255.255"]
+        configured_ip = self._load_config().get("artNetConfig", {}).get("ip")
+        if configured_ip and configured_ip not in targets:
+            targets.append(configured_ip)
+        try:
+            self.artnet_discovery = ArtNetDiscovery(targets=targets)
+            self.artnet_discovery.add_dmx_listener(self.metrics.on_artnet_frame)
+            self.artnet_discovery.start()
+            self._connect_merge_input("artnet", self.artnet_discovery)
+            self.console.print(f"📡 Polling for Art-Net nodes ({', '.join(targets)})...", style="green")
+        except Exception as e:
+            self.artnet_discovery = None
+            self.console.print(f"Error starting Art-Net discovery: {e}", style="red")
+
+    def stop_artnet_discovery(self):
+        """Stop ArtPoll discovery."""
+        if self.artnet_discovery:
+            self._disconnect_merge_input("artnet")
+            self.artnet_discovery.stop()
+            self.artnet_discovery = None
+            self.console.print("Art-Net discovery stopped", style="yellow")
+
+    def start_metrics_exporter(self, port: int = METRICS_PORT, background: bool = False):
+        """Serve OpenMetrics at /metrics for unattended monitoring.
+
+        With background=True the bind and first collection run on a thread and report
+        only through the menu's status row, keeping them off the startup path.
+        """
+        if self.metrics_starter:
+            self.metrics_starter.join()
+            self.metrics_starter = None
+        if self.metrics.running:
+            return
+        if background:
+            self.metrics_starter = threading.Thread(target=self._start_metrics, args=(port, False), daemon=True)
+            self.metrics_starter.start()
+        else:
+            self._start_metrics(port, True)
+
+    def _start_metrics(self, port: int, report: bool):
+        try:
+            self.metrics.start(port=port)
+            self.metrics_error = None
+            if report:
+                self.console.print(f"📈 Serving metrics at {self.metrics.address}", style="green")
+        except OSError as e:
+            self.metrics_error = f"port {port}: {e}"
+            if report:
+                self.console.print(f"Error starting metrics exporter on port {port}: {e}", style="red")
+
+    def stop_metrics_exporter(self):
+        """Stop serving /metrics."""
+        if self.metrics_starter:
+            self.metrics_starter.join()
+            self.metrics_starter = None
+        if self.metrics.running:
+            self.metrics.stop()
+
+    def start_sacn_listener(self, universes):
+        """Join sACN multicast groups for monitoring, feeding shared memory like the Art-Net sniffer."""
+        if self.sacn_receiver and self.sacn_receiver.running:
+            self.console.print("sACN listener is already running", style="yellow")
+            return
+        try:
+            self.sacn_receiver = SacnReceiver(universes)
+            self.sacn_receiver.add_dmx_listener(self.metrics.on_sacn_frame)
+            self.sacn_receiver.start()
+        except Exception as e:
+            self.sacn_receiver = None
+            self.console.print(f"Error starting sACN listener: {e}", style="red")
+            return
+        if self.dmx_state_publisher:
+            self.sacn_receiver.add_dmx_listener(self.dmx_state_publisher.publish)
+        self._connect_merge_input("sacn", self.sacn_receiver)
+        self.console.print(f"📡 Listening for sACN on universes {', '.join(str(u) for u in self.sacn_receiver.universes)}",
+                           style="green")
+
+    def stop_sacn_listener(self):
+        """Leave the sACN multicast groups."""
+        if self.sacn_receiver:
+            self._disconnect_merge_input("sacn")
+            self.sacn_receiver.stop()
+            self.sacn_receiver = None
+            self.console.print("sACN listener stopped", style="yellow")
+
+    def start_dmx_state_publisher(self):
+        """Publish live DMX state to shared memory from the Art-Net sniffer, falling back to the backend."""
+        if self.dmx_state_publisher:
+            self.console.print("DMX state publisher is already running", style="yellow")
+            return
+        try:
+            self.dmx_state_publisher = DmxStatePublisher()
+        except Exception as e:
+            self.console.print(f"Error creating DMX shared memory: {e}", style="red")
+            return
+        if self.artnet_discovery:
+            self.artnet_discovery.add_dmx_listener(self.dmx_state_publisher.publish)
+        if self.sacn_receiver:
+            self.sacn_receiver.add_dmx_listener(self.dmx_state_publisher.publish)
+        self.dmx_state_poller = threading.Thread(target=self._poll_backend_dmx_state, daemon=True)
+        self.dmx_state_poller.start()
+        self.console.print(f"🧠 Publishing DMX state to shared memory '{self.dmx_state_publisher.name}'", style="green")
+
+    def _poll_backend_dmx_state(self):
+        """Copy the backend's output universe into shared memory unless the sniffer already sees it.
+
+        The backend unicasts to its configured node, so the sniffer usually never sees
+        its frames and this poll is the normal path. /api/dmx serves the in-memory
+        channels only and answers 304 while the frame version is unchanged.
+        """
+        publisher = self.dmx_state_publisher
+        interval = 1.0 / DMX_REFRESH_RATE
+        conn = None
+        version = None
+        universe = None
+        last_request = 0.0
+        while self.dmx_state_publisher is publisher:
+            time.sleep(interval)
+            if not self.backend_pid:
+                continue
+            # Sniffed traffic wins for the backend's universe, but keep asking once a second
+            # so a universe change in the backend's config is noticed.
+            if universe is not None and publisher.sniffed_recently(universe) and time.monotonic() - last_request < 1.0:
+                continue
+            last_request = time.monotonic()
+            conn, response, body = self._request_backend_dmx(conn, version)
+            if response is None or response.status not in (200, 304):
+                continue
+            try:
+                universe = int(response.getheader("X-DMX-Universe", "0"))
+            except ValueError:
+                universe = 0
+            # Only remember the version once its frame is published, so a frame skipped
+            # while sniffed traffic owned the universe is fetched again when that stops.
+            if response.status == 200 and body and not publisher.sniffed_recently(universe):
+                publisher.publish(universe, body[:512])
+                version = response.getheader("X-DMX-Version")
+        if conn:
+            conn.close()
+
+    def stop_dmx_state_publisher(self):
+        """Stop publishing and remove the shared-memory segment."""
+        publisher = self.dmx_state_publisher
+        if not publisher:
+            return
+        self.dmx_state_publisher = None
+        if self.artnet_discovery:
+            self.artnet_discovery.remove_dmx_listener(publisher.publish)
+        if self.sacn_receiver:
+            self.sacn_receiver.remove_dmx_listener(publisher.publish)
+        if self.dmx_state_poller:
+            self.dmx_state_poller.join(timeout=2)
+            self.dmx_state_poller = None
+        publisher.close()
+        self.console.print("DMX state publisher stopped", style="yellow")
+
+    def start_patch_sync(self):
+        """Compile the backend's fixture patch, recompiling changed fixtures whenever it is edited."""
+        if self.patch_sync_thread:
+            return
+        self.dmx_patch = DmxPatch(PATCH_UNIVERSES)
+        self.patch_error = None
+        self.patch_sync_thread = threading.Thread(target=self._sync_patch, daemon=True)
+        self.patch_sync_thread.start()
+
+    def _sync_patch(self):
+        """Poll /api/patch (304 while unchanged) and feed new definitions to DmxPatch.update()."""
+        import http.client
+        patch = self.dmx_patch
+        conn = None
+        version = None
+        while self.dmx_patch is patch:
+            if self.backend_pid:
+                try:
+                    if conn is None:
+                        conn = http.client.HTTPConnection("localhost", BACKEND_PORT, timeout=1)
+                    conn.request("GET", "/api/patch" if version is None else f"/api/patch?since={version}")
+                    response = conn.getresponse()
+                    body = response.read()
+                    if response.status == 200:
+                        definitions = json.loads(body)
+                        try:
+                            fixtures, skipped = self._valid_fixtures(definitions.get("fixtures") or [], patch.universes)
+                            patch.update(fixtures, definitions.get("groups") or [])
+                            self.patch_error = f"skipped {'; '.join(skipped)}" if skipped else None
+                            if skipped:
+                                self.console.print(f"⚠️ Fixture patch: skipped {'; '.join(skipped)}", style="yellow")
+                            merger = self.dmx_merger
+                            if merger and patch.intensity_mask is not None:
+                                merger.set_intensity_mask(patch.intensity_mask)
+                        except (ValueError, TypeError, KeyError, AttributeError, IndexError) as e:
+                            # Anything else escaping here would end patch sync for the rest of the session
+                            self.patch_error = str(e) or type(e).__name__
+                        version = definitions.get("version") if isinstance(definitions, dict) else None
+                except (OSError, ValueError, http.client.HTTPException):
+                    if conn:
+                        conn.close()
+                    conn = None
+            time.sleep(PATCH_POLL_INTERVAL)
+        if conn:
+            conn.close()
+
+    def _valid_fixtures(self, fixtures, universes: int):
+        """Blank out fixtures that would not compile; returns (fixtures, one warning per skipped fixture)."""
+        if not isinstance(fixtures, list):
+            raise ValueError("patch fixtures must be a list")
+        fixtures = list(fixtures)
+        skipped = []
+        for i, fixture in enumerate(fixtures):
+            errors = validate_fixture(fixture, universes)
+            if errors:
+                name = fixture.get("name") if isinstance(fixture, dict) else None
+                skipped.append(f"fixture {i}{f' ({name})' if name else ''}: {', '.join(errors)}")
+                fixtures[i] = {}  # An empty fixture keeps later indices, which effects target by position
+        return fixtures, skipped
+
+    def stop_patch_sync(self):
+        """Stop following the backend's fixture patch."""
+        thread = self.patch_sync_thread
+        if not thread:
+            return
+        self.dmx_patch = None
+        self.patch_sync_thread = None
+        thread.join(timeout=2)
+
+    def start_dmx_merge(self, artnet_targets=None, sacn: bool = False):
+        """Merge the backend's output with sniffed Art-Net and sACN senders into one output stream.
+
+        Every sender is its own DmxMerger layer per universe: Art-Net by source IP, sACN by
+        CID at the priority it transmits, and the backend (UI, MIDI, OSC, scenes and
+        effects all land in its channels) through /api/dmx. Patched intensity channels
+        merge HTP and everything else LTP; silent senders time out. The merged universes
+        go out through ArtNetSender and/or SacnSender at DMX_REFRESH_RATE.
+        """
+        if self.dmx_merger:
+            self.console.print("DMX merge is already running", style="yellow")
+            return
+        if not artnet_targets and not sacn:
+            self.console.print("DMX merge needs an Art-Net target or sACN output", style="red")
+            return
+        senders = []
+        try:
+            if artnet_targets:
+                senders.append(ArtNetSender(artnet_targets))
+            if sacn:
+                senders.append(SacnSender(source_name="ArtBastard merge", cid=sacn_cid("merge")))
+        except OSError as e:
+            for sender in senders:
+                sender.close()
+            self.console.print(f"Error opening DMX merge output: {e}", style="red")
+            return
+        mask = self.dmx_patch.intensity_mask if self.dmx_patch else None
+        self.dmx_merger = DmxMerger(PATCH_UNIVERSES, intensity_mask=mask)
+        self.dmx_merge_senders = senders
+        if not self.artnet_discovery:
+            self.start_artnet_discovery()
+        self._connect_merge_input("artnet", self.artnet_discovery)
+        self._connect_merge_input("sacn", self.sacn_receiver)
+        self.dmx_merge_thread = threading.Thread(target=self._run_dmx_merge, daemon=True)
+        self.dmx_merge_thread.start()
+        self.dmx_merge_backend_thread = threading.Thread(target=self._feed_backend_merge_layer, daemon=True)
+        self.dmx_merge_backend_thread.start()
+        outputs = ([f"Art-Net {', '.join(artnet_targets)}"] if artnet_targets else []) + (["sACN"] if sacn else [])
+        self.console.print(f"🔀 Merging {', '.join(['backend', *self.dmx_merge_inputs])} into {' + '.join(outputs)}",
+                           style="green")
+
+    def _connect_merge_input(self, name: str, receiver):
+        """Feed a receiver's senders into the merge, one layer each, ignoring the merge's own output."""
+        merger = self.dmx_merger
+        if not merger or receiver is None or name in self.dmx_merge_inputs:
+            return
+        for sender in self.dmx_merge_senders:
+            if isinstance(sender, ArtNetSender) and isinstance(receiver, ArtNetDiscovery):
+                receiver.ignore_ports.add(sender.local_port)
+            elif isinstance(sender, SacnSender) and isinstance(receiver, SacnReceiver):
+                receiver.ignore_cids.add(sender.cid)
+        timeout = ARTNET_SOURCE_TIMEOUT if name == "artnet" else SACN_SOURCE_TIMEOUT
+
+        def callback(sender, universe, data, t_ns, priority):
+            layer = f"{name}:{sender}:{universe}"
+            if data is None:
+                merger.remove_source(layer)
+            else:
+                merger.feed(layer, universe, data, t_ns, SACN_DEFAULT_PRIORITY if priority is None else priority, timeout)
+        receiver.add_source_listener(callback)
+        self.dmx_merge_inputs[name] = (receiver, callback)
+
+    def _disconnect_merge_input(self, name: str):
+        """Detach a receiver; the slots its senders were winning fall back to the other layers."""
+        entry = self.dmx_merge_inputs.pop(name, None)
+        if entry is None:
+            return
+        entry[0].remove_source_listener(entry[1])
+        if self.dmx_merger:
+            for layer in [layer for layer in list(self.dmx_merger.sources) if layer.startswith(f"{name}:")]:
+                self.dmx_merger.remove_source(layer)
+
+    def _feed_backend_merge_layer(self):
+        """Poll the backend's output frame (/api/dmx, 304 while unchanged) into the merge as the "backend" layer."""
+        merger = self.dmx_merger
+        interval = 1.0 / DMX_REFRESH_RATE
+        conn = None
+        version = None
+        universe = None
+        while self.dmx_merger is merger:
+            time.sleep(interval)
+            response = None
+            if self.backend_pid:
+                conn, response, body = self._request_backend_dmx(conn, version)
+            if response is None:
+                # Backend gone: its levels must not stay frozen in the merge
+                merger.remove_source("backend")
+                version = universe = None
+                continue
+            if response.status != 200 or not body:
+                continue
+            try:
+                frame_universe = int(response.getheader("X-DMX-Universe", "0"))
+            except ValueError:
+                frame_universe = 0
+            if universe is not None and frame_universe != universe and universe < merger.universes:
+                merger.release("backend", slice(universe * 512, (universe + 1) * 512))
+            universe = frame_universe
+            merger.feed("backend", universe, body[:512])
+            version = response.getheader("X-DMX-Version")
+        if conn:
+            conn.close()
+
+    def _request_backend_dmx(self, conn, version):
+        """GET /api/dmx on a kept-alive connection; returns (conn, response, body), or (None, None, None) on failure."""
+        import http.client
+        try:
+            if conn is None:
+                conn = http.client.HTTPConnection("localhost", BACKEND_PORT, timeout=1)
+            conn.request("GET", "/api/dmx" if version is None else f"/api/dmx?since={version}")
+            response = conn.getresponse()
+            return conn, response, response.read()
+        except (OSError, http.client.HTTPException):
+            if conn:
+                conn.close()
+            return None, None, None
+
+    def _run_dmx_merge(self):
+        """Merge and send at DMX rate; unchanged universes are resent once a second as a keep-alive."""
+        merger = self.dmx_merger
+        senders = self.dmx_merge_senders
+        interval = 1.0 / DMX_REFRESH_RATE
+        last_frames = {}
+        last_sent = {}
+        next_tick = time.monotonic()
+        while self.dmx_merger is merger:
+            merger.expire()
+            frame = merger.merge()
+            now = time.monotonic()
+            sent = False
+            for universe in merger.owned_universes():
+                data = frame[universe * 512:(universe + 1) * 512].tobytes()
+                if data == last_frames.get(universe) and now - last_sent.get(universe, 0) < 1.0:
+                    continue
+                last_frames[universe] = data
+                last_sent[universe] = now
+                for sender in senders:
+                    try:
+                        sender.send(universe, data)
+                        sent = True
+                    except OSError:
+                        pass
+            if sent:
+                for sender in senders:
+                    sync = getattr(sender, "sync", None)
+                    if sync is not None:
+                        try:
+                            sync()
+                        except OSError:
+                            pass
+            next_tick += interval
+            delay = next_tick - time.monotonic()
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                next_tick = time.monotonic()
+
+    def stop_dmx_merge(self):
+        """Stop merging, detach the inputs and terminate the output streams."""
+        merger = self.dmx_merger
+        if not merger:
+            return
+        for name in list(self.dmx_merge_inputs):
+            self._disconnect_merge_input(name)
+        self.dmx_merger = None
+        if self.dmx_merge_thread:
+            self.dmx_merge_thread.join(timeout=2)
+            self.dmx_merge_thread = None
+        if self.dmx_merge_backend_thread:
+            self.dmx_merge_backend_thread.join(timeout=2)
+            self.dmx_merge_backend_thread = None
+        for sender in self.dmx_merge_senders:
+            if self.artnet_discovery and isinstance(sender, ArtNetSender):
+                self.artnet_discovery.ignore_ports.discard(sender.local_port)
+            if self.sacn_receiver and isinstance(sender, SacnSender):
+                self.sacn_receiver.ignore_cids.discard(sender.cid)
+            sender.close()
+        self.dmx_merge_senders = []
+        self.console.print("DMX merge stopped", style="yellow")
+
     def start_system_monitor(self):
         """Start monitoring system metrics."""
         if self.monitor_thread and self.monitor_running:
@@ -433,6 +3446,7 @@ class ArtBastard:
 
     def system_setup(self):
         """Install system dependencies."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         self.console.print("🎪 Preparing the Stage (System Setup)", style="bold cyan")
         
         # Check if npm is in PATH
@@ -503,6 +3517,7 @@ class ArtBastard:
 
     def clear_cache(self):
         """Clear node_modules and dist directories."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         self.console.print("🧹 Clearing the Canvas (Cache Cleaning)", style="bold cyan")
         if not Confirm.ask("『 Shall we purify the artistic workspace? 』"):
             return
@@ -531,6 +3546,7 @@ class ArtBastard:
 
     def rebuild_system(self):
         """Rebuild the entire system."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         self.console.print("🎨 Reinventing the Canvas (Rebuild)", style="bold cyan")
         if not Confirm.ask("This will rebuild the entire system. Continue?"):
             return
@@ -560,6 +3576,7 @@ class ArtBastard:
 
     def show_midi_info(self):
         """Display information about MIDI interfaces."""
+        from rich.syntax import Syntax
         self.console.print("🎹 Surveying the Musical Landscape (MIDI Info)", style="bold cyan")
         if not os.path.exists("dist/index.js"):
             self.console.print("Backend not built yet. Please build the backend first.", style="red")
@@ -587,6 +3604,8 @@ class ArtBastard:
             self.console.print("No logs found!", style="red")
             return
         log_files = ["errors.log"] + [f for f in os.listdir(LOG_DIR) if os.path.isfile(os.path.join(LOG_DIR, f))]
+        if os.path.isdir(BACKEND_LOG_DIR):
+            log_files += [os.path.join("backend", f) for f in sorted(os.listdir(BACKEND_LOG_DIR)) if f.endswith((".log", ".log.gz"))]
         self.console.print("Select a log file to view:", style="cyan")
         for i, log_file in enumerate(log_files):
             self.console.print(f"[{i}] {log_file}")
@@ -600,8 +3619,13 @@ class ArtBastard:
                 else:
                     log_path = os.path.join(LOG_DIR, selected_log)
                 if os.path.exists(log_path):
-                    with open(log_path, 'r', errors='replace') as f:
-                        log_content = f.read()
+                    if log_path.endswith(".gz"):
+                        import gzip
+                        with gzip.open(log_path, 'rt', errors='replace') as f:
+                            log_content = f.read()
+                    else:
+                        with open(log_path, 'r', errors='replace') as f:
+                            log_content = f.read()
                     pager = subprocess.Popen(['less'], stdin=subprocess.PIPE)
                     pager.communicate(input=log_content.encode())
                 else:
@@ -611,8 +3635,116 @@ class ArtBastard:
         except ValueError:
             self.console.print("Invalid input!", style="red")
 
+    def record_dmx(self):
+        """Record incoming Art-Net DMX frames to a file until Ctrl+C."""
+        self.console.print("⏺️ Capturing the Light (Record DMX)", style="bold cyan")
+        universes_answer = Prompt.ask("Universes to record (comma separated, blank for all)", default="")
+        try:
+            universes = [int(u) for u in universes_answer.split(",") if u.strip()]
+        except ValueError:
+            self.console.print("Invalid universe list!", style="red")
+            return
+        if not self.artnet_discovery:
+            self.start_artnet_discovery()
+        if not self.artnet_discovery:
+            return
+        os.makedirs(RECORDINGS_DIR, exist_ok=True)
+        path = os.path.join(RECORDINGS_DIR, f"dmx-{datetime.now().strftime('%Y%m%d%H%M%S')}.abdmx")
+        recorder = DmxRecorder(path, universes or None)
+        # Detach from the receivers this recording attached to, whatever happens to self's meanwhile
+        receivers = [receiver for receiver in (self.artnet_discovery, self.sacn_receiver) if receiver]
+        with self._ctrl_c_interrupts():
+            try:
+                for receiver in receivers:
+                    receiver.add_dmx_listener(recorder.on_frame)
+                self.console.print(f"『 Recording to {path} - press Ctrl+C to stop 』", style="green")
+                while True:
+                    time.sleep(0.5)
+                    stats = recorder.stats()
+                    self.console.print(f"  {stats['frames']} frames, universes {stats['universes']}", end="\r")
+            except KeyboardInterrupt:
+                pass
+            finally:
+                try:
+                    for receiver in receivers:
+                        receiver.remove_dmx_listener(recorder.on_frame)
+                finally:
+                    stats = recorder.close()
+        self.console.print()
+        self.console.print(f"✨ Recorded {stats['frames']} frames ({stats['keyframes']} keyframes) "
+                           f"from universes {stats['universes']}", style="green")
+        self.console.print(f"   {stats['rawBytes']} bytes of ArtDmx stored in {stats['fileBytes']} bytes "
+                           f"(compression {stats['compressionRatio']}x)", style="green")
+
+    @contextlib.contextmanager
+    def _ctrl_c_interrupts(self):
+        """Make Ctrl+C raise KeyboardInterrupt for the duration instead of running main()'s exit handler."""
+        if threading.current_thread() is not threading.main_thread():
+            yield
+            return
+        previous = signal.signal(signal.SIGINT, signal.default_int_handler)
+        try:
+            yield
+        finally:
+            signal.signal(signal.SIGINT, previous)
+
+    def play_recording(self):
+        """Replay a DMX recording over Art-Net unicast or sACN multicast."""
+        self.console.print("▶️ Reviving the Light (Play DMX Recording)", style="bold cyan")
+        recordings = sorted(f for f in os.listdir(RECORDINGS_DIR) if f.endswith(".abdmx")) if os.path.isdir(RECORDINGS_DIR) else []
+        if not recordings:
+            self.console.print("No recordings found!", style="red")
+            return
+        for i, recording in enumerate(recordings):
+            self.console.print(f"[{i}] {recording}")
+        try:
+            choice = int(Prompt.ask("Enter number", default=str(len(recordings) - 1)))
+            path = os.path.join(RECORDINGS_DIR, recordings[choice])
+            speed = float(Prompt.ask("Playback speed", default="1.0"))
+            start = float(Prompt.ask("Start at second", default="0"))
+        except (ValueError, IndexError):
+            self.console.print("Invalid input!", style="red")
+            return
+        output = Prompt.ask("Output protocol", choices=["artnet", "sacn"], default="artnet")
+        if output == "sacn":
+            try:
+                priority = int(Prompt.ask("sACN priority (0-200)", default=str(SACN_DEFAULT_PRIORITY)))
+                sync_universe = int(Prompt.ask("sACN sync universe (0 for none)", default="0"))
+            except ValueError:
+                self.console.print("Invalid input!", style="red")
+                return
+            target_ip = "sACN multicast"
+        else:
+            target_ip = Prompt.ask("Send Art-Net to", default=self._load_config().get("artNetConfig", {}).get("ip", "255.255.255.255"))
+        try:
+            playback = DmxPlayback(path)
+        except (OSError, ValueError) as e:
+            self.console.print(f"Error opening recording: {e}", style="red")
+            return
+        sender = SacnSender(max(0, min(200, priority)), sync_universe) if output == "sacn" else ArtNetSender(target_ip)
+        self.console.print(f"『 Playing {recordings[choice]} ({playback.duration_ns / 1e9:.1f}s) to {target_ip} "
+                           f"at {speed}x - press Ctrl+C to stop 』", style="green")
+        stop_event = threading.Event()
+        result = {}
+        player = threading.Thread(target=lambda: result.update(playback.play(sender, speed, start, stop_event)), daemon=True)
+        with self._ctrl_c_interrupts():
+            try:
+                player.start()
+                while player.is_alive():
+                    player.join(timeout=0.5)
+            except KeyboardInterrupt:
+                stop_event.set()
+                player.join(timeout=2)
+            finally:
+                sender.close()
+                playback.close()
+        if result.get("frames"):
+            self.console.print(f"✨ Sent {result['frames']} frames; jitter mean {result['jitterMeanUs']}µs, "
+                               f"p99 {result['jitterP99Us']}µs, max {result['jitterMaxUs']}µs", style="green")
+
     def update_from_github(self):
         """Update from GitHub repository."""
+        from rich.progress import Progress, SpinnerColumn, TextColumn
         self.console.print("⬆️ Channeling the Latest Inspiration (Update)", style="bold cyan")
         if not Confirm.ask("『 Shall we fetch the latest artistic inspiration? 』"):
             return
@@ -639,117 +3771,158 @@ class ArtBastard:
         if bypass_typescript:
             title = "🎭✨ Commencing the Performance (Bypass TypeScript)"
         self.console.print(title, style="bold cyan")
-        self.console.print("DEBUG: Starting launch process...", style="yellow")
-        self._kill_processes_on_ports()
-        if not self._is_port_available(BACKEND_PORT):
-            self.console.print(f"『 Port {BACKEND_PORT} is still in use even after cleanup. Please investigate further. 』", 
-                            style="red")
-            Prompt.ask("Press Enter to continue...", default="")
-            return False
-        if not self._is_port_available(FRONTEND_PORT):
-            self.console.print(f"『 Port {FRONTEND_PORT} is still in use even after cleanup. Please investigate further. 』", 
-                            style="red")
+        self.tracer = LaunchTracer(bypassTypescript=bypass_typescript)
+        try:
+            launched = self._launch_phases(bypass_typescript)
+        finally:
+            tracer, self.tracer = self.tracer, None
+            summary = tracer.finish("ready" if tracer.ready_ns else "failed")
+            self.metrics.record_launch(summary)
+            self._report_launch_trace(summary)
+        if not launched:
             Prompt.ask("Press Enter to continue...", default="")
             return False
-        if not os.path.exists("node_modules") or not os.path.exists(os.path.join(FRONTEND_DIR, "node_modules")):
-            self.console.print("DEBUG: node_modules not found, running system setup", style="yellow")
-            self.system_setup()
+        self.console.print("DEBUG: Launching dashboard", style="yellow")
+        try:
+            time.sleep(1)
+            self._display_dashboard()
+        except KeyboardInterrupt:
+            self.console.print("DEBUG: Dashboard interrupted", style="yellow")
+
+    def _span(self, name: str, **args):
+        """Trace a launch phase when a launch is in progress."""
+        if self.tracer:
+            return self.tracer.span(name, **args)
+        return contextlib.nullcontext(args)
+
+    def _report_launch_trace(self, summary: dict):
+        """Print where the launch time went and flag time-to-ready regressions."""
+        phases = ", ".join(f"{name} {ms / 1000:.1f}s" for name, ms in summary["phases"].items())
+        self.console.print(f"⏱️ Launch trace: {phases} → {summary['traceFile']}", style="dim")
+        baseline = summary.get("baselineTimeToReadyMs")
+        if summary.get("timeToReadyMs") and baseline and summary["timeToReadyMs"] > baseline * LAUNCH_REGRESSION_FACTOR:
+            self.console.print(f"『 Time to ready was {summary['timeToReadyMs'] / 1000:.1f}s, "
+                               f"against a recent median of {baseline / 1000:.1f}s 』", style="yellow")
+
+    def _launch_phases(self, bypass_typescript: bool) -> bool:
+        """Run every launch phase up to monitor start; returns False on failure."""
+        import psutil
+        self.console.print("DEBUG: Starting launch process...", style="yellow")
+        # Normally already serving since startup; failed and stalled launches must be scrapeable too
+        with self._span("metrics_exporter"):
+            self.start_metrics_exporter()
+        with self._span("port_cleanup"):
+            self._kill_processes_on_ports()
+            for port in (BACKEND_PORT, FRONTEND_PORT):
+                if not self._is_port_available(port):
+                    self.console.print(f"『 Port {port} is still in use even after cleanup. Please investigate further. 』", 
+                                    style="red")
+                    return False
+        with self._span("dependency_check") as span:
+            span["nodeModules"] = os.path.exists("node_modules") and os.path.exists(os.path.join(FRONTEND_DIR, "node_modules"))
+            if not span["nodeModules"]:
+                self.console.print("DEBUG: node_modules not found, running system setup", style="yellow")
+                with self._span("system_setup"):
+                    self.system_setup()
         self.console.print(f"DEBUG: Checking for dist directory. Exists: {os.path.exists('dist')}", style="yellow")
-        if not os.path.exists("dist") or bypass_typescript:
-            self.console.print("『 Composing the Backend Movement... 』", style="cyan")
-            os.makedirs(os.path.dirname(ERROR_LOG), exist_ok=True)
-            self.console.print("DEBUG: Running npm build-backend", style="yellow")
-            with open(ERROR_LOG, "a") as error_file:
-                try:
-                    result = subprocess.run(
-                        ["npm", "run", "build-backend"],
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        check=False
-                    )
-                    error_file.write(result.stdout)
-                    error_file.write(result.stderr)
-                    self.console.print(f"DEBUG: Build process return code: {result.returncode}", style="yellow")
-                except Exception as e:
-                    self.console.print(f"DEBUG: Error during build: {str(e)}", style="red")
-                    error_file.write(f"\nException during build: {str(e)}\n")
-            if not os.path.exists("dist"):
-                self.console.print("『 Backend build failed! Check errors.log for details. 』", style="red")
-                Prompt.ask("Press Enter to continue...", default="")
-                return False
+        with self._span("backend_build") as span:
+            span["skipped"] = os.path.exists("dist") and not bypass_typescript
+            if not span["skipped"]:
+                self.console.print("『 Composing the Backend Movement... 』", style="cyan")
+                os.makedirs(os.path.dirname(ERROR_LOG) or ".", exist_ok=True)
+                self.console.print("DEBUG: Running npm build-backend", style="yellow")
+                with open(ERROR_LOG, "a") as error_file:
+                    try:
+                        result = subprocess.run(
+                            ["npm", "run", "build-backend"],
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                            text=True,
+                            check=False
+                        )
+                        error_file.write(result.stdout)
+                        error_file.write(result.stderr)
+                        span["returncode"] = result.returncode
+                        self.console.print(f"DEBUG: Build process return code: {result.returncode}", style="yellow")
+                    except Exception as e:
+                        self.console.print(f"DEBUG: Error during build: {str(e)}", style="red")
+                        error_file.write(f"\nException during build: {str(e)}\n")
+                if not os.path.exists("dist"):
+                    self.console.print("『 Backend build failed! Check errors.log for details. 』", style="red")
+                    return False
         self.console.print("『 Creating the Visual Canvas (Building React Frontend)... 』", style="cyan")
-        react_dist_exists = os.path.exists(os.path.join(FRONTEND_DIR, "dist"))
-        self.console.print(f"DEBUG: React dist directory exists: {react_dist_exists}", style="yellow")
-        if not react_dist_exists or bypass_typescript:
-            current_dir = os.getcwd()
-            os.chdir(FRONTEND_DIR)
-            build_command = "npm run build"
-            if bypass_typescript:
-                self.console.print("『 Bypassing TypeScript for React Build... 』", style="cyan")
-                build_command = "node ../build-without-typechecking.js"
-            self.console.print(f"DEBUG: Running React build command: {build_command}", style="yellow")
-            with open(os.path.join("..", ERROR_LOG), "a") as error_file:
-                try:
-                    build_result = subprocess.run(
-                        build_command.split(),
-                        stdout=subprocess.PIPE,
-                        stderr=subprocess.PIPE,
-                        text=True,
-                        check=False
-                    )
-                    error_file.write("\n=== REACT BUILD OUTPUT ===\n")
-                    error_file.write(build_result.stdout)
-                    error_file.write(build_result.stderr)
-                    self.console.print(f"DEBUG: React build return code: {build_result.returncode}", style="yellow")
-                    if build_result.returncode != 0:
-                        self.console.print("『 React build had errors but we'll continue anyway. Check errors.log for details. 』", style="yellow")
-                except Exception as e:
-                    self.console.print(f"DEBUG: Error during React build: {str(e)}", style="red")
-                    error_file.write(f"\nException during React build: {str(e)}\n")
-            os.chdir(current_dir)
+        with self._span("react_build") as span:
             react_dist_exists = os.path.exists(os.path.join(FRONTEND_DIR, "dist"))
-            self.console.print(f"DEBUG: React dist directory exists after build: {react_dist_exists}", style="yellow")
+            self.console.print(f"DEBUG: React dist directory exists: {react_dist_exists}", style="yellow")
+            span["skipped"] = react_dist_exists and not bypass_typescript
+            if not span["skipped"]:
+                current_dir = os.getcwd()
+                os.chdir(FRONTEND_DIR)
+                build_command = "npm run build"
+                if bypass_typescript:
+                    self.console.print("『 Bypassing TypeScript for React Build... 』", style="cyan")
+                    build_command = "node ../build-without-typechecking.js"
+                self.console.print(f"DEBUG: Running React build command: {build_command}", style="yellow")
+                with open(os.path.join("..", ERROR_LOG), "a") as error_file:
+                    try:
+                        build_result = subprocess.run(
+                            build_command.split(),
+                            stdout=subprocess.PIPE,
+                            stderr=subprocess.PIPE,
+                            text=True,
+                            check=False
+                        )
+                        error_file.write("\n=== REACT BUILD OUTPUT ===\n")
+                        error_file.write(build_result.stdout)
+                        error_file.write(build_result.stderr)
+                        span["returncode"] = build_result.returncode
+                        self.console.print(f"DEBUG: React build return code: {build_result.returncode}", style="yellow")
+                        if build_result.returncode != 0:
+                            self.console.print("『 React build had errors but we'll continue anyway. Check errors.log for details. 』", style="yellow")
+                    except Exception as e:
+                        self.console.print(f"DEBUG: Error during React build: {str(e)}", style="red")
+                        error_file.write(f"\nException during React build: {str(e)}\n")
+                os.chdir(current_dir)
+                react_dist_exists = os.path.exists(os.path.join(FRONTEND_DIR, "dist"))
+                self.console.print(f"DEBUG: React dist directory exists after build: {react_dist_exists}", style="yellow")
         if not os.path.exists("dist/index.js"):
             self.console.print("DEBUG: dist/index.js does not exist after build!", style="red")
-            Prompt.ask("Press Enter to continue...", default="")
             return False
         else:
             self.console.print("DEBUG: dist/index.js exists, continuing", style="green")
         self.console.print("『 The Conductor Takes Position... 』", style="cyan")
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        backend_log = f"{LOG_DIR}/backend-{timestamp}.log"
-        os.makedirs(os.path.join("dist", "data"), exist_ok=True)
-        os.makedirs(os.path.join("dist", "logs"), exist_ok=True)
-        self._create_default_config()
-        env = os.environ.copy()
-        env["NODE_ENV"] = "production"
-        self.console.print("DEBUG: Starting backend process with Node.js", style="yellow")
-        try:
-            backend_process = subprocess.Popen(
-                ["node", "dist/launcher.js"],  # Use our new launcher.js instead of directly calling server.js
-                stdout=open(backend_log, 'w'),
-                stderr=subprocess.STDOUT,
-                env=env
-            )
-            self.backend_pid = backend_process.pid
-            self.console.print(f"DEBUG: Backend process started with PID {self.backend_pid}", style="green")
-            with open(os.path.join(LOG_DIR, "backend.pid"), 'w') as f:
-                f.write(str(self.backend_pid))
-        except Exception as e:
-            self.console.print(f"DEBUG: Failed to start backend process: {str(e)}", style="red")
-            Prompt.ask("Press Enter to continue...", default="")
-            return False
+        with self._span("process_spawn") as span:
+            os.makedirs(os.path.join("dist", "data"), exist_ok=True)
+            os.makedirs(os.path.join("dist", "logs"), exist_ok=True)
+            self._create_default_config()
+            with self._span("artnet_discovery_start"):
+                self.console.print("DEBUG: Starting Art-Net discovery", style="yellow")
+                self.start_artnet_discovery()
+                if not self.dmx_state_publisher:
+                    self.start_dmx_state_publisher()
+            self.console.print("DEBUG: Starting backend process with Node.js", style="yellow")
+            try:
+                self._spawn_backend()
+                span["logDir"] = BACKEND_LOG_DIR
+                span["pid"] = self.backend_pid
+                self.console.print(f"DEBUG: Backend process started with PID {self.backend_pid}", style="green")
+            except Exception as e:
+                self.console.print(f"DEBUG: Failed to start backend process: {str(e)}", style="red")
+                return False
         backend_url = f"http://localhost:{BACKEND_PORT}"
         self.console.print(f"DEBUG: Waiting for backend at {backend_url}", style="yellow")
-        if not self._wait_for_service(backend_url, 30):
+        with self._span("readiness_wait", url=backend_url):
+            ready = self._wait_for_service(backend_url, 30)
+            if ready:
+                self.tracer.mark_ready()
+        if ready and self.artnet_discovery:
+            self.artnet_discovery.rebind()  # The backend has bound the Art-Net port; take unicast replies back
+        if not ready:
             self.console.print("『 Backend server failed to start. Check logs for details. 』", style="red")
             self.console.print("Last lines of backend log:", style="red")
             try:
-                with open(backend_log, 'r') as f:
-                    last_lines = f.readlines()[-20:]
-                    for line in last_lines:
-                        self.console.print(line.rstrip(), style="red")
+                for line in self.log_capture.tail(20):
+                    self.console.print(line.rstrip(), style="red")
             except:
                 self.console.print("Could not read log file", style="red")
             if self.backend_pid:
@@ -757,12 +3930,19 @@ class ArtBastard:
                     psutil.Process(self.backend_pid).terminate()
                 except:
                     pass
-            Prompt.ask("Press Enter to continue...", default="")
             return False
         self.console.print(f"『 Backend server started successfully on port {BACKEND_PORT}! 』", style="green")
+        if self.artnet_discovery:
+            configured_ip = self._load_config().get("artNetConfig", {}).get("ip")
+            nodes = self.artnet_discovery.snapshot()
+            if configured_ip and nodes and not self.artnet_discovery.find(configured_ip):
+                found = ", ".join(sorted({node["ip"] for node in nodes}))
+                self.console.print(f"『 Configured Art-Net IP {configured_ip} did not answer ArtPoll; discovered: {found} 』",
+                                   style="yellow")
         self.console.print("『 React application is being served by the backend 』", style="cyan")
-        self.console.print("DEBUG: Launching browser", style="yellow")
-        self._launch_browser(backend_url)
+        with self._span("browser_launch"):
+            self.console.print("DEBUG: Launching browser", style="yellow")
+            self._launch_browser(backend_url)
         self.console.print(Panel(
             Text(f"""
             ✧･ﾟ: *✧･ﾟ:* 『 The Stage Awaits 』 *:･ﾟ✧*:･ﾟ✧
@@ -775,18 +3955,18 @@ class ArtBastard:
             style="bold cyan",
             border_style="cyan"
         ))
-        self.console.print("DEBUG: Starting OSC monitor", style="yellow")
-        self.start_osc_monitor()
-        self.console.print("DEBUG: Starting system monitor", style="yellow")
-        self.start_system_monitor()
-        self.console.print("DEBUG: Launching dashboard", style="yellow")
-        try:
-            time.sleep(1)
-            self._display_dashboard()
-        except KeyboardInterrupt:
-            self.console.print("DEBUG: Dashboard interrupted", style="yellow")
-        finally:
-            pass
+        with self._span("monitor_start"):
+            with self._span("osc_monitor"):
+                self.console.print("DEBUG: Starting OSC monitor", style="yellow")
+                self.start_osc_monitor()
+            with self._span("system_monitor"):
+                self.console.print("DEBUG: Starting system monitor", style="yellow")
+                self.start_system_monitor()
+            with self._span("config_watcher"):
+                self.start_config_watcher()
+            with self._span("patch_sync"):
+                self.start_patch_sync()
+        return True
 
     def show_menu(self):
         """Display the main menu and handle user selection."""
@@ -806,10 +3986,37 @@ class ArtBastard:
             status_table = Table(show_header=True, header_style="bold magenta")
             status_table.add_column("Service")
             status_table.add_column("Status")
-            backend_status = "✅ Running" if self.backend_pid and psutil.pid_exists(self.backend_pid) else "❌ Stopped"
+            backend_status = "✅ Running" if self._backend_running() else "❌ Stopped"
             status_table.add_row("Backend", backend_status)
             osc_status = "✅ Running" if self.osc_server else "❌ Stopped"
             status_table.add_row("OSC Monitor", osc_status)
+            if self.artnet_discovery and self.artnet_discovery.running:
+                artnet_status = f"✅ {len(self.artnet_discovery.snapshot())} node(s)"
+            else:
+                artnet_status = "❌ Stopped"
+            status_table.add_row("Art-Net Discovery", artnet_status)
+            shm_status = f"✅ {self.dmx_state_publisher.name}" if self.dmx_state_publisher else "❌ Stopped"
+            status_table.add_row("DMX Shared Memory", shm_status)
+            if self.metrics.running:
+                metrics_status = f"✅ {self.metrics.address}"
+            else:
+                metrics_status = f"⚠️ {self.metrics_error}" if self.metrics_error else "❌ Stopped"
+            status_table.add_row("Metrics Exporter", metrics_status)
+            sacn_status = (f"✅ Universes {', '.join(str(u) for u in self.sacn_receiver.universes)}"
+                           if self.sacn_receiver else "❌ Stopped")
+            status_table.add_row("sACN Listener", sacn_status)
+            watcher_status = f"✅ {self.config_watcher.mode}" if self.config_watcher else "❌ Stopped"
+            status_table.add_row("Config Hot-Reload", watcher_status)
+            if self.patch_error:
+                patch_status = f"⚠️ {self.patch_error}"
+            elif self.dmx_patch:
+                patch_status = f"✅ {len(self.dmx_patch.fixtures)} fixture(s), {len(self.dmx_patch.groups)} group(s)"
+            else:
+                patch_status = "❌ Stopped"
+            status_table.add_row("Fixture Patch", patch_status)
+            merge_status = (f"✅ {len(self.dmx_merger.sources)} layer(s) from {', '.join(['backend', *self.dmx_merge_inputs])}"
+                            if self.dmx_merger else "❌ Stopped")
+            status_table.add_row("DMX Merge", merge_status)
             self.console.print(Panel(status_table, title="Service Status", border_style="magenta"))
             menu_options = {
                 'L': "🎭 [L]aunch All (Regular TypeScript)",
@@ -821,6 +4028,10 @@ class ArtBastard:
                 'B': "🎭✨ [B]ypass TypeScript Launch",
                 'D': "📊 [D]ashboard",
                 'O': "🔍 [O]SC Monitoring Toggle",
+                'N': "📡 s[N]ACN Listener Toggle",
+                'G': "🔀 Mer[G]e Stage Toggle",
+                'C': "⏺️ [C]apture DMX Recording",
+                'P': "▶️ [P]lay DMX Recording",
                 'X': "🛑 Stop [X] All Services",
                 'Q': "🌙 [Q]uit"
             }
@@ -860,18 +4071,49 @@ class ArtBastard:
                             self.start_osc_monitor()
                         if not self.monitor_running:
                             self.start_system_monitor()
+                        if not self.artnet_discovery:
+                            self.start_artnet_discovery()
                         self._display_dashboard()
                 elif choice == 'O':
                     if self.osc_server:
                         self.stop_osc_monitor()
                     else:
                         self.start_osc_monitor()
+                elif choice == 'N':
+                    if self.sacn_receiver:
+                        self.stop_sacn_listener()
+                    else:
+                        answer = Prompt.ask("sACN universes to monitor (comma separated)", default="1")
+                        try:
+                            self.start_sacn_listener([int(u) for u in answer.split(",") if u.strip()])
+                        except ValueError:
+                            self.console.print("Invalid universe list!", style="red")
+                elif choice == 'G':
+                    if self.dmx_merger:
+                        self.stop_dmx_merge()
+                    else:
+                        answer = Prompt.ask("Merged output (Art-Net IPs and/or 'sacn', comma separated)",
+                                            default=self._load_config().get("artNetConfig", {}).get("ip", "sacn"))
+                        outputs = [item.strip() for item in answer.split(",") if item.strip()]
+                        self.start_dmx_merge([item for item in outputs if item.lower() != "sacn"],
+                                             sacn=any(item.lower() == "sacn" for item in outputs))
+                elif choice == 'C':
+                    self.record_dmx()
+                elif choice == 'P':
+                    self.play_recording()
                 elif choice == 'X':
                     self._stop_services()
                 elif choice == 'Q':
                     self._stop_services()
                     self.stop_osc_monitor()
                     self.stop_system_monitor()
+                    self.stop_dmx_state_publisher()
+                    self.stop_artnet_discovery()
+                    self.stop_sacn_listener()
+                    self.stop_config_watcher()
+                    self.stop_metrics_exporter()
+                    self.stop_dmx_merge()
+                    self.stop_patch_sync()
                     self.console.print("『 The stage dims, until we meet again... 』", style="bold magenta")
                     return
             else:
@@ -881,9 +4123,18 @@ class ArtBastard:
 
     def cleanup(self):
         """Clean up resources before exiting."""
+        import psutil
         if self.osc_server:
             self.stop_osc_monitor()
         self.stop_system_monitor()
+        self.stop_config_watcher()
+        self.stop_metrics_exporter()
+        self.stop_dmx_merge()
+        self.stop_patch_sync()
+        self.stop_dmx_state_publisher()
+        self.stop_sacn_listener()
+        if self.artnet_discovery:
+            self.stop_artnet_discovery()
         pid_files = {
             "backend": os.path.join(LOG_DIR, "backend.pid"),
         }
@@ -902,11 +4153,242 @@ class ArtBastard:
                     os.remove(pid_file)
                 except:
                     pass
+        if self.log_capture:
+            self.log_capture.stop()
+            self.log_capture = None
         self._kill_processes_on_ports()
 
+def _import_time_profile(statement: str) -> list:
+    """Run a statement under `python -X importtime` and return (module, self_us, cumulative_us, depth) rows."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        check=False
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cumulative_us, name = line[len("import time:"):].split("|", 2)
+        depth = (len(name) - len(name.lstrip(" ")) - 1) // 2
+        rows.append((name.strip(), int(self_us), int(cumulative_us), depth))
+    return rows
+
+def profile_startup(budget_ms: float = STARTUP_BUDGET_MS) -> int:
+    """Report per-import startup cost and the cost of each lazily imported subsystem."""
+    console = Console()
+    rows = _import_time_profile("import artbastard")
+    # Nested imports are listed before their parent, one indent level deeper
+    end = next(i for i, row in enumerate(rows) if row[0] == "artbastard" and row[3] == 0)
+    start = end
+    while start > 0 and rows[start - 1][3] > 0:
+        start -= 1
+    total_ms = rows[end][2] / 1000
+    table = Table(title="Imports before the menu draws", show_header=True, header_style="bold magenta")
+    table.add_column("Module")
+    table.add_column("Cumulative", justify="right")
+    for name, _, cumulative_us, _ in sorted((r for r in rows[start:end] if r[3] == 1), key=lambda r: -r[2])[:15]:
+        table.add_row(name, f"{cumulative_us / 1000:.1f} ms")
+    console.print(table)
+    already_loaded = {row[0] for row in rows}
+    lazy_table = Table(title="Lazily imported subsystems (cost on first use)", show_header=True, header_style="bold blue")
+    lazy_table.add_column("Subsystem")
+    lazy_table.add_column("Module")
+    lazy_table.add_column("Cost", justify="right")
+    for subsystem, module in STARTUP_LAZY_IMPORTS:
+        if module in already_loaded:
+            lazy_table.add_row(subsystem, module, "[red]loaded at startup[/red]")
+            continue
+        lazy_rows = _import_time_profile(f"import artbastard, {module}")
+        cost_us = sum(row[1] for row in lazy_rows) - sum(row[1] for row in rows)
+        lazy_table.add_row(subsystem, module, f"{max(cost_us, 0) / 1000:.1f} ms")
+    console.print(lazy_table)
+    stamp = "valid" if deps_stamp_valid() else "missing or stale"
+    style = "green" if total_ms <= budget_ms else "bold red"
+    console.print(f"Import cost before menu: {total_ms:.1f} ms (budget {budget_ms:.0f} ms), dependency stamp {stamp}",
+                  style=style)
+    return 0 if total_ms <= budget_ms else 1
+
+def _bench_output_receiver(conn, protocol: str, receivers: int, universes: int, port: int):
+    """Benchmark child: open the receiver sockets for one rig, count packets until told to stop."""
+    import selectors
+    selector = selectors.DefaultSelector()
+    sockets = []
+    for i in range(receivers):
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, 4 * 1024 * 1024)
+        if protocol == "sacn":
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+            sock.bind(("", port))
+            for universe in range(1, universes + 1):
+                membership = struct.pack("4s4s", socket.inet_aton(sacn_multicast_group(universe)), socket.inet_aton("127.0.0.1"))
+                sock.setsockopt(socket.IPPROTO_IP, socket.IP_ADD_MEMBERSHIP, membership)
+        else:
+            sock.bind((f"127.0.0.{i + 2}", port))  # One loopback address per Art-Net node
+        sock.setblocking(False)
+        selector.register(sock, selectors.EVENT_READ, i)
+        sockets.append(sock)
+    counts = [0] * receivers
+    conn.send("ready")
+    stopping = False
+    while True:
+        events = selector.select(timeout=0.2)
+        for key, _ in events:
+            try:
+                while True:
+                    key.fileobj.recv(2048)
+                    counts[key.data] += 1
+            except BlockingIOError:
+                pass
+        if not stopping and conn.poll():
+            conn.recv()
+            stopping = True
+        elif stopping and not events:
+            break
+    conn.send(counts)
+    for sock in sockets:
+        sock.close()
+
+def bench_output(receiver_counts, universes: int = 4, frames: int = 2000) -> list:
+    """Compare Art-Net unicast copies with sACN multicast on loopback for N-receiver rigs.
+
+    For each rig the sender pushes frames x universes as fast as it can; Art-Net needs one
+    datagram per node, sACN one per universe. Reports send syscalls, sender CPU per
+    universe-frame, the universe-frame rate that CPU budget sustains, and delivery.
+    """
+    import multiprocessing
+    frame = bytes(range(256)) * 2
+    rows = []
+    for receivers in receiver_counts:
+        for protocol in ("artnet", "sacn"):
+            port = 16454 if protocol == "artnet" else 15568  # Stay clear of a running backend or console
+            parent, child = multiprocessing.Pipe()
+            worker = multiprocessing.Process(target=_bench_output_receiver,
+                                             args=(child, protocol, receivers, universes, port), daemon=True)
+            worker.start()
+            parent.recv()
+            if protocol == "artnet":
+                sender = ArtNetSender([f"127.0.0.{i + 2}" for i in range(receivers)], port)
+            else:
+                sender = SacnSender(universe_offset=1, interface="127.0.0.1", ttl=1, port=port)
+            cpu_started = time.thread_time_ns()
+            wall_started = time.perf_counter_ns()
+            for _ in range(frames):
+                for universe in range(universes):
+                    try:
+                        sender.send(universe, frame)
+                    except OSError:
+                        pass  # ENOBUFS when the sender outruns loopback; counted as undelivered
+            cpu_ns = time.thread_time_ns() - cpu_started
+            wall_ns = time.perf_counter_ns() - wall_started
+            sends = sender.packets_sent
+            sender.close()
+            parent.send("stop")
+            counts = parent.recv()
+            worker.join(timeout=5)
+            universe_frames = frames * universes
+            rows.append({
+                "protocol": protocol,
+                "receivers": receivers,
+                "sends": sends,
+                "sendsPerSec": round(sends / (wall_ns / 1e9)),
+                "cpuUsPerUniverseFrame": round(cpu_ns / universe_frames / 1000, 2),
+                "maxUniverseFramesPerSec": round(universe_frames / (cpu_ns / 1e9)),
+                "deliveredPct": round(100 * sum(min(count, universe_frames) for count in counts) / (universe_frames * receivers), 1),
+            })
+    return rows
+
+def bench_merge(source_counts, universe_counts, frames: int = 400) -> list:
+    """Time DmxMerger.merge() per frame against a full recompute as sources and universes grow.
+
+    Each frame a playback source rewrites every universe with a few percent of slots
+    changed, and four other sources each touch 16 random slots, like MIDI, OSC and UI
+    moves arriving between frames.
+    """
+    import numpy as np
+    rng = np.random.default_rng(0)
+    rows = []
+    for universes in universe_counts:
+        mask = np.zeros(universes * 512, dtype=bool)
+        mask[::4] = True  # One intensity slot per four, like RGB + dimmer fixtures
+        for sources in source_counts:
+            merger = DmxMerger(universes, mask)
+            names = [f"source{i}" for i in range(sources)]
+            for i, name in enumerate(names):
+                merger.add_source(name, priority=100 if i else 50)
+                merger.write(name, rng.integers(0, merger.slots, 64), rng.integers(0, 256, 64))
+            frame = rng.integers(0, 256, merger.slots).astype(np.uint8)
+            merger.merge()
+            merge_ns = []
+            full_ns = []
+            for _ in range(frames):
+                frame[rng.integers(0, merger.slots, merger.slots // 20)] = rng.integers(0, 256, merger.slots // 20)
+                for universe in range(universes):
+                    merger.write_universe(names[0], universe, frame[universe * 512:(universe + 1) * 512])
+                for name in rng.choice(names, size=min(4, sources), replace=False):
+                    merger.write(name, rng.integers(0, merger.slots, 16), rng.integers(0, 256, 16))
+                started = time.perf_counter_ns()
+                merger.merge()
+                merge_ns.append(time.perf_counter_ns() - started)
+                started = time.perf_counter_ns()
+                merger.recompute()
+                full_ns.append(time.perf_counter_ns() - started)
+            merge_ns.sort()
+            rows.append({
+                "sources": sources,
+                "universes": universes,
+                "mergeMeanUs": round(sum(merge_ns) / frames / 1000, 1),
+                "mergeP99Us": round(merge_ns[int(frames * 0.99) - 1] / 1000, 1),
+                "fullRecomputeUs": round(sum(full_ns) / frames / 1000, 1),
+            })
+    return rows
+
 def main():
     """Main entry point for the application."""
+    import argparse
+    parser = argparse.ArgumentParser(description="ArtBastard DMX512FTW launcher")
+    parser.add_argument("--profile-startup", action="store_true",
+                        help="report per-import startup cost against the startup budget and exit")
+    parser.add_argument("--startup-budget", type=float, default=STARTUP_BUDGET_MS, metavar="MS",
+                        help=f"import budget for --profile-startup (default {STARTUP_BUDGET_MS} ms)")
+    parser.add_argument("--bench-output", action="store_true",
+                        help="benchmark Art-Net unicast against sACN multicast on loopback and exit")
+    parser.add_argument("--bench-receivers", default="1,4,16", metavar="N,N",
+                        help="receiver counts for --bench-output (default 1,4,16)")
+    parser.add_argument("--bench-universes", type=int, default=4, metavar="N",
+                        help="universes per frame for --bench-output (default 4)")
+    parser.add_argument("--bench-merge", action="store_true",
+                        help="benchmark the HTP/LTP merge engine against source and universe counts and exit")
+    args = parser.parse_args()
+    if args.profile_startup:
+        sys.exit(profile_startup(args.startup_budget))
+    if args.bench_output:
+        rows = bench_output([int(n) for n in args.bench_receivers.split(",")], args.bench_universes)
+        table = Table(title=f"DMX output on loopback ({args.bench_universes} universes)", header_style="bold magenta")
+        for column in ("Protocol", "Receivers", "Sends/s", "CPU µs/universe-frame", "Max universe-frames/s", "Delivered"):
+            table.add_column(column)
+        for row in rows:
+            table.add_row("Art-Net unicast" if row["protocol"] == "artnet" else "sACN multicast", str(row["receivers"]),
+                          f"{row['sendsPerSec']:,}", f"{row['cpuUsPerUniverseFrame']}", f"{row['maxUniverseFramesPerSec']:,}",
+                          f"{row['deliveredPct']}%")
+        console.print(table)
+        sys.exit(0)
+    if args.bench_merge:
+        rows = bench_merge([1, 8, 32, 64], [1, 16])
+        table = Table(title="HTP/LTP merge per frame", header_style="bold magenta")
+        for column in ("Sources", "Universes", "Merge mean", "Merge p99", "Full recompute"):
+            table.add_column(column)
+        for row in rows:
+            table.add_row(str(row["sources"]), str(row["universes"]), f"{row['mergeMeanUs']} µs",
+                          f"{row['mergeP99Us']} µs", f"{row['fullRecomputeUs']} µs")
+        console.print(table)
+        sys.exit(0)
     app = ArtBastard()
+    # Up before any launch, so idle and failed states can be scraped, but off the thread drawing the menu
+    app.start_metrics_exporter(background=True)
     def signal_handler(sig, frame):
         print("\nCleaning up...")
         app.cleanup()
@@ -0,0 +1,114 @@
+"""
+Shared-memory DMX state segment written by the ArtBastard launcher.
+
+Standard library only, so visualizers and loggers can read live DMX without
+importing the launcher::
+
+    from artbastard_dmx import DmxStateReader
+
+    reader = DmxStateReader()
+    frame = reader.read(0)  # bytes for universe 0, or None if not published yet
+"""
+
+import os
+import struct
+import time
+
+# Shared-memory DMX state: header, universe table, then one 512-byte slot per universe.
+# Writers bump the sequence to an odd value, write, then bump it to even (a seqlock),
+# so readers retry instead of locking when they catch a frame mid-write.
+DMX_SHM_NAME = "artbastard_dmx"
+DMX_SHM_MAGIC = b"ABDMXSHM"
+DMX_SHM_VERSION = 1
+DMX_SHM_SLOTS = 16
+DMX_SHM_HEADER = struct.Struct("<8sHHIQQ")  # magic, version, slots, reserved, sequence, last update ns
+DMX_SHM_SEQUENCE_OFFSET = 16
+DMX_SHM_SLOT = struct.Struct("<HH")  # universe (0xFFFF = free), frame length
+DMX_SHM_FREE = 0xFFFF
+
+def dmx_shm_size(slots: int) -> int:
+    return DMX_SHM_HEADER.size + slots * (DMX_SHM_SLOT.size + 512)
+
+class DmxStateReader:
+    """Lock-free reader for the segment written by the launcher's DmxStatePublisher."""
+
+    def __init__(self, name: str = DMX_SHM_NAME):
+        from multiprocessing import shared_memory
+        try:
+            self._shm = shared_memory.SharedMemory(name=name, track=False)
+        except TypeError:
+            # Python < 3.13 registers attached segments for cleanup, which would
+            # unlink the publisher's segment when this reader exits.
+            self._shm = shared_memory.SharedMemory(name=name)
+            if os.name == "posix":
+                from multiprocessing import resource_tracker
+                resource_tracker.unregister(self._shm._name, "shared_memory")
+        self._buf = self._shm.buf
+        magic, version, self.slots, _, _, _ = DMX_SHM_HEADER.unpack_from(self._buf, 0)
+        if magic != DMX_SHM_MAGIC or version != DMX_SHM_VERSION:
+            self.close()
+            raise ValueError(f"Shared memory segment {name} is not an ArtBastard DMX state segment")
+        self._data_offset = DMX_SHM_HEADER.size + self.slots * DMX_SHM_SLOT.size
+
+    @property
+    def sequence(self) -> int:
+        """Current writer sequence; changes whenever any universe is updated."""
+        return struct.unpack_from("<Q", self._buf, DMX_SHM_SEQUENCE_OFFSET)[0]
+
+    def _consistent(self, copy):
+        """Run copy() until it completes without a concurrent write."""
+        while True:
+            before = self.sequence
+            if before & 1:
+                time.sleep(0)
+                continue
+            result = copy()
+            if self.sequence == before:
+                return before, result
+
+    def _read_slots(self) -> dict:
+        slots = {}
+        for slot in range(self.slots):
+            universe, length = DMX_SHM_SLOT.unpack_from(self._buf, DMX_SHM_HEADER.size + slot * DMX_SHM_SLOT.size)
+            if universe != DMX_SHM_FREE:
+                slots[universe] = (self._data_offset + slot * 512, length)
+        return slots
+
+    def read(self, universe: int = 0):
+        """Return a consistent copy of one universe, or None if it hasn't been published."""
+        def copy():
+            slot = self._read_slots().get(universe)
+            return bytes(self._buf[slot[0]:slot[0] + slot[1]]) if slot else None
+        return self._consistent(copy)[1]
+
+    def read_into(self, universe: int, buffer) -> int:
+        """Copy one universe into a preallocated buffer and return its length (0 if missing)."""
+        def copy():
+            slot = self._read_slots().get(universe)
+            if not slot:
+                return 0
+            buffer[:slot[1]] = self._buf[slot[0]:slot[0] + slot[1]]
+            return slot[1]
+        return self._consistent(copy)[1]
+
+    def snapshot(self):
+        """Return (sequence, {universe: bytes}) for every published universe."""
+        return self._consistent(lambda: {universe: bytes(self._buf[offset:offset + length])
+                                         for universe, (offset, length) in self._read_slots().items()})
+
+    def wait_for_update(self, last_sequence: int, timeout: float = 1.0, poll_interval: float = 0.001) -> int:
+        """Wait until the sequence moves past last_sequence and return the new value."""
+        deadline = time.monotonic() + timeout
+        while True:
+            sequence = self.sequence
+            if sequence != last_sequence and not sequence & 1:
+                return sequence
+            if time.monotonic() >= deadline:
+                return sequence
+            time.sleep(poll_interval)
+
+    def close(self):
+        if self._buf is not None:
+            self._buf.release()
+            self._buf = None
+            self._shm.close()
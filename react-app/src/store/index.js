@@ -270,3 +270,10 @@ export const useStore = create()(devtools((set, get) => ({
         set({ statusMessage: null });
     }
 }), { name: 'artbastard-store' }));
+
+// Keep the backend's copy of the fixture patch current; the launcher compiles it for DMX merging
+useStore.subscribe((state, previous) => {
+    if (state.fixtures !== previous.fixtures || state.groups !== previous.groups) {
+        state.socket?.emit('updatePatch', { fixtures: state.fixtures, groups: state.groups });
+    }
+});
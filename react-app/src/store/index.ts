@@ -423,4 +423,11 @@ export const useStore = create<State>()(
     }),
     { name: 'artbastard-store' }
   )
-)
\ No newline at end of file
+)
+
+// Keep the backend's copy of the fixture patch current; the launcher compiles it for DMX merging
+useStore.subscribe((state, previous) => {
+  if (state.fixtures !== previous.fixtures || state.groups !== previous.groups) {
+    state.socket?.emit('updatePatch', { fixtures: state.fixtures, groups: state.groups })
+  }
+})
@@ -5,6 +5,10 @@ import path from 'path';
 import { log } from './logger'; // Import from logger instead of index
 import { 
   setDmxChannel, 
+  getDmxChannels,
+  getDmxFrame,
+  getPatch,
+  getLiveConfig,
   learnMidiMapping, 
   loadScene, 
   saveScene, 
@@ -113,11 +117,11 @@ apiRouter.get('/state', (req, res) => {
       midiMappings: config.midiMappings,
       scenes,
       // Add any other state that needs to be initialized
-      dmxChannels: new Array(512).fill(0), // This is placeholder, actual state is in memory
+      dmxChannels: getDmxChannels(),
       oscAssignments: new Array(512).fill('').map((_, i) => `/fixture/DMX${i + 1}`), // Placeholder
       channelNames: new Array(512).fill('').map((_, i) => `CH ${i + 1}`), // Placeholder
-      fixtures: [], 
-      groups: []    
+      fixtures: getPatch().fixtures,
+      groups: getPatch().groups
     });
   } catch (error) {
     log('Error getting initial state', 'ERROR', { error });
@@ -125,6 +129,36 @@ apiRouter.get('/state', (req, res) => {
   }
 });
 
+// Live output channels as 512 raw bytes: no file I/O, so it is cheap enough to poll at
+// DMX rate. Pass ?since=<X-DMX-Version> to get 304 while nothing has changed. X-DMX-Universe
+// is the 15-bit port-address, matching ArtDmx and the launcher's shared-memory slots.
+apiRouter.get('/dmx', (req, res) => {
+  const frame = getDmxFrame();
+  res.set('X-DMX-Universe', String(frame.universe));
+  res.set('X-DMX-Version', String(frame.version));
+  if (req.query.since === String(frame.version)) {
+    res.status(304).end();
+    return;
+  }
+  res.type('application/octet-stream').send(Buffer.from(frame.channels.map(value => Math.max(0, Math.min(255, value | 0)))));
+});
+
+// Fixture patch for the launcher's compiler; ?since=<version> answers 304 while unchanged
+apiRouter.get('/patch', (req, res) => {
+  const patch = getPatch();
+  if (req.query.since === String(patch.version)) {
+    res.status(304).end();
+    return;
+  }
+  res.json(patch);
+});
+
+// Live artNetConfig and midiMappings; the launcher checks config.json edits against these
+// so the backend's own saveConfig() writes are not pushed straight back to it
+apiRouter.get('/config', (req, res) => {
+  res.json(getLiveConfig());
+});
+
 // Set DMX channel value
 const dmxHandler: RequestHandler = (req: Request, res: Response) => {
   try {
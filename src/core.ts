@@ -26,6 +26,8 @@ export const saveScenes = index.saveScenes;
 export const pingArtNetDevice = index.pingArtNetDevice;
 export const clearMidiMappings = index.clearMidiMappings;
 export const updateArtNetConfig = index.updateArtNetConfig;
+export const updateMidiMappings = index.updateMidiMappings;
+export const updatePatch = index.updatePatch;
 
 // Direct implementation of startLaserTime to avoid circular references
 export function startLaserTime(io: Server): void {
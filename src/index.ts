@@ -18,7 +18,6 @@ import { UDPPort, OscMessage } from 'osc';
 import fs from 'fs';
 import path from 'path';
 import EffectsEngine from './effects';
-import ping from 'ping';
 
 // Import our separate logger to avoid circular dependencies
 import { log } from './logger';
@@ -64,10 +63,12 @@ interface ArtNetConfig {
 
 // Variable declarations
 let dmxChannels: number[] = new Array(512).fill(0);
+let dmxVersion = 0; // Bumped on every channel change so pollers can skip unchanged frames
 let oscAssignments: string[] = new Array(512).fill('').map((_, i) => `/fixture/DMX${i + 1}`);
 let channelNames: string[] = new Array(512).fill('').map((_, i) => `CH ${i + 1}`);
 let fixtures: Fixture[] = [];
 let groups: Group[] = [];
+let patchVersion = 0; // Bumped whenever the browser replaces the fixture patch
 let scenes: Scene[] = [];
 let sender: any = null;
 let midiMappings: MidiMappings = {};
@@ -81,6 +82,9 @@ const DATA_DIR = path.join(__dirname, '..', 'data');
 const SCENES_FILE = path.join(DATA_DIR, 'scenes.json');
 const CONFIG_FILE = path.join(DATA_DIR, 'config.json');
 const EXPORT_FILE = path.join(DATA_DIR, 'export_config.json');
+// Node table written by the launcher's ArtPoll discovery (artbastard.py)
+const ARTNET_NODES_FILE = path.join(DATA_DIR, 'artnet-nodes.json');
+const ARTNET_NODES_MAX_AGE = 15000; // Ignore the table if the launcher stopped updating it
 const LOGS_DIR = path.join(__dirname, '..', 'logs');
 const LOG_FILE = path.join(LOGS_DIR, 'app.log');
 
@@ -606,6 +610,7 @@ function loadScene(io: Server, name: string) {
 
 function updateDmxChannel(channel: number, value: number) {
     dmxChannels[channel] = value;
+    dmxVersion++;
     if (artnetSender) {
         artnetSender.setChannel(channel, value);
         artnetSender.transmit();
@@ -639,11 +644,50 @@ function loadScenes() {
     }
 }
 
+function readDiscoveredArtNetNodes(): { updatedAt: number; artnetPortBound?: boolean; nodes: any[] } | null {
+    try {
+        if (!fs.existsSync(ARTNET_NODES_FILE)) {
+            return null;
+        }
+        const table = JSON.parse(fs.readFileSync(ARTNET_NODES_FILE, 'utf-8'));
+        if (!table || !Array.isArray(table.nodes) || Date.now() - table.updatedAt > ARTNET_NODES_MAX_AGE) {
+            return null;
+        }
+        return table;
+    } catch (error) {
+        log('Error reading discovered ArtNet nodes', 'WARN', { error });
+        return null;
+    }
+}
+
 function pingArtNetDevice(io: Server, ip?: string) {
     // If ip is provided, use it instead of the config IP
     const targetIp = ip || artNetConfig.ip;
+
+    // Prefer the launcher's ArtPoll node table: it proves the device speaks Art-Net.
+    // A node missing from the table is not proof it is down (it may answer polls on a
+    // port the launcher could not bind), so that case falls through to the TCP probe.
+    const discovered = readDiscoveredArtNetNodes();
+    if (discovered) {
+        const nodes = discovered.nodes.filter(node => node.ip === targetIp);
+        if (nodes.length > 0) {
+            log(`ArtNet device at ${targetIp} answered ArtPoll`, 'ARTNET');
+            io.emit('artnetStatus', {
+                ip: targetIp,
+                status: 'alive',
+                node: nodes[0],
+                universes: nodes.flatMap(node => node.universes || []),
+                rtt: nodes[0].rtt
+            });
+            return;
+        }
+        log(`ArtNet device at ${targetIp} is not in the ArtPoll table, probing it directly`, 'ARTNET', {
+            discoveredNodes: discovered.nodes.map(node => node.ip),
+            artnetPortBound: discovered.artnetPortBound
+        });
+    }
     
-    // First try TCP connection to ArtNet port
+    // Not discovered (or launcher discovery not running): fall back to a TCP connection to the ArtNet port
     const net = require('net');
     const socket = new net.Socket();
     const timeout = 1000; // 1 second timeout
@@ -812,6 +856,21 @@ function startLaserTime(io: Server) {
     });
 }
 
+// Live channel values for API consumers (the array itself, not a copy)
+function getDmxChannels(): number[] {
+    return dmxChannels;
+}
+
+// 15-bit Art-Net port-address (net, sub-net, universe), the key the launcher's listeners and shared memory use
+function artNetPortAddress(config: ArtNetConfig): number {
+    return ((config.net & 0x7f) << 8) | ((config.subnet & 0x0f) << 4) | (config.universe & 0x0f);
+}
+
+// Output port-address, change counter and live channels (the array itself, not a copy)
+function getDmxFrame(): { universe: number; version: number; channels: number[] } {
+    return { universe: artNetPortAddress(artNetConfig), version: dmxVersion, channels: dmxChannels };
+}
+
 // Add these missing function declarations
 function addSocketHandlers(io: Server) {
     log('Socket handlers being initialized (via addSocketHandlers)', 'SERVER');
@@ -831,6 +890,36 @@ function clearMidiMappings(channelToRemove?: number) {
     }
 }
 
+// Replace the MIDI mappings in place (used by the launcher's config hot-reload)
+function updateMidiMappings(mappings: MidiMappings) {
+    if (!mappings || typeof mappings !== 'object' || Array.isArray(mappings)) {
+        throw new Error('midiMappings must be an object keyed by DMX channel');
+    }
+    midiMappings = mappings;
+    log('MIDI mappings updated', 'MIDI', { count: Object.keys(midiMappings).length });
+}
+
+// Replace the fixture patch (sent by the browser; the launcher compiles it for merging)
+function updatePatch(patch: { fixtures: Fixture[]; groups: Group[] }) {
+    if (!patch || !Array.isArray(patch.fixtures) || !Array.isArray(patch.groups)) {
+        throw new Error('patch must carry fixtures and groups arrays');
+    }
+    fixtures = patch.fixtures;
+    groups = patch.groups;
+    patchVersion++;
+    log('Fixture patch updated', 'DMX', { fixtures: fixtures.length, groups: groups.length });
+}
+
+// Current fixture patch and its change counter
+function getPatch(): { version: number; fixtures: Fixture[]; groups: Group[] } {
+    return { version: patchVersion, fixtures, groups };
+}
+
+// Config the backend is running with: what saveConfig() last wrote or a live update applied
+function getLiveConfig(): { artNetConfig: ArtNetConfig; midiMappings: MidiMappings } {
+    return { artNetConfig, midiMappings };
+}
+
 // Create an updateArtNetConfig function
 function updateArtNetConfig(config: Partial<ArtNetConfig>) {
     artNetConfig = { ...artNetConfig, ...config };
@@ -863,11 +952,17 @@ export {
     disconnectMidiInput,
     addSocketHandlers,
     updateDmxChannel as setDmxChannel, // Export with alias
+    getDmxChannels,
+    getDmxFrame,
     loadScene,
     saveScene,
     loadScenes,
     saveScenes,
     pingArtNetDevice,
     clearMidiMappings,
+    updateMidiMappings,
+    updatePatch,
+    getPatch,
+    getLiveConfig,
     updateArtNetConfig
 };
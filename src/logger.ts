@@ -7,7 +7,9 @@ import boxen from 'boxen';
 const LOGS_DIR = path.join(__dirname, '..', 'logs');
 const LOG_FILE = path.join(LOGS_DIR, 'app.log');
 
-let isLoggingEnabled = true;
+// When the launcher owns stdout it rotates, compresses and indexes the log itself,
+// so the synchronous per-line append to app.log is skipped.
+let isLoggingEnabled = process.env.ARTBASTARD_LOG_CAPTURE !== '1';
 let isConsoleLoggingEnabled = true;
 
 // Define log types and their colors/styles
@@ -6,7 +6,7 @@ import fs from 'fs';
 import cors from 'cors';
 import { json } from 'body-parser';
 import { log } from './logger'; // Import from logger instead of index
-import { startLaserTime, listMidiInterfaces, connectMidiInput, disconnectMidiInput, updateArtNetConfig, pingArtNetDevice } from './core';
+import { startLaserTime, listMidiInterfaces, connectMidiInput, disconnectMidiInput, updateArtNetConfig, updateMidiMappings, updatePatch, pingArtNetDevice } from './core';
 import { apiRouter, setupSocketHandlers } from './api';
 
 // Declare global io instance for use in API routes
@@ -161,6 +161,29 @@ try {
       }
     });
 
+    socket.on('updateMidiMappings', (mappings) => {
+      try {
+        updateMidiMappings(mappings);
+        io.emit('midiMappingUpdate', mappings);
+      } catch (error) {
+        socket.emit('configError', {
+          section: 'midiMappings',
+          message: `MIDI mapping update failed: ${error instanceof Error ? error.message : String(error)}`
+        });
+      }
+    });
+
+    socket.on('updatePatch', (patch) => {
+      try {
+        updatePatch(patch);
+      } catch (error) {
+        socket.emit('configError', {
+          section: 'patch',
+          message: `Fixture patch update failed: ${error instanceof Error ? error.message : String(error)}`
+        });
+      }
+    });
+
     socket.on('testArtNetConnection', (ip) => {
       try {
         pingArtNetDevice(io, ip);
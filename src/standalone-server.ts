@@ -72,6 +72,7 @@ interface ArtNetConfig {
 
 // --- Global state ---
 let dmxChannels: number[] = new Array(512).fill(0);
+let dmxVersion = 0; // Bumped on every channel change so pollers can skip unchanged frames
 let oscAssignments: string[] = new Array(512).fill('').map((_, i) => `/fixture/DMX${i + 1}`);
 let channelNames: string[] = new Array(512).fill('').map((_, i) => `CH ${i + 1}`);
 let fixtures: Fixture[] = [];
@@ -131,6 +132,11 @@ function saveConfig() {
     log('Config saved', 'INFO');
 }
 
+// 15-bit Art-Net port-address (net, sub-net, universe), the key the launcher's listeners and shared memory use
+function artNetPortAddress(config: ArtNetConfig): number {
+    return ((config.net & 0x7f) << 8) | ((config.subnet & 0x0f) << 4) | (config.universe & 0x0f);
+}
+
 function isRunningInWsl(): boolean {
     return os.release().toLowerCase().includes('microsoft') ||
         os.release().toLowerCase().includes('wsl');
@@ -166,6 +172,7 @@ function saveScenes(scenesToSave?: Scene[]) {
 
 function updateDmxChannel(channel: number, value: number) {
     dmxChannels[channel] = value;
+    dmxVersion++;
     if (artnetSender) {
         artnetSender.setChannel(channel, value);
         artnetSender.transmit();
@@ -445,14 +452,30 @@ function createServer() {
             artNetConfig,
             midiMappings,
             scenes,
-            dmxChannels: new Array(512).fill(0),
-            oscAssignments: new Array(512).fill('').map((_, i) => `/fixture/DMX${i + 1}`),
-            channelNames: new Array(512).fill('').map((_, i) => `CH ${i + 1}`),
-            fixtures: [],
-            groups: []
+            dmxChannels,
+            oscAssignments,
+            channelNames,
+            fixtures,
+            groups
         });
     });
 
+    // Live artNetConfig and midiMappings, which the launcher compares config.json edits against
+    app.get('/api/config', (req, res) => {
+        res.json({ artNetConfig, midiMappings });
+    });
+
+    // Live output channels as 512 raw bytes; ?since=<X-DMX-Version> answers 304 while unchanged
+    app.get('/api/dmx', (req, res) => {
+        res.set('X-DMX-Universe', String(artNetPortAddress(artNetConfig)));
+        res.set('X-DMX-Version', String(dmxVersion));
+        if (req.query.since === String(dmxVersion)) {
+            res.status(304).end();
+            return;
+        }
+        res.type('application/octet-stream').send(Buffer.from(dmxChannels.map(value => Math.max(0, Math.min(255, value | 0)))));
+    });
+
     // Serve static files
     const reactAppPath = path.join(__dirname, '..', 'react-app', 'dist');
     if (fs.existsSync(reactAppPath)) {
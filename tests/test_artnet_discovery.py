@@ -0,0 +1,204 @@
+"""ArtNetDiscovery against a stand-in ArtPollReply responder on loopback."""
+
+import json
+import os
+import socket
+import struct
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import artbastard  # noqa: E402
+
+
+def build_artpoll_reply(ip: str, bind_index: int, firmware=(2, 7), net: int = 1, sub: int = 2,
+                        outputs=(0, 1), inputs=(3,)) -> bytes:
+    """Build a 239-byte ArtPollReply with DMX512 output and input ports."""
+    packet = bytearray(239)
+    packet[0:8] = artbastard.ARTNET_ID
+    struct.pack_into("<H", packet, 8, artbastard.OP_POLL_REPLY)
+    packet[10:14] = socket.inet_aton(ip)
+    struct.pack_into("<H", packet, 14, artbastard.ARTNET_PORT)
+    packet[16], packet[17] = firmware
+    packet[18], packet[19] = net, sub
+    struct.pack_into(">H", packet, 20, 0x2B00)
+    struct.pack_into("<H", packet, 24, 0x7FF0)
+    packet[26:26 + 9] = b"Test Node"
+    packet[44:44 + 14] = b"Loopback Stand"
+    packet[108:108 + 9] = b"#0001 [0]"
+    struct.pack_into(">H", packet, 172, 4)
+    for i, switch in enumerate(outputs):
+        packet[174 + i] |= 0x80
+        packet[190 + i] = switch
+    for i, switch in enumerate(inputs, start=len(outputs)):
+        packet[174 + i] |= 0x40
+        packet[186 + i] = switch
+    packet[201:207] = bytes([0x02, 0x00, 0x00, 0x00, 0x00, bind_index])
+    packet[211] = bind_index
+    return bytes(packet)
+
+
+class Responder(threading.Thread):
+    """Answer every ArtPoll with two replies (bind index 1 and 2).
+
+    Replies go back to the poll's source port, or, as the Art-Net spec asks, to
+    reply_port (the Art-Net port) on the poll's source address.
+    """
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, reply_port: int = None):
+        super().__init__(daemon=True)
+        self.sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        if port:
+            self.sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)  # Shares the port like a node on another host
+        self.sock.bind((host, port))
+        self.sock.settimeout(0.05)
+        self.port = self.sock.getsockname()[1]
+        self.reply_port = reply_port
+        self.answering = True
+        self.polls_answered = 0
+        self.closed = False
+        self.replies = [build_artpoll_reply("127.0.0.1", 1), build_artpoll_reply("127.0.0.1", 2, outputs=(4,), inputs=())]
+
+    def run(self):
+        while not self.closed:
+            try:
+                data, addr = self.sock.recvfrom(2048)
+            except socket.timeout:
+                continue
+            except OSError:
+                return
+            if not self.answering or data != artbastard.build_artpoll():
+                continue
+            for reply in self.replies:
+                self.sock.sendto(reply, addr if self.reply_port is None else (addr[0], self.reply_port))
+            self.polls_answered += 1
+
+    def close(self):
+        self.closed = True
+        self.join(timeout=1)
+        self.sock.close()
+
+
+def free_udp_port() -> int:
+    sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    sock.bind(("0.0.0.0", 0))
+    port = sock.getsockname()[1]
+    sock.close()
+    return port
+
+
+def wait_for(predicate, timeout: float = 3.0) -> bool:
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if predicate():
+            return True
+        time.sleep(0.02)
+    return predicate()
+
+
+class ArtNetDiscoveryTest(unittest.TestCase):
+
+    def setUp(self):
+        self.responder = Responder()
+        self.responder.start()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.table_file = os.path.join(self.tmp.name, "artnet-nodes.json")
+        # The responder holds the port exclusively, so the scanner cannot share it and
+        # replies must come back through its private poll socket.
+        self.discovery = artbastard.ArtNetDiscovery(targets=["127.0.0.1"], port=self.responder.port,
+                                                    interval=0.1, node_ttl=0.5, table_file=self.table_file)
+        self.discovery.start()
+
+    def tearDown(self):
+        self.discovery.stop()
+        self.responder.close()
+        self.tmp.cleanup()
+
+    def test_parses_replies_into_node_table(self):
+        self.assertTrue(wait_for(lambda: len(self.discovery.snapshot()) == 2))
+        self.assertFalse(self.discovery.port_bound)
+        first, second = self.discovery.find("127.0.0.1")
+        self.assertEqual((first["bindIndex"], second["bindIndex"]), (1, 2))
+        self.assertEqual(first["firmware"], "2.7")
+        self.assertEqual(first["shortName"], "Test Node")
+        self.assertEqual(first["longName"], "Loopback Stand")
+        self.assertEqual(first["mac"], "02:00:00:00:00:01")
+        self.assertEqual(first["universes"], [0x120, 0x121])
+        self.assertEqual(second["universes"], [0x124])
+        self.assertEqual([p["protocol"] for p in first["ports"]], ["DMX512"] * 4)
+        self.assertEqual([p["output"] for p in first["ports"]], [True, True, False, False])
+        self.assertEqual(first["ports"][2]["inputUniverse"], 0x123)
+        self.assertNotIn("universe", first["ports"][3])
+
+    def test_rtt_counts_one_sample_per_poll_cycle(self):
+        self.assertTrue(wait_for(lambda: self.responder.polls_answered >= 5))
+        self.responder.answering = False
+        time.sleep(0.3)
+        rtt = self.discovery.snapshot()[0]["rtt"]
+        self.assertEqual(rtt["count"], self.responder.polls_answered)
+        self.assertEqual(self.discovery.replies_received, 2 * self.responder.polls_answered)
+        self.assertEqual(sum(rtt["buckets"].values()), rtt["count"])
+        self.assertIsNotNone(rtt["p95Ms"])
+
+    def test_nodes_expire_after_ttl(self):
+        self.assertTrue(wait_for(lambda: len(self.discovery.snapshot()) == 2))
+        self.responder.answering = False
+        self.assertTrue(wait_for(lambda: not self.discovery.snapshot(), timeout=2.0))
+        self.assertEqual(self.discovery.latency, {})
+
+        def table_empty():
+            with open(self.table_file) as f:
+                table = json.load(f)
+            return table["nodes"] == []
+        self.assertTrue(wait_for(table_empty))
+        with open(self.table_file) as f:
+            table = json.load(f)
+        self.assertIs(table["artnetPortBound"], False)
+        self.assertEqual(table["replyPort"], self.discovery.reply_port)
+
+
+class ArtNetPortReplyTest(unittest.TestCase):
+    """Nodes that reply to the Art-Net port rather than the poll's source port."""
+
+    def setUp(self):
+        # The node lives on 127.0.0.2 and the scanner on 127.0.0.1, both on the same "Art-Net port"
+        self.port = free_udp_port()
+        self.responder = Responder(host="127.0.0.2", port=self.port, reply_port=self.port)
+        self.responder.start()
+        self.tmp = tempfile.TemporaryDirectory()
+        self.discovery = artbastard.ArtNetDiscovery(targets=["127.0.0.2"], port=self.port, interval=0.1, node_ttl=0.5,
+                                                    table_file=os.path.join(self.tmp.name, "artnet-nodes.json"))
+        self.discovery.start()
+        self.backend = None
+
+    def tearDown(self):
+        self.discovery.stop()
+        self.responder.close()
+        if self.backend:
+            self.backend.close()
+        self.tmp.cleanup()
+
+    def test_replies_to_the_artnet_port_are_received(self):
+        self.assertTrue(wait_for(lambda: len(self.discovery.snapshot()) == 2))
+        self.assertTrue(self.discovery.port_bound)
+        self.assertEqual(self.discovery.snapshot()[0]["ip"], "127.0.0.1")
+
+    def test_rebind_takes_replies_back_from_a_later_backend_socket(self):
+        self.assertTrue(wait_for(lambda: len(self.discovery.snapshot()) == 2))
+        # The backend's dmxnet binds the shared port after the scanner and receives the unicast replies
+        self.backend = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        self.backend.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        self.backend.bind(("0.0.0.0", self.port))
+        self.backend.settimeout(1)
+        self.assertEqual(self.backend.recv(2048)[:8], artbastard.ARTNET_ID)
+        self.assertTrue(wait_for(lambda: not self.discovery.snapshot(), timeout=2.0))
+        self.assertTrue(self.discovery.rebind())
+        self.assertTrue(wait_for(lambda: len(self.discovery.snapshot()) == 2))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+"""BackendLogCapture against a temporary log directory."""
+
+import errno
+import os
+import subprocess
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import artbastard  # noqa: E402
+
+START = 1_700_000_000.0
+DAY = 86400
+
+
+class BackendLogCaptureTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.log_dir = os.path.join(self.tmp.name, "backend")
+        self.now = START
+        clock = mock.patch.object(artbastard.time, "time", lambda: self.now)
+        clock.start()
+        self.addCleanup(clock.stop)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def capture(self, **kwargs):
+        kwargs.setdefault("index_interval", 0)
+        return artbastard.BackendLogCapture(log_dir=self.log_dir, **kwargs)
+
+    def write_lines(self, capture, count, step=1.0, prefix="line"):
+        for i in range(count):
+            capture.write(f"{prefix} {i:04d}\n".encode())  # 10 bytes per line
+            self.now += step
+
+    def files(self):
+        return sorted(name for name in os.listdir(self.log_dir) if name.startswith("backend-"))
+
+    def test_segments_rotate_by_size(self):
+        capture = self.capture(segment_bytes=40)
+        self.write_lines(capture, 10)
+        capture.stop()
+        summaries = capture.summaries()
+        self.assertEqual(len(summaries), 3)
+        self.assertEqual([summary["bytes"] for summary in summaries], [40, 40, 20])
+        self.assertEqual(self.files(), sorted(f"{summary['segment']}.gz" for summary in summaries))
+
+    def test_segments_rotate_by_age(self):
+        capture = self.capture(segment_seconds=60)
+        self.write_lines(capture, 7, step=25.0)  # Rotates on the writes at 75s and 150s
+        self.assertEqual(len(capture.segments()), 3)
+        self.assertEqual([summary["first"] for summary in capture.summaries()], [START, START + 75, START + 150])
+        capture.stop()
+
+    def test_query_by_time_across_segments_and_after_reload(self):
+        capture = self.capture(segment_bytes=40)
+        self.write_lines(capture, 10)
+        self.assertEqual(list(capture.query(START + 3, START + 6)), ["line 0003", "line 0004", "line 0005", "line 0006"])
+        self.assertEqual(list(capture.query(START + 8)), ["line 0008", "line 0009"])
+        capture.stop()
+        # A new capture answers the same queries from index.jsonl and the compressed segments
+        reloaded = self.capture(segment_bytes=40)
+        self.assertEqual(reloaded.segments(), capture.segments())
+        self.assertEqual(list(reloaded.query(START + 2, START + 5)), ["line 0002", "line 0003", "line 0004", "line 0005"])
+        self.assertEqual(list(reloaded.query(START - DAY, START - 1)), [])  # Before the first checkpoint
+        self.assertEqual(len(list(reloaded.query(START))), 10)
+        reloaded.stop()
+
+    def test_query_is_bounded_by_the_index_interval(self):
+        capture = self.capture(index_interval=5)
+        self.write_lines(capture, 20)
+        # Checkpoints at 0, 5, 10 and 15s: the window widens to the enclosing checkpoints
+        self.assertEqual(list(capture.query(START + 7, START + 8)), [f"line {i:04d}" for i in range(5, 10)])
+        capture.stop()
+
+    def test_prune_drops_segments_past_the_size_retention(self):
+        capture = self.capture(segment_bytes=40, retention_bytes=0)
+        self.write_lines(capture, 10)
+        capture.close_segment()
+        # Only the live segment survives each rotation
+        self.assertEqual(len(capture.segments()), 1)
+        capture.stop()
+        self.assertEqual(self.files(), [f"{capture.segments()[0]}.gz"])
+        reloaded = self.capture()
+        self.assertEqual(list(reloaded.query(START)), ["line 0008", "line 0009"])
+        reloaded.stop()
+
+    def test_prune_drops_segments_past_the_age_retention(self):
+        capture = self.capture(segment_seconds=DAY, retention_days=3)
+        self.write_lines(capture, 4, step=DAY)
+        old = capture.segments()
+        self.assertEqual(len(old), 4)
+        capture.write(b"fresh\n")  # Rotates four days in: only the first segment is older than three days
+        self.assertEqual(capture.segments(), old[1:] + capture.segments()[-1:])
+        self.assertEqual(capture.prune(), [])
+        capture.stop()
+        self.assertNotIn(f"{old[0]}.gz", self.files())
+        self.assertIn(f"{old[1]}.gz", self.files())
+        with open(capture.index_file) as f:
+            self.assertNotIn(old[0], f.read())
+
+    def test_failing_writes_drop_lines_but_keep_draining_the_pipe(self):
+        capture = artbastard.BackendLogCapture(log_dir=self.log_dir)
+        real_write = capture.write
+
+        def flaky_write(line):
+            if b"fail" in line:
+                raise OSError(errno.ENOSPC, "No space left on device")
+            real_write(line)
+        capture.write = flaky_write
+        # Far more output than a pipe buffer holds: the child only exits if every line is read
+        child = subprocess.Popen([sys.executable, "-c",
+                                  "import sys\n"
+                                  "for i in range(20000):\n"
+                                  "    sys.stdout.write(('fail %d\\n' if i % 10 == 0 else 'line %d\\n') % i)\n"],
+                                 stdout=subprocess.PIPE)
+        capture.attach(child.stdout)
+        self.assertEqual(child.wait(timeout=10), 0)
+        capture._reader.join(timeout=5)
+        self.assertFalse(capture._reader.is_alive())
+        self.assertEqual(capture.lines_dropped, 2000)
+        self.assertEqual(capture.lines_written, 18000)
+        self.assertIn("No space left", capture.last_error)
+        self.assertEqual(capture.tail(1), ["line 19999"])
+        child.stdout.close()
+        capture.stop()
+
+    def test_unwritable_index_keeps_capturing(self):
+        capture = artbastard.BackendLogCapture(log_dir=self.log_dir, index_interval=0)
+        os.makedirs(capture.index_file)  # Appending to a directory fails on every checkpoint
+        for i in range(5):
+            capture.write(f"line {i}\n".encode())
+        self.assertEqual(capture.lines_written, 5)
+        self.assertEqual(capture.tail(5), [f"line {i}" for i in range(5)])
+        self.assertIsNotNone(capture.last_error)
+        capture.stop()
+
+
+if __name__ == "__main__":
+    unittest.main()
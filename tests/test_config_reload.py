@@ -0,0 +1,169 @@
+"""config.json validation, diffing and the hot-reload decision."""
+
+import copy
+import json
+import os
+import sys
+import tempfile
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import artbastard  # noqa: E402
+
+
+class ValidateConfigTest(unittest.TestCase):
+
+    def test_defaults_and_partial_configs_are_valid(self):
+        self.assertEqual(artbastard.validate_config(artbastard.DEFAULT_CONFIG), [])
+        self.assertEqual(artbastard.validate_config({}), [])
+        self.assertEqual(artbastard.validate_config({"artNetConfig": {"universe": 3},
+                                                     "midiMappings": {"0": {"channel": 1, "note": 60}}}), [])
+
+    def test_config_must_be_an_object(self):
+        self.assertEqual(artbastard.validate_config([]), ["config must be a JSON object"])
+        self.assertEqual(artbastard.validate_config({"artNetConfig": []}), ["artNetConfig must be an object"])
+        self.assertEqual(artbastard.validate_config({"midiMappings": None}), ["midiMappings must be an object"])
+
+    def test_artnet_ip(self):
+        for ip in ("10.0.0", "10.0.0.256", "host.example.com.", 167772161):
+            errors = artbastard.validate_config({"artNetConfig": {"ip": ip}})
+            self.assertEqual(len(errors), 1, ip)
+            self.assertIn("not an IPv4 address", errors[0])
+        self.assertEqual(artbastard.validate_config({"artNetConfig": {"ip": "255.255.255.255"}}), [])
+
+    def test_artnet_ranges(self):
+        for key, bad in (("net", 128), ("subnet", 16), ("universe", -1), ("port", 0), ("port", 65536),
+                         ("base_refresh_interval", 0), ("universe", 1.0), ("net", True), ("subnet", "1")):
+            errors = artbastard.validate_config({"artNetConfig": {key: bad}})
+            self.assertEqual(len(errors), 1, (key, bad))
+            self.assertTrue(errors[0].startswith(f"artNetConfig.{key} must be an integer"), errors[0])
+        self.assertEqual(artbastard.validate_config({"artNetConfig": {"net": 127, "subnet": 15, "universe": 15}}), [])
+
+    def test_midi_mappings(self):
+        cases = {
+            "512": {"channel": 0},
+            "dimmer": {"channel": 0},
+            "1": {"channel": "0"},
+            "2": [],
+            "3": {"channel": 0, "controller": 128},
+            "4": {"channel": 0, "note": -1},
+        }
+        errors = artbastard.validate_config({"midiMappings": cases})
+        self.assertEqual(len(errors), len(cases), errors)
+        self.assertIn("midiMappings key '512' is not a DMX channel (0..511)", errors)
+        self.assertIn("midiMappings[1] needs an integer MIDI channel", errors)
+        self.assertIn("midiMappings[3] note/controller must be in 0..127", errors)
+
+    def test_every_problem_is_reported(self):
+        errors = artbastard.validate_config({"artNetConfig": {"ip": "x", "net": -1}, "midiMappings": {"600": {}}})
+        self.assertEqual(len(errors), 3)
+
+
+class DiffConfigTest(unittest.TestCase):
+
+    def test_changed_added_and_removed_sections(self):
+        old = {"artNetConfig": {"universe": 0}, "midiMappings": {}, "scenes": []}
+        new = {"artNetConfig": {"universe": 1}, "midiMappings": {}, "extra": True}
+        self.assertEqual(artbastard.diff_config(old, new), ["artNetConfig", "extra", "scenes"])
+
+    def test_equal_configs_and_key_order(self):
+        old = {"artNetConfig": {"ip": "10.0.0.1", "universe": 0}}
+        self.assertEqual(artbastard.diff_config(old, {"artNetConfig": {"universe": 0, "ip": "10.0.0.1"}}), [])
+        self.assertEqual(artbastard.diff_config({}, {}), [])
+
+
+class ApplyConfigChangeTest(unittest.TestCase):
+    """_apply_config_change against a stand-in backend, without launching one."""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(self.tmp.cleanup)
+        config_file = os.path.join(self.tmp.name, "config.json")
+        for patcher in (mock.patch.object(artbastard, "CONFIG_FILE", config_file),
+                        mock.patch.object(artbastard, "BackendSocketClient", mock.MagicMock())):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.config_file = config_file
+        self.write(artbastard.DEFAULT_CONFIG)
+        self.app = artbastard.ArtBastard.__new__(artbastard.ArtBastard)
+        self.app.config_watcher = None
+        self.app.artnet_discovery = None
+        self.app.running_config = {}
+        self.app.backend_config = {}
+        self.live = {}  # What GET /api/config answers
+        self.logged = []
+        self.pushed = []
+        self.app._backend_running = lambda: True
+        self.app._fetch_backend_config = lambda: copy.deepcopy(self.live)
+        self.app._log_config_reload = self.logged.append
+        self.app._push_config_section = lambda client, section, value: self.pushed.append((section, value))
+        self.app._restart_backend = mock.Mock(return_value=True)
+
+    def write(self, config):
+        with open(self.config_file, "w") as f:
+            json.dump(config, f, indent=2)
+
+    def launch(self):
+        self.app.running_config = self.app._load_config()
+        self.app.backend_config = {section: self.app._live_config_value(self.app.running_config, section)
+                                   for section in artbastard.LIVE_CONFIG_EVENTS}
+
+    def test_user_edit_is_pushed_live(self):
+        self.launch()
+        config = copy.deepcopy(artbastard.DEFAULT_CONFIG)
+        config["artNetConfig"]["universe"] = 4
+        self.write(config)
+        self.app._apply_config_change(0)
+        self.assertEqual(self.pushed, [("artNetConfig", config["artNetConfig"])])
+        self.assertEqual(self.logged[-1]["mode"], "live")
+        self.assertEqual(self.app.running_config, config)
+
+    def test_backend_save_config_is_not_pushed_back(self):
+        self.launch()
+        # The web UI changed the universe; the backend applied it and wrote config.json itself
+        config = copy.deepcopy(artbastard.DEFAULT_CONFIG)
+        config["artNetConfig"]["universe"] = 4
+        config["midiMappings"] = {"5": {"channel": 0, "note": 64}}
+        self.live = copy.deepcopy(config)
+        self.write(config)
+        self.app._apply_config_change(0)
+        self.assertEqual(self.pushed, [])
+        self.assertEqual(self.logged, [])
+        self.assertEqual(self.app.running_config, config)
+
+    def test_only_sections_the_backend_does_not_hold_are_pushed(self):
+        self.launch()
+        config = copy.deepcopy(artbastard.DEFAULT_CONFIG)
+        config["artNetConfig"]["universe"] = 4
+        config["midiMappings"] = {"5": {"channel": 0, "note": 64}}
+        self.live = {"artNetConfig": config["artNetConfig"], "midiMappings": {}}
+        self.write(config)
+        self.app._apply_config_change(0)
+        self.assertEqual(self.pushed, [("midiMappings", config["midiMappings"])])
+        self.assertEqual(self.logged[-1]["sections"], ["midiMappings"])
+
+    def test_acknowledged_push_is_not_repeated_without_the_config_endpoint(self):
+        self.launch()
+        self.write({"artNetConfig": {"universe": 2}})
+        self.app._apply_config_change(0)
+        self.assertEqual(len(self.pushed), 1)
+        # The backend saves the section it applied, merged over its defaults, and drops nothing else
+        self.write({"artNetConfig": self.pushed[0][1], "midiMappings": {}})
+        self.app._apply_config_change(0)
+        self.assertEqual(len(self.pushed), 1)
+        self.assertEqual(len(self.logged), 1)
+
+    def test_changes_while_the_backend_is_stopped_are_deferred(self):
+        self.launch()
+        self.app._backend_running = lambda: False
+        self.live = None  # Never consulted
+        self.write({"artNetConfig": {"universe": 2}})
+        self.app._apply_config_change(0)
+        self.assertEqual(self.logged[-1]["mode"], "deferred")
+        self.assertEqual(self.pushed, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
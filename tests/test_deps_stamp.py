@@ -0,0 +1,62 @@
+"""The cached dependency check and what invalidates it."""
+
+import os
+import sys
+import tempfile
+import unittest
+from importlib import metadata
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import artbastard  # noqa: E402
+
+
+class DepsStampTest(unittest.TestCase):
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        venv_dir = os.path.join(tmp.name, ".venv")
+        for patcher in (mock.patch.object(artbastard, "VENV_DIR", venv_dir),
+                        mock.patch.object(artbastard, "DEPS_STAMP_FILE", os.path.join(venv_dir, "deps.json"))):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.real_version = metadata.version
+
+    def test_stamp_is_valid_once_written(self):
+        self.assertFalse(artbastard.deps_stamp_valid())
+        self.assertTrue(artbastard.check_deps_and_stamp())
+        self.assertTrue(artbastard.deps_stamp_valid())
+
+    def test_a_changed_package_version_invalidates_the_stamp(self):
+        artbastard.check_deps_and_stamp()
+        upgraded = lambda package: "999.0" if package == "rich" else self.real_version(package)  # noqa: E731
+        with mock.patch.object(metadata, "version", upgraded):
+            self.assertFalse(artbastard.deps_stamp_valid())
+        self.assertTrue(artbastard.deps_stamp_valid())
+
+    def test_unrelated_installs_keep_the_stamp(self):
+        artbastard.check_deps_and_stamp()
+        site_dir = os.path.dirname(os.path.dirname(sys.modules["rich"].__file__))  # Where rich is installed
+        stat = os.stat(site_dir)
+        try:
+            os.utime(site_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+        except OSError:
+            self.skipTest("site-packages is read-only")
+        self.addCleanup(os.utime, site_dir, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+        self.assertTrue(artbastard.deps_stamp_valid())
+
+    def test_a_changed_requirements_list_invalidates_the_stamp(self):
+        artbastard.check_deps_and_stamp()
+        with mock.patch.dict(artbastard.REQUIRED_PACKAGES, {"pyyaml": "yaml"}):
+            self.assertFalse(artbastard.deps_stamp_valid())
+
+    def test_missing_packages_are_not_stamped(self):
+        with mock.patch.dict(artbastard.REQUIRED_PACKAGES, {"no-such-package": "no_such_module"}):
+            self.assertFalse(artbastard.check_deps_and_stamp())
+        self.assertFalse(os.path.exists(artbastard.DEPS_STAMP_FILE))
+
+
+if __name__ == "__main__":
+    unittest.main()
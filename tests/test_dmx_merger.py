@@ -0,0 +1,114 @@
+"""DmxMerger HTP/LTP decisions, priorities and source lifetimes."""
+
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+import artbastard  # noqa: E402
+
+
+def universe(levels: dict) -> bytes:
+    """A 512-slot frame with the given {slot: level} set and everything else at 0."""
+    frame = bytearray(512)
+    for slot, level in levels.items():
+        frame[slot] = level
+    return bytes(frame)
+
+
+class DmxMergerTest(unittest.TestCase):
+
+    def setUp(self):
+        # Slot 0 is a dimmer (HTP); slot 1 a colour channel (LTP)
+        mask = np.zeros(512, dtype=bool)
+        mask[0] = True
+        self.merger = artbastard.DmxMerger(1, intensity_mask=mask)
+
+    def test_htp_on_intensity_and_ltp_elsewhere(self):
+        self.merger.feed("artnet:10.0.0.1:0", 0, universe({0: 200, 1: 10}), t_ns=1)
+        self.merger.feed("artnet:10.0.0.2:0", 0, universe({0: 100, 1: 20}), t_ns=2)
+        frame = self.merger.merge()
+        self.assertEqual(frame[0], 200)  # Highest level wins despite being older
+        self.assertEqual(frame[1], 20)  # Latest write wins
+        self.merger.feed("artnet:10.0.0.1:0", 0, universe({0: 200, 1: 30}), t_ns=3)
+        frame = self.merger.merge()
+        self.assertEqual((frame[0], frame[1]), (200, 30))
+
+    def test_two_senders_merge_instead_of_alternating(self):
+        for t_ns in range(1, 21):
+            self.merger.feed("artnet:10.0.0.1:0", 0, universe({0: 255}), t_ns=2 * t_ns)
+            self.assertEqual(self.merger.merge()[0], 255)
+            self.merger.feed("artnet:10.0.0.2:0", 0, universe({0: 40}), t_ns=2 * t_ns + 1)
+            self.assertEqual(self.merger.merge()[0], 255)
+
+    def test_htp_winner_lowering_its_level_falls_back(self):
+        self.merger.feed("a", 0, universe({0: 200}), t_ns=1)
+        self.merger.feed("b", 0, universe({0: 100}), t_ns=2)
+        self.merger.merge()
+        self.merger.feed("a", 0, universe({0: 50}), t_ns=3)
+        self.assertEqual(self.merger.merge()[0], 100)
+        np.testing.assert_array_equal(self.merger.merge().copy(), self.merger.recompute())
+
+    def test_higher_priority_overrides_both_htp_and_ltp(self):
+        self.merger.feed("sacn:aa:0", 0, universe({0: 255, 1: 10}), t_ns=5, priority=100)
+        self.merger.feed("sacn:bb:0", 0, universe({0: 20, 1: 99}), t_ns=1, priority=150)
+        frame = self.merger.merge()
+        self.assertEqual((frame[0], frame[1]), (20, 99))
+        # The sender drops its priority on the wire; the lower layer takes the slots back
+        self.merger.feed("sacn:bb:0", 0, universe({0: 20, 1: 99}), t_ns=6, priority=50)
+        frame = self.merger.merge()
+        self.assertEqual((frame[0], frame[1]), (255, 10))
+
+    def test_release_and_remove_fall_back_to_remaining_sources(self):
+        self.merger.feed("a", 0, universe({0: 200, 1: 10}), t_ns=1)
+        self.merger.feed("b", 0, universe({0: 100, 1: 20}), t_ns=2)
+        self.merger.merge()
+        self.merger.release("b", slice(1, 2))
+        self.assertEqual(self.merger.merge()[1], 10)
+        self.merger.remove_source("a")
+        frame = self.merger.merge()
+        self.assertEqual((frame[0], frame[1]), (100, 0))
+        self.merger.remove_source("b")
+        self.assertEqual(self.merger.merge()[0], 0)
+        self.assertEqual(self.merger.owned_universes(), [])
+
+    def test_silent_senders_expire(self):
+        self.merger.feed("artnet:10.0.0.1:0", 0, universe({0: 200}), t_ns=0, timeout=1.0)
+        self.merger.feed("artnet:10.0.0.2:0", 0, universe({0: 100}), t_ns=0, timeout=1.0)
+        self.merger.feed("backend", 0, universe({0: 30}), t_ns=0)
+        self.merger.merge()
+        self.merger.feed("artnet:10.0.0.2:0", 0, universe({0: 100}), t_ns=900_000_000, timeout=1.0)
+        self.assertEqual(self.merger.expire(now_ns=1_500_000_000), ["artnet:10.0.0.1:0"])
+        self.assertEqual(self.merger.merge()[0], 100)
+        self.assertEqual(self.merger.expire(now_ns=2_000_000_000), ["artnet:10.0.0.2:0"])
+        self.assertEqual(self.merger.merge()[0], 30)  # Layers fed without a timeout stay
+        self.assertEqual(sorted(self.merger.sources), ["backend"])
+
+    def test_feed_ignores_universes_outside_the_merge(self):
+        self.merger.feed("a", 3, universe({0: 255}))
+        self.assertEqual(self.merger.sources, {})
+
+
+class SacnSourceListenerTest(unittest.TestCase):
+
+    def test_every_source_reaches_source_listeners(self):
+        receiver = artbastard.SacnReceiver([1])
+        seen = []
+        receiver.add_source_listener(lambda cid, u, data, t_ns, priority: seen.append((cid, u, data and data[0], priority)))
+        winners = []
+        receiver.add_dmx_listener(lambda u, data, t_ns: winners.append(data[0]))
+        low, high = artbastard.sacn_cid("low"), artbastard.sacn_cid("high")
+        receiver._handle_packet(artbastard.build_sacn_data(1, bytes([10]), high, priority=150), 1)
+        receiver._handle_packet(artbastard.build_sacn_data(1, bytes([20]), low, priority=100), 2)
+        receiver._handle_packet(artbastard.build_sacn_data(1, bytes([20]), low, priority=100, sequence=1,
+                                                           options=artbastard.SACN_OPTION_TERMINATED), 3)
+        self.assertEqual(winners, [10])  # The lower priority source loses the receiver's own merge...
+        self.assertEqual(seen, [(high.hex(), 0, 10, 150), (low.hex(), 0, 20, 100),
+                                (low.hex(), 0, None, 100)])  # ...but every source is reported, then its termination
+
+
+if __name__ == "__main__":
+    unittest.main()
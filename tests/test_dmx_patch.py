@@ -0,0 +1,188 @@
+"""DmxPatch incremental recompiles and fixture validation in patch sync."""
+
+import http.server
+import json
+import os
+import sys
+import threading
+import time
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import numpy as np  # noqa: E402
+
+import artbastard  # noqa: E402
+
+
+def fixture(name, start, universe=0, channels=("dimmer", "red")):
+    return {"name": name, "universe": universe, "startAddress": start,
+            "channels": [{"name": f"{kind} {i}", "type": kind} for i, kind in enumerate(channels)]}
+
+
+class RecordingMask(np.ndarray):
+    """A bool mask that remembers which slots were assigned."""
+
+    def __setitem__(self, key, value):
+        self.written.update(np.arange(self.size)[key].tolist())
+        super().__setitem__(key, value)
+
+
+class DmxPatchUpdateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.patch = artbastard.DmxPatch(2)
+        self.fixtures = [fixture("par 1", 1), fixture("par 2", 11), fixture("par 3", 21, universe=1)]
+        self.groups = [{"fixtureIndices": [0, 1]}, {"fixtureIndices": [2]}]
+        self.patch.update(self.fixtures, self.groups)
+
+    def record_mask_writes(self):
+        self.patch.intensity_mask = self.patch.intensity_mask.view(RecordingMask)
+        self.patch.intensity_mask.written = set()
+        return self.patch.intensity_mask.written
+
+    def test_first_update_compiles_everything(self):
+        self.assertEqual(np.flatnonzero(self.patch.intensity_mask).tolist(), [0, 10, 532])
+        self.assertEqual(self.patch.indices(("group", 0), "dimmer").tolist(), [0, 10])
+        self.assertEqual(self.patch.indices(("fixture", 2), "red").tolist(), [533])
+
+    def test_unchanged_definitions_rewrite_nothing(self):
+        written = self.record_mask_writes()
+        index = dict(self.patch._index)
+        self.assertEqual(self.patch.update([dict(f) for f in self.fixtures], self.groups), set())
+        self.assertEqual(written, set())
+        self.assertEqual(self.patch._index.keys(), index.keys())
+        self.assertTrue(all(self.patch._index[key] is index[key] for key in index))
+
+    def test_moving_one_fixture_rewrites_only_its_old_and_new_mask_slots(self):
+        written = self.record_mask_writes()
+        untouched = self.patch._index[(("fixture", 2), "dimmer")]
+        self.fixtures[1] = fixture("par 2", 101)
+        rebuilt = self.patch.update(self.fixtures, self.groups)
+        self.assertEqual(rebuilt, {("fixture", 1), ("group", 0)})
+        self.assertEqual(written, {10, 100})
+        self.assertEqual(np.flatnonzero(self.patch.intensity_mask).tolist(), [0, 100, 532])
+        self.assertIs(self.patch._index[(("fixture", 2), "dimmer")], untouched)
+        self.assertEqual(self.patch.indices(("group", 0), "dimmer").tolist(), [0, 100])
+
+    def test_overlapping_intensity_slots_stay_claimed(self):
+        self.fixtures[1] = fixture("par 2", 1, channels=("dimmer",))  # Doubles up on par 1's dimmer
+        self.patch.update(self.fixtures, self.groups)
+        self.assertEqual(np.flatnonzero(self.patch.intensity_mask).tolist(), [0, 532])
+        written = self.record_mask_writes()
+        self.fixtures[1] = fixture("par 2", 1, channels=("red",))
+        self.patch.update(self.fixtures, self.groups)
+        self.assertEqual(written, {0})
+        self.assertTrue(self.patch.intensity_mask[0])  # Still par 1's dimmer
+
+    def test_removed_fixtures_release_their_slots(self):
+        written = self.record_mask_writes()
+        rebuilt = self.patch.update(self.fixtures[:2], self.groups[:1])
+        self.assertEqual(rebuilt, {("fixture", 2), ("group", 1)})
+        self.assertEqual(written, {532})
+        self.assertEqual(np.flatnonzero(self.patch.intensity_mask).tolist(), [0, 10])
+        self.assertEqual(self.patch.indices(("fixture", 2), "dimmer").tolist(), [])
+
+    def test_a_fixture_that_does_not_fit_leaves_the_table_intact(self):
+        written = self.record_mask_writes()
+        self.fixtures[0] = fixture("par 1", 512)
+        with self.assertRaises(ValueError):
+            self.patch.update(self.fixtures, self.groups)
+        self.assertEqual(written, set())
+        self.assertEqual(self.patch.indices(("fixture", 0), "dimmer").tolist(), [0])
+
+
+class ValidateFixtureTest(unittest.TestCase):
+
+    def test_valid_fixtures(self):
+        self.assertEqual(artbastard.validate_fixture(fixture("par", 511), 1), [])
+        self.assertEqual(artbastard.validate_fixture({"profile": "laser", "startAddress": 100}, 1), [])
+        self.assertEqual(artbastard.validate_fixture({}, 1), [])
+
+    def test_malformed_fixtures(self):
+        cases = [
+            "par",
+            {"channels": "dimmer"},
+            {"channels": ["dimmer"]},
+            {"channels": [{"type": ["dimmer"]}]},
+            {"channels": [{"ranges": ["on"]}]},
+            {"channels": [{"ranges": {"on": [0, 256]}}]},
+            {"channels": [{"ranges": {"on": {"range": [10, 0]}}}]},
+            {"channels": [{"ranges": {"on": {"range": [0, 9], "requires": {"mode": 1}}}}]},
+            {"profile": ["laser"]},
+            {"universe": "0"},
+            {"universe": 1},
+            {"startAddress": 0},
+            {"startAddress": 512, "channels": [{}, {}]},
+        ]
+        for case in cases:
+            with self.subTest(case=case):
+                self.assertEqual(len(artbastard.validate_fixture(case, 1)), 1)
+
+    def test_valid_fixtures_compile(self):
+        for case in ({}, fixture("par", 1), {"profile": "laser"}):
+            artbastard.FixturePatch(case, 1)
+
+
+class PatchSyncTest(unittest.TestCase):
+    """_sync_patch against a stand-in /api/patch."""
+
+    def setUp(self):
+        bodies = self.bodies = []
+
+        class Handler(http.server.BaseHTTPRequestHandler):
+            def do_GET(self):
+                body = bodies.pop(0) if len(bodies) > 1 else bodies[0]
+                data = json.dumps(body).encode()
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self.server = http.server.ThreadingHTTPServer(("localhost", 0), Handler)
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+        for patcher in (mock.patch.object(artbastard, "BACKEND_PORT", self.server.server_address[1]),
+                        mock.patch.object(artbastard, "PATCH_POLL_INTERVAL", 0.01)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        self.app = artbastard.ArtBastard.__new__(artbastard.ArtBastard)
+        self.app.console = mock.Mock()
+        self.app.backend_pid = 1
+        self.app.dmx_merger = None
+        self.app.patch_sync_thread = None
+
+    def sync(self, until):
+        self.app.start_patch_sync()
+        thread = self.app.patch_sync_thread
+        deadline = time.monotonic() + 5
+        while not until() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertTrue(thread.is_alive())
+        self.app.stop_patch_sync()
+        self.assertFalse(thread.is_alive())
+
+    def test_bad_fixtures_are_skipped_and_sync_keeps_running(self):
+        good = [fixture("par 1", 1), fixture("par 2", 11)]
+        self.bodies += [
+            ["not", "a", "patch"],  # AttributeError on .get()
+            {"version": 1, "fixtures": [good[0], {"name": "broken", "channels": [{"type": "dimmer"}, "red"]}, good[1]],
+             "groups": [{"fixtureIndices": [0, 1, 2]}]},
+        ]
+        patch = artbastard.DmxPatch(artbastard.PATCH_UNIVERSES)
+        with mock.patch.object(artbastard, "DmxPatch", return_value=patch):
+            self.sync(lambda: len(patch.fixtures) == 3)
+        self.assertEqual(patch.indices(("fixture", 2), "dimmer").tolist(), [10])
+        self.assertEqual(patch.indices(("fixture", 1), "dimmer").tolist(), [])
+        self.assertEqual(patch.indices(("group", 0), "dimmer").tolist(), [0, 10])
+        self.assertEqual(self.app.patch_error, "skipped fixture 1 (broken): channel 2 must be an object")
+        self.app.console.print.assert_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,164 @@
+"""Delta codec, DmxRecorder files and DmxPlayback seeking and recovery."""
+
+import os
+import random
+import shutil
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import artbastard  # noqa: E402
+
+MS = 1_000_000
+
+
+class DeltaCodecTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        rng = random.Random(7)
+        previous = bytes(rng.randrange(256) for _ in range(512))
+        for changed in (0, 1, 3, 40, 512):
+            current = bytearray(previous)
+            for slot in rng.sample(range(512), changed):
+                current[slot] = (current[slot] + 1 + rng.randrange(255)) % 256
+            current = bytes(current)
+            payload = artbastard.encode_dmx_delta(previous, current)
+            frame = bytearray(previous)
+            artbastard.apply_dmx_delta(frame, payload)
+            self.assertEqual(bytes(frame), current)
+            previous = current
+
+    def test_unchanged_frame_encodes_to_nothing(self):
+        self.assertEqual(artbastard.encode_dmx_delta(bytes(512), bytes(512)), b"")
+
+    def test_short_gaps_merge_into_one_run(self):
+        previous = bytes(512)
+        current = bytearray(512)
+        current[10] = current[10 + artbastard.DELTA_MERGE_GAP] = 1  # Gap just short enough to bridge
+        current[200] = 1  # Far away: its own run
+        payload = artbastard.encode_dmx_delta(previous, bytes(current))
+        runs = []
+        pos = 0
+        while pos < len(payload):
+            first, count = artbastard.DELTA_RUN.unpack_from(payload, pos)
+            runs.append((first, count))
+            pos += artbastard.DELTA_RUN.size + count
+        self.assertEqual(runs, [(10, artbastard.DELTA_MERGE_GAP + 1), (200, 1)])
+
+
+class DmxRecordingTest(unittest.TestCase):
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, "take.abdmx")
+        # 3 s of two universes at 40 fps with a slow fade and a moving colour channel
+        self.recorded = []
+        recorder = artbastard.DmxRecorder(self.path, keyframe_interval=0.5)
+        origin = recorder._start_ns
+        for i in range(120):
+            t = i * 25 * MS
+            for universe in (0, 1):
+                frame = bytearray(512)
+                frame[0] = i * 2 % 256
+                frame[1 + i % 8] = 255 - universe
+                recorder.on_frame(universe, bytes(frame), origin + t)
+                self.recorded.append((t, universe, bytes(frame)))
+        self.stats = recorder.close()
+        self.index = list(recorder._index)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def frames(self, playback, start_ns=0):
+        return [(t, universe, bytes(frame)) for t, universe, frame in playback.frames(start_ns)]
+
+    def expected(self, start_ns=0):
+        return sorted((r for r in self.recorded if r[0] >= start_ns), key=lambda r: r[0])
+
+    def test_stats_and_compression(self):
+        self.assertEqual(self.stats["frames"], 240)
+        self.assertEqual(self.stats["universes"], [0, 1])
+        self.assertEqual(self.stats["keyframes"], 2)
+        self.assertGreater(self.stats["compressionRatio"], 10)
+
+    def test_playback_reproduces_every_frame(self):
+        playback = artbastard.DmxPlayback(self.path)
+        try:
+            self.assertEqual(playback.index, self.index)
+            # One index point per 0.5 s; the one at 0 s would have had nothing to snapshot
+            self.assertEqual([t for t, _ in self.index], [500 * MS, 1000 * MS, 1500 * MS, 2000 * MS, 2500 * MS])
+            self.assertEqual(playback.duration_ns, 119 * 25 * MS)
+            self.assertEqual(sorted(self.frames(playback), key=lambda r: r[0]), self.expected())
+        finally:
+            playback.close()
+
+    def test_seek_restores_state_from_the_nearest_snapshot(self):
+        playback = artbastard.DmxPlayback(self.path)
+        try:
+            for start_ns in (0, 499 * MS, 500 * MS, 1337 * MS, 2975 * MS, 5000 * MS):
+                self.assertEqual(sorted(self.frames(playback, start_ns), key=lambda r: r[0]), self.expected(start_ns))
+        finally:
+            playback.close()
+
+    def test_truncated_recording_rebuilds_its_index(self):
+        with open(self.path, 'rb') as f:
+            data = f.read()
+        index_offset = artbastard.RECORDING_TRAILER.unpack_from(data, len(data) - artbastard.RECORDING_TRAILER.size)[0]
+        # Cut mid-record just before the fifth index point, as a crash without close() would leave it
+        cut = self.index[4][1] - 5
+        self.assertLess(cut, index_offset)
+        truncated = os.path.join(self.tmp.name, "crashed.abdmx")
+        with open(truncated, 'wb') as f:
+            f.write(data[:cut])
+        playback = artbastard.DmxPlayback(truncated)
+        try:
+            self.assertEqual(playback.index, self.index[:4])
+            frames = self.frames(playback)
+            self.assertTrue(frames)
+            self.assertEqual(sorted(frames, key=lambda r: r[0]), self.expected()[:len(frames)])
+            tail = self.frames(playback, self.index[3][0])
+            self.assertTrue(tail)
+            self.assertEqual(tail, [f for f in frames if f[0] >= self.index[3][0]])
+        finally:
+            playback.close()
+
+    def test_universe_filter(self):
+        path = os.path.join(self.tmp.name, "filtered.abdmx")
+        recorder = artbastard.DmxRecorder(path, universes=[1])
+        recorder.on_frame(0, bytes(512))
+        recorder.on_frame(1, bytes([9]) * 512)
+        self.assertEqual(recorder.close()["universes"], [1])
+
+    def test_play_sends_every_frame_and_syncs_per_timestamp(self):
+        class Sender:
+            def __init__(self):
+                self.sent = []
+                self.syncs = 0
+
+            def send(self, universe, data):
+                self.sent.append((universe, bytes(data)))
+
+            def sync(self):
+                self.syncs += 1
+        sender = Sender()
+        playback = artbastard.DmxPlayback(self.path)
+        try:
+            result = playback.play(sender, speed=50.0, start=2.5)
+        finally:
+            playback.close()
+        expected = self.expected(2500 * MS)
+        self.assertEqual(result["frames"], len(expected))
+        self.assertEqual(sender.sent, [(universe, frame) for _, universe, frame in expected])
+        self.assertEqual(sender.syncs, len({t for t, _, _ in expected}))
+
+    def test_rejects_foreign_files(self):
+        path = os.path.join(self.tmp.name, "not-a-recording.abdmx")
+        shutil.copyfile(__file__, path)
+        with self.assertRaises(ValueError):
+            artbastard.DmxPlayback(path)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+"""DmxStatePublisher and DmxStateReader sharing a segment through the seqlock."""
+
+import os
+import sys
+import threading
+import unittest
+from multiprocessing import shared_memory
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import artbastard  # noqa: E402
+from artbastard_dmx import DmxStateReader  # noqa: E402
+
+
+class DmxStateTest(unittest.TestCase):
+
+    def setUp(self):
+        self.name = f"artbastard_test_{os.getpid()}"
+        self.publisher = artbastard.DmxStatePublisher(name=self.name, slots=4)
+        self.reader = DmxStateReader(name=self.name)
+
+    def tearDown(self):
+        self.reader.close()
+        self.publisher.close()
+
+    def test_round_trip_by_port_address(self):
+        port_address = (1 << 8) | (2 << 4) | 3  # net 1, sub-net 2, universe 3
+        frame = bytes(range(256)) * 2
+        self.publisher.publish(port_address, frame)
+        self.publisher.publish(0, b"\x01\x02\x03")
+        self.assertEqual(self.reader.read(port_address), frame)
+        self.assertEqual(self.reader.read(0), b"\x01\x02\x03")
+        self.assertIsNone(self.reader.read(3))
+        buffer = bytearray(512)
+        self.assertEqual(self.reader.read_into(port_address, buffer), 512)
+        self.assertEqual(bytes(buffer), frame)
+        sequence, universes = self.reader.snapshot()
+        self.assertEqual(sequence % 2, 0)
+        self.assertEqual(universes, {port_address: frame, 0: b"\x01\x02\x03"})
+
+    def test_slots_beyond_capacity_are_not_published(self):
+        for universe in range(5):
+            self.publisher.publish(universe, bytes([universe + 1]))
+        self.assertEqual(self.reader.read(3), b"\x04")
+        self.assertIsNone(self.reader.read(4))
+
+    def test_sequence_and_wait_for_update(self):
+        before = self.reader.sequence
+        self.assertEqual(self.reader.wait_for_update(before, timeout=0.01), before)
+        self.publisher.publish(0, bytes(512))
+        after = self.reader.wait_for_update(before, timeout=1.0)
+        self.assertEqual(after, before + 2)
+
+    def test_reads_never_see_a_torn_frame(self):
+        stop = threading.Event()
+
+        def write():
+            level = 0
+            while not stop.is_set():
+                level = (level + 1) % 256
+                self.publisher.publish(0, bytes([level]) * 512)
+        self.publisher.publish(0, bytes(512))
+        writer = threading.Thread(target=write)
+        writer.start()
+        try:
+            for _ in range(2000):
+                frame = self.reader.read(0)
+                self.assertEqual(len(set(frame)), 1, "frame mixes two writes")
+        finally:
+            stop.set()
+            writer.join()
+
+    def test_reader_rejects_foreign_segments(self):
+        foreign = shared_memory.SharedMemory(name=f"{self.name}_foreign", create=True, size=artbastard.dmx_shm_size(1))
+        try:
+            with self.assertRaises(ValueError):
+                DmxStateReader(name=f"{self.name}_foreign")
+        finally:
+            foreign.close()
+            foreign.unlink()
+
+
+if __name__ == "__main__":
+    unittest.main()
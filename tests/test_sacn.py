@@ -0,0 +1,178 @@
+"""E1.31 packet layout, parsing and SacnReceiver source handling."""
+
+import os
+import socket
+import struct
+import sys
+import time
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import artbastard  # noqa: E402
+
+CID = bytes(range(16))
+SECOND = 1_000_000_000
+
+
+class SacnPacketTest(unittest.TestCase):
+
+    def test_data_packet_byte_offsets(self):
+        slots = bytes(range(256)) * 2
+        packet = artbastard.build_sacn_data(7, slots, CID, source_name="Desk", priority=150, sync_universe=9,
+                                            sequence=42, options=artbastard.SACN_OPTION_PREVIEW)
+        self.assertEqual(len(packet), 638)
+        self.assertEqual(packet[0:4], b"\x00\x10\x00\x00")  # Preamble and post-amble size
+        self.assertEqual(packet[4:16], b"ASC-E1.17\x00\x00\x00")
+        self.assertEqual(struct.unpack_from(">H", packet, 16)[0], 0x7000 | 622)  # Root flags and length
+        self.assertEqual(struct.unpack_from(">I", packet, 18)[0], 0x00000004)
+        self.assertEqual(packet[22:38], CID)
+        self.assertEqual(struct.unpack_from(">H", packet, 38)[0], 0x7000 | 600)  # Framing flags and length
+        self.assertEqual(struct.unpack_from(">I", packet, 40)[0], 0x00000002)
+        self.assertEqual(packet[44:108], b"Desk" + bytes(60))
+        self.assertEqual(packet[108], 150)
+        self.assertEqual(struct.unpack_from(">H", packet, 109)[0], 9)
+        self.assertEqual(packet[111], 42)
+        self.assertEqual(packet[112], 0x80)
+        self.assertEqual(struct.unpack_from(">H", packet, 113)[0], 7)
+        self.assertEqual(struct.unpack_from(">H", packet, 115)[0], 0x7000 | 523)  # DMP flags and length
+        self.assertEqual(packet[117:119], b"\x02\xa1")  # Set property, address and data type
+        self.assertEqual(struct.unpack_from(">HHH", packet, 119), (0, 1, 513))  # First address, increment, count
+        self.assertEqual(packet[125], 0x00)  # Null start code
+        self.assertEqual(packet[126:], slots)
+
+    def test_sync_packet_byte_offsets(self):
+        packet = artbastard.build_sacn_sync(9, CID, sequence=3)
+        self.assertEqual(len(packet), artbastard.SACN_SYNC_LENGTH)
+        self.assertEqual(struct.unpack_from(">H", packet, 16)[0], 0x7000 | 33)
+        self.assertEqual(struct.unpack_from(">I", packet, 18)[0], 0x00000008)
+        self.assertEqual(packet[22:38], CID)
+        self.assertEqual(struct.unpack_from(">H", packet, 38)[0], 0x7000 | 11)
+        self.assertEqual(struct.unpack_from(">I", packet, 40)[0], 0x00000001)
+        self.assertEqual(packet[44], 3)
+        self.assertEqual(struct.unpack_from(">HH", packet, 45), (9, 0))
+
+    def test_round_trip(self):
+        packet = artbastard.build_sacn_data(63999, b"\x01\x02\x03", CID, source_name="Désk", priority=0, sequence=255)
+        self.assertEqual(artbastard.parse_sacn(packet), {
+            "type": "data", "cid": CID, "sourceName": "Désk", "priority": 0, "syncUniverse": 0,
+            "sequence": 255, "options": 0, "universe": 63999, "data": b"\x01\x02\x03",
+        })
+        self.assertEqual(artbastard.parse_sacn(memoryview(artbastard.build_sacn_sync(12, CID, 4))),
+                         {"type": "sync", "cid": CID, "sequence": 4, "universe": 12})
+
+    def test_parse_rejects_other_packets(self):
+        packet = bytearray(artbastard.build_sacn_data(1, bytes(512), CID))
+        self.assertIsNone(artbastard.parse_sacn(packet[:48]))
+        for offset, value in ((4, ord("X")), (117, 0x01), (125, 0xDD)):  # ACN id, DMP vector, start code
+            corrupted = bytearray(packet)
+            corrupted[offset] = value
+            self.assertIsNone(artbastard.parse_sacn(corrupted))
+        self.assertIsNone(artbastard.parse_sacn(artbastard.build_artdmx(0, bytes(512))))
+
+    def test_multicast_group_mapping(self):
+        self.assertEqual(artbastard.sacn_multicast_group(1), "239.255.0.1")
+        self.assertEqual(artbastard.sacn_multicast_group(256), "239.255.1.0")
+        self.assertEqual(artbastard.sacn_multicast_group(63999), "239.255.249.255")
+
+
+class SacnReceiverTest(unittest.TestCase):
+
+    def setUp(self):
+        self.receiver = artbastard.SacnReceiver([1, 2])
+        self.frames = []
+        self.receiver.add_dmx_listener(lambda universe, data, t_ns: self.frames.append((universe, data[0])))
+        self.sequence = {}
+
+    def packet(self, cid, level, priority=100, universe=1, **kwargs):
+        sequence = self.sequence[cid] = (self.sequence.get(cid, -1) + 1) & 0xFF
+        return artbastard.build_sacn_data(universe, bytes([level]), cid, priority=priority, sequence=sequence, **kwargs)
+
+    def test_lower_priority_source_is_dropped_until_the_higher_one_times_out(self):
+        high, low = b"H" * 16, b"L" * 16
+        self.receiver._handle_packet(self.packet(high, 200, priority=150), 0)
+        self.receiver._handle_packet(self.packet(low, 10), SECOND // 10)
+        self.receiver._handle_packet(self.packet(high, 201, priority=150), SECOND)
+        self.receiver._handle_packet(self.packet(low, 11), 2 * SECOND)
+        self.assertEqual(self.frames, [(0, 200), (0, 201)])
+        # The higher-priority source falls silent past the E1.31 source timeout
+        self.receiver._handle_packet(self.packet(low, 12), SECOND + int(artbastard.SACN_SOURCE_TIMEOUT * SECOND) + 1)
+        self.assertEqual(self.frames[-1], (0, 12))
+
+    def test_equal_priority_on_another_universe_is_independent(self):
+        self.receiver._handle_packet(self.packet(b"H" * 16, 200, priority=150), 0)
+        self.receiver._handle_packet(self.packet(b"L" * 16, 10, universe=2), 1)
+        self.assertEqual(self.frames, [(0, 200), (1, 10)])
+
+    def test_stale_and_repeated_sequences_are_dropped(self):
+        cid = b"S" * 16
+        first = artbastard.build_sacn_data(1, b"\x01", cid, sequence=100)
+        self.receiver._handle_packet(first, 0)
+        self.receiver._handle_packet(first, 1)  # Repeat
+        self.receiver._handle_packet(artbastard.build_sacn_data(1, b"\x02", cid, sequence=90), 2)  # Behind
+        self.receiver._handle_packet(artbastard.build_sacn_data(1, b"\x03", cid, sequence=120), 3)
+        self.receiver._handle_packet(artbastard.build_sacn_data(1, b"\x04", cid, sequence=5), 4)  # Wrapped forward
+        self.assertEqual(self.frames, [(0, 1), (0, 3), (0, 4)])
+        self.assertEqual(self.receiver.packets_dropped, 2)
+
+    def test_preview_frames_and_unsubscribed_universes_are_ignored(self):
+        self.receiver._handle_packet(self.packet(b"P" * 16, 9, options=artbastard.SACN_OPTION_PREVIEW), 0)
+        self.receiver._handle_packet(self.packet(b"P" * 16, 9, universe=3), 1)
+        self.assertEqual(self.frames, [])
+
+
+class SacnLoopbackTest(unittest.TestCase):
+    """SacnSender to SacnReceiver over multicast loopback."""
+
+    def setUp(self):
+        probe = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+        probe.bind(("0.0.0.0", 0))
+        self.port = probe.getsockname()[1]
+        probe.close()
+        self.receiver = artbastard.SacnReceiver([1, 2, 3], port=self.port)
+        self.frames = []
+        self.receiver.add_dmx_listener(lambda universe, data, t_ns: self.frames.append((universe, bytes(data[:2]))))
+        try:
+            self.receiver.start()
+        except OSError as e:
+            self.skipTest(f"multicast unavailable: {e}")
+
+    def tearDown(self):
+        self.receiver.stop()
+
+    def wait_for(self, count, timeout=2.0):
+        deadline = time.monotonic() + timeout
+        while len(self.frames) < count and time.monotonic() < deadline:
+            time.sleep(0.01)
+
+    def test_frames_arrive_and_close_terminates_the_source(self):
+        sender = artbastard.SacnSender(port=self.port, cid=artbastard.sacn_cid("loopback-test"))
+        for level in range(3):
+            sender.send(0, bytes([level, 7]))
+        self.wait_for(3)
+        self.assertEqual(self.frames, [(0, b"\x00\x07"), (0, b"\x01\x07"), (0, b"\x02\x07")])
+        self.assertEqual(len(self.receiver.sources()), 1)
+        sender.close()
+        deadline = time.monotonic() + 2
+        while self.receiver.sources() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(self.receiver.sources(), [])
+
+    def test_synchronized_frames_are_held_until_the_sync_packet(self):
+        sender = artbastard.SacnSender(port=self.port, sync_universe=3, cid=artbastard.sacn_cid("sync-test"))
+        try:
+            sender.sync()  # Receivers only hold once they have seen the sync universe alive
+            time.sleep(0.1)
+            sender.send(0, b"\x05")
+            sender.send(1, b"\x06")
+            time.sleep(0.2)
+            self.assertEqual(self.frames, [])
+            sender.sync()
+            self.wait_for(2)
+            self.assertEqual(sorted(self.frames), [(0, b"\x05"), (1, b"\x06")])
+        finally:
+            sender.close()
+
+
+if __name__ == "__main__":
+    unittest.main()